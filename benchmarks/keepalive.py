@@ -0,0 +1,83 @@
+"""Benchmark: a fresh connection per lookup vs the checkers' kept-alive session.
+
+    python benchmarks/keepalive.py [--url URL] [--number N] [--handshake-ms MS]
+
+"before" is module-level requests.get, which the blocking checkers used to
+call once per name and which opens a new connection every time; "after" is
+BaseChecker.http, the pooled session they use now. With --url both fetch a
+real page, e.g. https://steamcommunity.com/id/gabelogannewell/?xml=1 - the
+gap there is DNS + TCP + TLS to that host. Without it they hit a local
+server that holds every new connection for --handshake-ms first, standing in
+for the handshake round trips to a far-away host. Prints latency per lookup.
+"""
+import argparse, os, statistics, sys, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from checker_core.base import BaseChecker
+
+
+def local_server(handshake):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"   # keep-alive, like the real hosts
+        disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+        def setup(self):
+            time.sleep(handshake)   # once per connection, not per request
+            super().setup()
+
+        def do_GET(self):
+            body = b"<profile><steamID>someone</steamID></profile>"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}/id/someone/?xml=1"
+
+
+def measure(get, url, number):
+    times = []
+    for _ in range(number):
+        started = time.perf_counter()
+        get(url, timeout=10).content
+        times.append(time.perf_counter() - started)
+    return times
+
+
+def row(label, times):
+    times = sorted(times)
+    p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+    return (f"{label:<24} mean {statistics.mean(times) * 1000:7.1f} ms   "
+            f"median {statistics.median(times) * 1000:7.1f} ms   p95 {p95 * 1000:7.1f} ms")
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--url", help="real page to fetch (default: a local server)")
+    p.add_argument("--number", type=int, default=50, help="lookups per variant (default: 50)")
+    p.add_argument("--handshake-ms", type=float, default=80.0,
+                   help="local server's delay per new connection (default: 80)")
+    args = p.parse_args()
+
+    url = args.url or local_server(args.handshake_ms / 1000)
+    session = BaseChecker().http
+    session.get(url, timeout=10)   # warm up DNS once for both, so the session's first connect isn't counted
+    before = measure(requests.get, url, args.number)
+    after = measure(session.get, url, args.number)
+
+    print(f"{args.number} lookups of {url}")
+    print(row("requests.get (before)", before))
+    print(row("BaseChecker.http (after)", after))
+    print(f"speed-up: {statistics.mean(before) / statistics.mean(after):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Benchmark: SteamChecker's XML profile mode vs its Web API mode, against a stand-in for Steam.
+
+    python benchmarks/steam_api.py [--number N] [--custom-share F]
+    python benchmarks/steam_api.py --serve [--port PORT]
+
+Runs a local server answering both steamcommunity.com's ?xml=1 profiles
+(padded to a realistic ~8 KB) and the two Web API calls the API mode uses,
+ResolveVanityURL and GetPlayerSummaries, with the same made-up accounts
+behind both. Then checks N IDs - a --custom-share of them custom IDs, the
+rest SteamID64s - once per mode with pacing switched off, and prints the
+requests, bytes and time each took and whether their verdicts agree.
+
+--serve only runs the stand-in, for trying the GUI or the CLI without a key:
+
+    python -m checker_core steam --steam-key test --steam-api-url http://127.0.0.1:PORT -i ids.txt
+"""
+import argparse, json, os, random, sys, threading, time, zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from checker_core.platforms import steam
+
+NOT_FOUND = b"<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?><response><error><![CDATA[The specified profile could not be found.]]></error></response>"
+PADDING = "".join(f"<group><groupID64>1035827{i:011d}</groupID64></group>" for i in range(120))  # groups, summary, links...
+
+
+def exists(name):
+    """The stand-in's accounts: about half of all IDs, the same ones in every mode."""
+    return zlib.crc32(name.lower().encode()) % 2 == 0
+
+
+def steam_id64(name):
+    return name if steam.SteamChecker.is_steam_id64(name) else str(76561197960265728 + zlib.crc32(name.encode()))
+
+
+def profile(name):
+    return (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><profile>'
+            f"<steamID64>{steam_id64(name)}</steamID64><steamID><![CDATA[{name}]]></steamID>"
+            f"<onlineState>offline</onlineState><groups>{PADDING}</groups></profile>").encode()
+
+
+def stand_in(port=0):
+    """Start the stand-in on a thread; returns (base URL, counters)."""
+    counters = {"requests": 0, "bytes": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            query = {k: v[0] for k, v in parse_qs(url.query).items()}
+            parts = url.path.strip("/").split("/")
+            if parts[0] in ("id", "profiles") and len(parts) > 1:
+                self.reply(profile(parts[1]) if exists(parts[1]) else NOT_FOUND, "text/xml")
+            elif url.path.startswith("/ISteamUser/") and not query.get("key"):
+                self.reply(b"<html><body>Forbidden</body></html>", "text/html", 403)
+            elif url.path.startswith("/ISteamUser/ResolveVanityURL/"):
+                name = query.get("vanityurl", "")
+                if exists(name):
+                    result = {"steamid": steam_id64(name), "success": 1}
+                else:
+                    result = {"success": 42, "message": "No match"}
+                self.reply(json.dumps({"response": result}).encode())
+            elif url.path.startswith("/ISteamUser/GetPlayerSummaries/"):
+                ids = query.get("steamids", "").split(",")[:100]
+                players = [{"steamid": i, "personaname": i[-6:], "personastate": 0} for i in ids if exists(i)]
+                self.reply(json.dumps({"response": {"players": players}}).encode())
+            else:
+                self.reply(b"Not Found", "text/plain", 404)
+
+        def reply(self, body, content_type="application/json", status=200):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            with lock:
+                counters["requests"] += 1
+                counters["bytes"] += len(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}", counters
+
+
+def run(ids, counters, **kwargs):
+    checker = steam.SteamChecker(ids, **kwargs)
+    checker.limiter.pace_sync = lambda: None   # measure the requests, not the politeness
+    verdicts = {}
+    checker.result.connect(lambda r: verdicts.__setitem__(r.username, r.status))
+    counters.update(requests=0, bytes=0)
+    started = time.perf_counter()
+    checker.run()
+    return verdicts, dict(counters), time.perf_counter() - started
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--number", type=int, default=1000, help="IDs to check per mode (default: 1000)")
+    p.add_argument("--custom-share", type=float, default=0.2, help="share of custom IDs among them (default: 0.2)")
+    p.add_argument("--serve", action="store_true", help="only run the stand-in until Ctrl+C")
+    p.add_argument("--port", type=int, default=0, help="port for --serve (default: any free one)")
+    args = p.parse_args()
+
+    base, counters = stand_in(args.port)
+    if args.serve:
+        print(f"Steam stand-in on {base} (Web API and ?xml=1 profiles; any key works)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            return
+
+    rng = random.Random(1)
+    ids = [f"user{rng.randrange(10 ** 6)}" if rng.random() < args.custom_share
+           else str(76561197960265728 + rng.randrange(10 ** 9)) for _ in range(args.number)]
+    steam.COMMUNITY_URL = base
+    xml, xml_cost, xml_time = run(ids, counters)
+    api, api_cost, api_time = run(ids, counters, api_key="test", api_url=base)
+
+    print(f"{len(ids)} IDs, {sum(not steam.SteamChecker.is_steam_id64(i) for i in ids)} of them custom")
+    for label, cost, took in (("?xml=1 profiles (before)", xml_cost, xml_time), ("Web API (after)", api_cost, api_time)):
+        print(f"{label:<25} {cost['requests']:>6} requests   {cost['bytes'] / 1024:9.1f} KB   {took:6.2f} s   "
+              f"{cost['requests'] / 5.0:6.1f} s at the starting 5 req/s")
+    print("verdicts agree" if xml == api else
+          f"verdicts differ for {sum(xml.get(i) != api.get(i) for i in ids)} IDs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Micro-benchmark: TikTok profile classifier vs the old per-regex scan.
+
+    python benchmarks/tiktok_classifier.py [--pages DIR] [--generated] [--number N]
+
+Runs both classifiers over saved profile pages, by default the fixtures in
+benchmarks/fixtures/tiktok: anonymized taken, private, available, banned and
+no-blob (old layout) pages in TikTok's markup. A page is <username>.html;
+an expected.json next to them gives each page's kind and verdict. Prints
+the verdicts side by side, flags any that differ from each other or from
+the expected one, and the time per page for each. --generated adds
+synthetic pages padded to ~400 KB.
+"""
+import argparse, json, os, re, sys, timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from checker_core.platforms.tiktok import classify_profile
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "tiktok")
+
+PADDING = "<script>" + "window.__x=" + json.dumps(["a" * 60] * 3000) + "</script>"  # bundles, CSS, i18n...
+
+
+def page(username, title, state=None, html=""):
+    blob = ""
+    if state is not None:
+        blob = f'<script id="__UNIVERSAL_DATA_FOR_REHYDRATION__" type="application/json">{json.dumps(state)}</script>'
+    return (f"<html><head><title>{title}</title>"
+            f'<meta property="og:url" content="https://www.tiktok.com/@{username}"></head>'
+            f"<body>{html}{PADDING}{blob}{PADDING}</body></html>")
+
+
+def user_detail(user, stats, status_code=0):
+    return {"__DEFAULT_SCOPE__": {"webapp.user-detail": {
+        "statusCode": status_code, "userInfo": {"user": user, "stats": stats}}}}
+
+
+def generated_pages():
+    public = {"id": "6812345678901234567", "uniqueId": "dancequeen", "nickname": "Dance", "verified": False,
+              "signature": "daily dance videos", "avatarLarger": "https://p16.tiktokcdn.com/a.jpeg",
+              "privateAccount": False}
+    stats = {"followerCount": 120000, "followingCount": 80, "heartCount": 900000, "videoCount": 412}
+    private = dict(public, uniqueId="quietone", signature="", privateAccount=True)
+    return [
+        ("dancequeen", "public", page("dancequeen", "Dance (@dancequeen) | TikTok", user_detail(public, stats))),
+        ("quietone", "private", page("quietone", "quiet (@quietone) | TikTok",
+                                     user_detail(private, dict(stats, videoCount=0)), "This account is private")),
+        ("zq9xk2", "not found", page("zq9xk2", "TikTok - Make Your Day", user_detail({}, {}, 10221),
+                                     "Couldn't find this account")),
+        ("oldlayout", "no blob", page("oldlayout", "old (@oldlayout) | TikTok", None,
+                                      '<strong data-e2e="followers-count">1.2M</strong>'
+                                      '<script>{"uniqueId":"oldlayout","id":"6812345678901234999",'
+                                      '"followingCount":3}</script>')),
+    ]
+
+
+def saved_pages(directory):
+    """(username, kind, body, expected verdict or None) for every <username>.html in `directory`."""
+    expected = {}
+    if os.path.exists(os.path.join(directory, "expected.json")):
+        with open(os.path.join(directory, "expected.json"), encoding="utf-8") as f:
+            expected = json.load(f)
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".html"):
+            with open(os.path.join(directory, name), encoding="utf-8", errors="ignore") as f:
+                info = expected.get(name[:-5], {})
+                yield name[:-5], info.get("kind", "saved"), f.read(), info.get("verdict")
+
+
+def legacy_classify(body, username):
+    """The verdict check_user used to reach with ~20 separate scans of the page."""
+    body_lower = body.lower()
+    found_not_found = any(s.lower() in body_lower for s in [
+        "couldn't find this account", "user not found", "page not found",
+        "this account cannot be found", '"statusCode":10202', '"statusCode":10221'])
+    signals = dict.fromkeys(('has_user_id', 'has_follower_count', 'has_following_count', 'has_video_count',
+                             'has_verified_badge', 'has_signature', 'has_avatar', 'has_username_in_data',
+                             'has_seo_data', 'has_private_account'), False)
+    for pattern in [r'"id"[:\s]*"(\d{10,})"', r'"userId"[:\s]*"(\d{10,})"', r'"uid"[:\s]*"(\d{10,})"',
+                    r'"uniqueId"[:\s]*"' + re.escape(username) + r'"[^}]*"id"[:\s]*"(\d{10,})"']:
+        if re.search(pattern, body, re.IGNORECASE):
+            signals['has_user_id'] = True
+            break
+    if re.search(rf'"uniqueId"[:\s]*"{username}"', body, re.IGNORECASE):
+        signals['has_username_in_data'] = True
+    for pattern in [r'"followerCount"[:\s]*(\d+)', r'"fans"[:\s]*(\d+)',
+                    r'<strong[^>]*data-e2e="followers-count"[^>]*>([0-9.KMB]+)</strong>']:
+        if re.search(pattern, body):
+            signals['has_follower_count'] = True
+            break
+    signals['has_following_count'] = any(re.search(p, body) for p in [r'"followingCount"[:\s]*(\d+)', r'"following"[:\s]*(\d+)'])
+    signals['has_video_count'] = any(re.search(p, body) for p in [r'"videoCount"[:\s]*(\d+)', r'"video"[:\s]*(\d+)'])
+    signals['has_verified_badge'] = '"verified":true' in body or 'verified-icon' in body
+    signals['has_signature'] = bool(re.search(r'"signature"[:\s]*"[^"]+"', body))
+    signals['has_avatar'] = any(re.search(p, body) for p in [r'"avatarLarger"[:\s]*"https://[^"]+"', r'"avatarThumb"[:\s]*"https://[^"]+"'])
+    if re.search(rf'<meta[^>]*property="og:url"[^>]*content="[^"]*@{username}[^"]*"', body, re.IGNORECASE):
+        signals['has_seo_data'] = True
+    title_match = re.search(r'<title>([^<]+)</title>', body, re.IGNORECASE)
+    title = title_match.group(1) if title_match else None
+    if title and username.lower() in title.lower() and title.lower() != 'tiktok':
+        signals['has_seo_data'] = True
+    if 'private account' in body_lower or '"privateaccount":true' in body_lower or re.search(r'this account is private', body, re.IGNORECASE):
+        if signals['has_user_id'] or signals['has_username_in_data'] or signals['has_follower_count']:
+            signals['has_private_account'] = True
+    n = sum(signals.values())
+    engagement = signals['has_follower_count'] + signals['has_following_count'] + signals['has_video_count']
+    if (signals['has_user_id'] and signals['has_username_in_data'] and signals['has_follower_count']) \
+            or (signals['has_private_account'] and (signals['has_user_id'] or signals['has_follower_count'])) \
+            or (signals['has_seo_data'] and n >= 2) or (signals['has_username_in_data'] and signals['has_user_id']) \
+            or n >= 4 or engagement >= 2:
+        return "TAKEN"
+    if found_not_found and (n == 0 or (n == 1 and signals['has_private_account'])):
+        return "AVAILABLE"
+    if found_not_found and n > 1:
+        return "TAKEN"
+    if title and (f'@{username}' in title.lower() or username in title.lower()) and 'tiktok' in title.lower() and n >= 1:
+        return "TAKEN"
+    if n <= 1 or (n <= 3 and not signals['has_username_in_data']):
+        return "AVAILABLE"
+    return "UNCLEAR"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", default=FIXTURES, help="directory of saved profile pages named <username>.html "
+                        "(default: benchmarks/fixtures/tiktok)")
+    parser.add_argument("--generated", action="store_true", help="also run the synthetic ~400 KB pages")
+    parser.add_argument("--number", type=int, default=20, help="runs per page (default 20)")
+    args = parser.parse_args()
+
+    pages = list(saved_pages(args.pages))
+    if args.generated:
+        pages += [(username, kind, body, None) for username, kind, body in generated_pages()]
+
+    print(f"{'page':<24}{'KB':>6}  {'old':<10}{'new':<10}{'old ms':>8}{'new ms':>8}{'x':>6}")
+    total_old = total_new = 0.0
+    for username, kind, body, expected in pages:
+        old = legacy_classify(body, username)
+        new = classify_profile(body, username)[0]
+        t_old = timeit.timeit(lambda: legacy_classify(body, username), number=args.number) / args.number * 1000
+        t_new = timeit.timeit(lambda: classify_profile(body, username), number=args.number) / args.number * 1000
+        total_old += t_old
+        total_new += t_new
+        flag = "" if old == new else "  <- differs"
+        if expected and new != expected:
+            flag += f"  <- expected {expected}"
+        print(f"{username + ' (' + kind + ')':<24}{len(body) // 1024:>6}  {old:<10}{new:<10}"
+              f"{t_old:>8.2f}{t_new:>8.2f}{t_old / t_new:>6.1f}{flag}")
+    print(f"{'total':<50}{total_old:>8.2f}{total_new:>8.2f}{total_old / total_new:>6.1f}")
+
+
+if __name__ == "__main__":
+    main()
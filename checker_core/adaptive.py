@@ -0,0 +1,156 @@
+import asyncio, email.utils, threading, time
+
+from checker_core.pacing import TokenBucket
+
+
+def retry_after(headers, default=None):
+    """Seconds asked for by a Retry-After header (delta-seconds or HTTP date), else `default`."""
+    value = headers.get("Retry-After") if headers is not None else None
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
+
+
+class AdaptiveLimiter:
+    """Additive-increase / multiplicative-decrease on request rate and concurrency.
+
+    Until the first 429 every clean response (success()) grows the rate by
+    `slow_start` (5%), like TCP slow start; after that by about `step` req/s
+    per second of traffic. The concurrency window grows by about one slot per
+    window of successes. A 429 or block (backoff()) cuts both by `decrease` and pauses
+    every worker - for Retry-After when the server sends one, otherwise for a
+    pause that doubles with each strike in a row. Throughput settles just under
+    what the platform tolerates. Safe to share between threads and coroutines.
+    """
+
+    def __init__(self, rate, concurrency=1, max_rate=None, max_concurrency=None, min_rate=0.05,
+                 step=None, slow_start=0.05, decrease=0.5, pause=1.0, max_pause=60.0):
+        self.rate = max(min_rate, float(rate))
+        self.min_rate = min_rate
+        self.max_rate = max(self.rate, max_rate or self.rate * 4)
+        self.max_concurrency = max(1, int(max_concurrency or concurrency * 4))
+        self.step = step or self.rate / 10
+        self.slow_start = slow_start
+        self.decrease = decrease
+        self.pause = pause
+        self.max_pause = max_pause
+        self.bucket = TokenBucket(self.rate)
+        self._window = float(min(max(1, concurrency), self.max_concurrency))
+        self._inflight = 0
+        self._strikes = 0
+        self._backed_off = False
+        self._resume_at = 0.0
+        self._calm_until = 0.0
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._waiters = []  # (loop, future) for coroutines waiting on a slot
+
+    @property
+    def concurrency(self):
+        return int(self._window)
+
+    def describe(self):
+        return f"{self.rate:.2f} req/s, {self.concurrency} in flight"
+
+    # ---- concurrency slots ----
+
+    def _take_slot(self):
+        if self._inflight < int(self._window):
+            self._inflight += 1
+            return True
+        return False
+
+    def _wake(self):
+        self._cond.notify_all()
+        for loop, fut in self._waiters:
+            loop.call_soon_threadsafe(self._set, fut)
+        self._waiters.clear()
+
+    @staticmethod
+    def _set(fut):
+        if not fut.done():
+            fut.set_result(None)
+
+    async def acquire(self):
+        """Wait for a concurrency slot; pair with release()."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._take_slot():
+                    return
+                fut = loop.create_future()
+                self._waiters.append((loop, fut))
+            await fut
+
+    def acquire_sync(self):
+        with self._cond:
+            while not self._take_slot():
+                self._cond.wait()
+
+    def release(self):
+        with self._lock:
+            self._inflight -= 1
+            self._wake()
+
+    # ---- request pacing ----
+
+    def reserve(self):
+        """Book the next request start; returns how long to wait for it."""
+        return self.bucket.reserve(not_before=self._resume_at)
+
+    async def pace(self):
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pace_sync(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def hold(self, seconds):
+        """Pause every worker for `seconds` from now without touching the rate."""
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + max(0.0, seconds))
+
+    # ---- feedback ----
+
+    def success(self):
+        with self._lock:
+            self._strikes = 0
+            if self._backed_off:
+                self.rate = min(self.max_rate, self.rate + self.step / self.rate)
+            else:
+                self.rate = min(self.max_rate, self.rate * (1 + self.slow_start))
+            grown = int(self._window + 1 / self._window) > int(self._window)
+            self._window = min(float(self.max_concurrency), self._window + 1 / self._window)
+            if grown:
+                self._wake()
+            rate = self.rate
+        self.bucket.set_rate(rate)
+
+    def backoff(self, retry_after=None):
+        """Record a 429/block; returns how long every worker is now paused for."""
+        now = time.monotonic()
+        with self._lock:
+            # Answers to requests already in flight don't count as new strikes
+            if now >= self._calm_until:
+                self._backed_off = True
+                self._strikes += 1
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self._window = max(1.0, self._window * self.decrease)
+            if retry_after is None:
+                retry_after = min(self.max_pause, self.pause * 2 ** max(0, self._strikes - 1))
+            self._resume_at = max(self._resume_at, now + retry_after)
+            self._calm_until = max(self._calm_until, self._resume_at + 1 / self.rate)
+            rate = self.rate
+            paused = self._resume_at - now
+        self.bucket.set_rate(rate)
+        return paused
@@ -0,0 +1,145 @@
+import threading
+from contextlib import contextmanager
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from checker_core import hits, webhooks
+from checker_core.proxies import ProxyAdapter
+from checker_core.results import CheckResult
+
+_http_lock = threading.Lock()
+
+
+class Signal:
+    """Minimal stand-in for pyqtSignal so checkers can run without Qt."""
+
+    def __init__(self):
+        self._slots = []
+
+    def connect(self, slot):
+        self._slots.append(slot)
+
+    def emit(self, *args):
+        for slot in self._slots:
+            slot(*args)
+
+
+class BaseChecker:
+    """GUI-free checker. Subclasses implement run() and call report() per verdict.
+
+    update(str) carries progress and debug lines, pupdate(int) the number
+    of names done and result(CheckResult) one record per finished username -
+    the verdict's log line travels inside it. With a ResultCache in
+    `cache`, every verdict is remembered and fresh() skips names that already
+    have one. With a ProxyPool in `proxy_pool`, requests made through `http`
+    or inside proxied() go out through its proxies. A checker with a bulk
+    lookup sets `chunk_size`, and the multi-platform engine then hands its
+    check_many() that many names at a time instead of calling check_one().
+    """
+    platform = ""
+    cache = None
+    webhook_url = None
+    debug = False
+    proxy_pool = None
+    POOL_SIZE = 16   # keep-alive connections `http` holds open per host
+    chunk_size = 0   # names per check_many() call; 0 means one at a time
+    _http = None
+
+    def __init__(self):
+        self.update = Signal()
+        self.pupdate = Signal()
+        self.result = Signal()
+        self.running = True
+        self.count = 0
+
+    def run(self):
+        raise NotImplementedError
+
+    def stop(self):
+        self.running = False
+
+    def report(self, username, status, text=None, http_status=None, latency=None, attempts=1):
+        """Emit the verdict for `username` as a CheckResult and remember it in the cache."""
+        record = CheckResult(self.platform, username, status, text or "", http_status, latency, attempts)
+        self.result.emit(record)
+        if self.cache is not None:
+            self.cache.put(self.platform, username, record.status.value, record.text)
+
+    @property
+    def http(self):
+        """This checker's requests.Session, routed through proxy_pool when there is one.
+
+        Connections are kept alive and reused, so only the first lookup on a
+        host pays for DNS, TCP and TLS. The pool holds enough connections for
+        every worker the limiter may run at once (the engine runs blocking
+        checkers on threads).
+        """
+        with _http_lock:
+            if self._http is None:
+                limiter = getattr(self, "limiter", None)
+                size = max(self.POOL_SIZE, limiter.max_concurrency if limiter else 1)
+                session = requests.Session()
+                if self.proxy_pool:
+                    adapter = ProxyAdapter(self.proxy_pool, pool_connections=4, pool_maxsize=size)
+                else:
+                    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._http = session
+            return self._http
+
+    @contextmanager
+    def proxied(self, key=None):
+        """Pick a proxy from proxy_pool for one aiohttp request and score it; yields None without a pool."""
+        if not self.proxy_pool:
+            yield None
+            return
+        with self.proxy_pool.track(self.proxy_pool.pick(key)) as proxy:
+            yield proxy
+
+    def post_webhook(self, username, embed):
+        """Queue a hit's embed for the Discord webhook; the post happens on the sender's thread."""
+        if not self.webhook_url:
+            return
+
+        def done(error):
+            if self.debug:
+                self.update.emit(f"[DEBUG] ⚠️ Webhook failed for {username}: {error}" if error
+                                 else f"[DEBUG] ✅ Sent {username} to Discord webhook")
+
+        webhooks.sender(self.webhook_url).send(embed, done)
+
+    def save_hit(self, path, record):
+        """Append a hit (a line of text or a dict) to `path` through its shared HitWriter."""
+        try:
+            hits.writer(path).write(record)
+        except OSError as e:
+            if self.debug:
+                self.update.emit(f"[DEBUG] Failed to save to file: {e}")
+
+    def replay_cached(self, username):
+        """Re-emit a cached verdict for `username`; False if there is none to replay."""
+        hit = self.cache.get(self.platform, username) if self.cache is not None else None
+        if hit is None:
+            return False
+        self.result.emit(CheckResult(self.platform, username, hit["status"], f"{hit['detail']} (cached)",
+                                     checked_at=hit["checked_at"], cached=True))
+        return True
+
+    def fresh(self, usernames):
+        """Yield only the names that still need a request, replaying the rest from the cache."""
+        if hasattr(usernames, "done"):   # a keyspace Sweep wants to know what has been finished
+            self.result.connect(usernames.done)
+        for username in usernames:
+            if self.replay_cached(username):
+                self.count += 1
+                self.pupdate.emit(self.count)
+            else:
+                yield username
+
+    @staticmethod
+    def clean_username(line):
+        """Normalise one input line; return None to skip it."""
+        u = line.strip()
+        return u or None
@@ -0,0 +1,112 @@
+import asyncio, threading, time
+
+
+class _Bucket:
+    __slots__ = ("limit", "remaining", "opens_at", "reset_at", "window")
+
+    def __init__(self, limit, remaining, reset_at, window):
+        self.limit = limit
+        self.remaining = remaining
+        self.opens_at = 0.0          # start of the window `remaining` belongs to
+        self.reset_at = reset_at
+        self.window = window
+
+
+class RateLimitBuckets:
+    """Predictive model of Discord-style rate-limit buckets.
+
+    Discord sends X-RateLimit-Bucket, -Limit, -Remaining and -Reset-After on
+    every response. update() records them per route, and reserve() hands
+    out the remaining budget so the next request is scheduled exactly when
+    the bucket has room instead of waiting for a 429. Safe to share between
+    threads (webhook sender) and coroutines (checkers).
+    """
+
+    def __init__(self):
+        self._routes = {}    # route -> bucket id
+        self._buckets = {}   # bucket id -> _Bucket
+        self._global_until = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _float(headers, name, default=None):
+        try:
+            return float(headers.get(name))
+        except (TypeError, ValueError):
+            return default
+
+    def update(self, route, headers, retry_after=None):
+        """Record the bucket state from a response's headers (call for every status)."""
+        now = time.monotonic()
+        limit = self._float(headers, "X-RateLimit-Limit")
+        remaining = self._float(headers, "X-RateLimit-Remaining")
+        reset_after = self._float(headers, "X-RateLimit-Reset-After")
+        if retry_after is None:
+            retry_after = self._float(headers, "Retry-After")
+
+        with self._lock:
+            bucket_id = headers.get("X-RateLimit-Bucket") or self._routes.get(route) or route
+            if retry_after is not None and str(headers.get("X-RateLimit-Global", "")).lower() == "true":
+                self._global_until = max(self._global_until, now + retry_after)
+            self._routes[route] = bucket_id
+            bucket = self._buckets.get(bucket_id)
+            if remaining is None and retry_after is None:
+                return
+            if bucket is None:
+                bucket = _Bucket(int(limit or 1), 0, now, reset_after or 1.0)
+                self._buckets[bucket_id] = bucket
+            if limit is not None:
+                bucket.limit = int(limit)
+            if remaining is not None:
+                bucket.remaining = int(remaining)
+                bucket.opens_at = now
+            if reset_after is not None:
+                bucket.reset_at = now + reset_after
+                bucket.window = max(bucket.window, reset_after)
+            if retry_after is not None:
+                bucket.remaining = 0
+                bucket.reset_at = max(bucket.reset_at, now + retry_after)
+
+    def reserve(self, route):
+        """Claim one request on `route`; returns how long to wait before sending it."""
+        now = time.monotonic()
+        with self._lock:
+            wait = max(0.0, self._global_until - now)
+            bucket = self._buckets.get(self._routes.get(route))
+            if bucket is None:
+                return wait  # nothing known yet - the first response will tell us
+            if now >= bucket.reset_at:
+                bucket.remaining = bucket.limit
+                bucket.opens_at = now
+                bucket.reset_at = now + bucket.window
+            if bucket.remaining <= 0:
+                # Budget exhausted: move on to the next window
+                bucket.opens_at = bucket.reset_at
+                bucket.reset_at += bucket.window
+                bucket.remaining = bucket.limit
+            bucket.remaining -= 1
+            return max(wait, bucket.opens_at - now)
+
+    def delay(self, route):
+        """Seconds until `route` has budget, without reserving anything."""
+        now = time.monotonic()
+        with self._lock:
+            wait = max(0.0, self._global_until - now)
+            bucket = self._buckets.get(self._routes.get(route))
+            if bucket is None or now >= bucket.reset_at:
+                return wait
+            if bucket.remaining > 0:
+                return max(wait, bucket.opens_at - now)
+            return max(wait, bucket.reset_at - now)
+
+    async def acquire(self, route):
+        wait = self.reserve(route)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def acquire_sync(self, route):
+        wait = self.reserve(route)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
@@ -0,0 +1,115 @@
+import sqlite3, threading, time
+
+DEFAULT_PATH = "checked_usernames.db"
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# How long a verdict stays good, by status. 0 means never cache it.
+DEFAULT_TTLS = {
+    "TAKEN": 7 * DAY,
+    "BANNED": 7 * DAY,
+    "PRIVATE": 7 * DAY,
+    "AVAILABLE": DAY,      # short: someone else may claim it
+    "UNCLEAR": DAY,
+    "ERROR": 0,            # timeouts, expired sessions...: worth asking again straight away
+    "RATE_LIMITED": 0,
+    "BLOCKED": 0,
+}
+
+# Per-platform overrides on top of DEFAULT_TTLS
+PLATFORM_TTLS = {
+    "minecraft": {"TAKEN": 30 * DAY},   # names are only released 37 days after a change
+    "discord": {"AVAILABLE": 6 * HOUR},
+    "tiktok": {"UNCLEAR": 6 * HOUR},
+    "instagram": {"UNCLEAR": 6 * HOUR},
+}
+
+
+def normalize(username):
+    """Cache key for a name: every supported platform treats names case-insensitively."""
+    return username.strip().lstrip("@").lower()
+
+
+class ResultCache:
+    """Verdicts from earlier runs in a small SQLite file, keyed by (platform, name).
+
+    get() returns a still-fresh verdict or None; put() stores one for as long as
+    its platform/status TTL says. The same file keeps name generators' cursors
+    (see keyspace.py). Safe to share between threads and checkers.
+    Writes are committed in batches, close() flushes the rest.
+    """
+
+    COMMIT_EVERY = 200      # writes
+    COMMIT_AFTER = 2.0      # seconds
+
+    def __init__(self, path=DEFAULT_PATH, ttls=None):
+        self.path = path
+        self.ttls = {p: dict(t) for p, t in PLATFORM_TTLS.items()}
+        for platform, overrides in (ttls or {}).items():
+            self.ttls.setdefault(platform, {}).update(overrides)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " platform TEXT NOT NULL, username TEXT NOT NULL, status TEXT NOT NULL, detail TEXT,"
+            " checked_at REAL NOT NULL, expires_at REAL NOT NULL,"
+            " PRIMARY KEY (platform, username)) WITHOUT ROWID")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cursors ("
+            " key TEXT PRIMARY KEY, seed INTEGER NOT NULL, position INTEGER NOT NULL, updated_at REAL NOT NULL)")
+        self._db.execute("DELETE FROM results WHERE expires_at <= ?", (time.time(),))
+        self._db.commit()
+        self._pending = 0
+        self._last_commit = time.monotonic()
+
+    def ttl(self, platform, status):
+        return self.ttls.get(platform, {}).get(status, DEFAULT_TTLS.get(status, 0))
+
+    def get(self, platform, username):
+        """The cached record for a name, or None if it was never checked or has expired."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status, detail, checked_at FROM results WHERE platform = ? AND username = ? AND expires_at > ?",
+                (platform, normalize(username), time.time())).fetchone()
+        if row is None or self.ttl(platform, row[0]) <= 0:   # rows written before that status stopped being cached
+            return None
+        return {"platform": platform, "username": username, "status": row[0], "detail": row[1], "checked_at": row[2]}
+
+    def put(self, platform, username, status, detail=None):
+        ttl = self.ttl(platform, status)
+        if ttl <= 0:
+            return
+        now = time.time()
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                             (platform, normalize(username), status, detail, now, now + ttl))
+            self._pending += 1
+            if self._pending >= self.COMMIT_EVERY or time.monotonic() - self._last_commit >= self.COMMIT_AFTER:
+                self._commit()
+
+    def cursor(self, key):
+        """(seed, position) saved for a name generator, or None."""
+        with self._lock:
+            row = self._db.execute("SELECT seed, position FROM cursors WHERE key = ?", (key,)).fetchone()
+        return tuple(row) if row else None
+
+    def save_cursor(self, key, seed, position):
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO cursors VALUES (?, ?, ?, ?)", (key, seed, position, time.time()))
+            self._commit()
+
+    def _commit(self):
+        self._db.commit()
+        self._pending = 0
+        self._last_commit = time.monotonic()
+
+    def flush(self):
+        with self._lock:
+            self._commit()
+
+    def close(self):
+        with self._lock:
+            self._commit()
+            self._db.close()
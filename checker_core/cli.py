@@ -0,0 +1,203 @@
+"""Headless entry point: run any checker without PyQt5 and get JSON lines back.
+
+    python -m checker_core tiktok -i names.txt -o results.jsonl
+    cat names.txt | python -m checker_core minecraft --only-available
+    python -m checker_core tiktok,instagram,github -i names.txt --sessionid ...
+    python -m checker_core minecraft --sweep "Letters only" --length 3
+
+Several comma-separated platforms run side by side on one event loop (see engine.py).
+"""
+import argparse
+import importlib
+import json
+import sys
+import threading
+
+from checker_core.cache import DEFAULT_PATH, ResultCache
+from checker_core.engine import Engine
+from checker_core.keyspace import Sweep
+from checker_core.proxies import ProxyPool, parse_proxies
+from checker_core.results import Status
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+
+def _lines(path):
+    if not path:
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return [l.strip() for l in f if l.strip()]
+
+
+# name -> (module, class, builder returning the constructor kwargs)
+PLATFORMS = {
+    "tiktok": ("tiktok", "TikTokChecker", lambda a: dict(
+        user_agent=a.user_agent, debug=a.debug, webhook_url=a.webhook,
+        concurrency=a.workers or 2, interval=2.5 if a.delay is None else a.delay)),
+    "instagram": ("instagram", "InstagramChecker", lambda a: dict(
+        sessionid=a.sessionid, user_agent=a.user_agent, debug=a.debug,
+        concurrency=a.workers or 2, interval=2.0 if a.delay is None else a.delay)),
+    "discord": ("discord", "DiscordChecker", lambda a: dict(
+        tokens=_lines(a.tokens), proxies=a.proxy_pool, debug=a.debug)),
+    "minecraft": ("minecraft", "MinecraftChecker", lambda a: dict(
+        webhook_url=a.webhook, debug=a.debug, save_to_file=a.save, bulk=not a.no_batch,
+        concurrency=a.workers or 5, rate=a.rate or 5.0)),
+    "reddit": ("reddit", "RedditChecker", lambda a: dict(
+        webhook_url=a.webhook, debug=a.debug, save_to_file=a.save,
+        concurrency=a.workers or 5, rate=a.rate or 5.0)),
+    "psn": ("psn", "PSNChecker", lambda a: dict(
+        method="psnawp" if a.npsso else "direct", npsso=a.npsso, webhook_url=a.webhook, debug=a.debug)),
+    "steam": ("steam", "SteamChecker", lambda a: dict(
+        webhook_url=a.webhook, debug=a.debug, api_key=a.steam_key, api_url=a.steam_api_url)),
+    "roblox": ("roblox", "RobloxChecker", lambda a: dict(
+        webhook_url=a.webhook, debug=a.debug, batch=not a.no_batch)),
+    "github": ("github", "GitHubChecker", lambda a: dict(
+        webhook_url=a.webhook, debug=a.debug, save_to_file=a.save)),
+    "chess": ("chess", "ChessChecker", lambda a: dict(
+        webhook_url=a.webhook, debug=a.debug, save_to_file=a.save, platform="Chess.com")),
+    "lichess": ("chess", "ChessChecker", lambda a: dict(
+        webhook_url=a.webhook, debug=a.debug, save_to_file=a.save, platform="Lichess.org",
+        batch=not a.no_batch)),
+    "geometry_dash": ("geometry_dash", "GeometryDashChecker", lambda a: dict(
+        webhook_url=a.webhook, debug=a.debug)),
+}
+
+
+def load_checker(platform):
+    """Import a platform's checker class only when it is asked for."""
+    module, cls, _ = PLATFORMS[platform]
+    return getattr(importlib.import_module(f"checker_core.platforms.{module}"), cls)
+
+
+def build_checker(platform, usernames, args):
+    checker = load_checker(platform)(usernames, **PLATFORMS[platform][2](args))
+    if args.proxy_pool:
+        checker.proxy_pool = args.proxy_pool   # one pool, so every platform learns which proxies are bad
+    return checker
+
+
+def read_usernames(stream, clean):
+    for line in stream:
+        u = clean(line)
+        if u:
+            yield u
+
+
+def read_jobs(stream, platforms):
+    """(platform, username) pairs: every name on every platform that accepts it."""
+    cleaners = [(p, load_checker(p).clean_username) for p in platforms]
+    for line in stream:
+        for platform, clean in cleaners:
+            u = clean(line)
+            if u:
+                yield platform, u
+
+
+def platform_list(value):
+    names = [v.strip() for v in value.split(",") if v.strip()]
+    unknown = [n for n in names if n not in PLATFORMS]
+    if not names or unknown:
+        raise argparse.ArgumentTypeError(f"unknown platform(s): {', '.join(unknown) or value}. Choose from {', '.join(sorted(PLATFORMS))}")
+    return list(dict.fromkeys(names))
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(prog="python -m checker_core", description="Check usernames without the GUI. Results are written as JSON lines.")
+    p.add_argument("platforms", type=platform_list, metavar="PLATFORM[,PLATFORM...]",
+                   help=f"one or more of: {', '.join(sorted(PLATFORMS))}")
+    p.add_argument("-i", "--input", default="-", help="file with one username per line (default: stdin)")
+    p.add_argument("-o", "--output", default="-", help="where to write JSON lines (default: stdout)")
+    p.add_argument("--only-available", action="store_true", help="only write AVAILABLE results")
+    p.add_argument("-q", "--quiet", action="store_true", help="don't print log lines to stderr")
+    p.add_argument("--debug", action="store_true")
+    p.add_argument("--webhook", help="Discord webhook URL for hits")
+    p.add_argument("--save", action="store_true", help="also append hits to the checker's available_*.txt file")
+    p.add_argument("--workers", type=int, help="starting requests in flight; adapts up to 4x (tiktok, instagram, minecraft, reddit)")
+    p.add_argument("--delay", type=float, help="starting seconds between request starts (tiktok, instagram)")
+    p.add_argument("--rate", type=float, help="starting requests per second (minecraft, reddit)")
+    p.add_argument("--user-agent", default=USER_AGENT)
+    p.add_argument("--sessionid", help="Instagram sessionid cookie")
+    p.add_argument("--tokens", help="file with Discord tokens, one per line")
+    p.add_argument("--proxies", help="file with proxies, one per line; every checker shares them")
+    p.add_argument("--npsso", help="PSN npsso token; switches PSN to the PSNAWP method")
+    p.add_argument("--steam-key", help="Steam Web API key; switches Steam to ResolveVanityURL and batched GetPlayerSummaries")
+    p.add_argument("--steam-api-url", default="https://api.steampowered.com",
+                   help="Steam Web API base URL, e.g. the stand-in from benchmarks/steam_api.py")
+    p.add_argument("--no-batch", action="store_true", help="one request per name instead of bulk lookups (roblox, minecraft, lichess)")
+    p.add_argument("--cache", default=DEFAULT_PATH, help=f"SQLite file remembering verdicts between runs (default: {DEFAULT_PATH})")
+    p.add_argument("--no-cache", action="store_true", help="check every name again and don't remember the results")
+    p.add_argument("--sweep", metavar="PATTERN", help="check every name a generator pattern can make instead of reading input, "
+                   "e.g. \"Letters only\"; resumes where the last sweep stopped (needs the cache)")
+    p.add_argument("--length", type=int, default=3, help="name length for --sweep (default: 3)")
+    p.add_argument("--prefix", default="", help="literal prefix for --sweep")
+    p.add_argument("--suffix", default="", help="literal suffix for --sweep")
+    p.add_argument("--order", choices=("lexicographic", "shuffled"), default="lexicographic", help="--sweep order")
+    args = p.parse_args(argv)
+    if "instagram" in args.platforms and not args.sessionid:
+        p.error("instagram needs --sessionid")
+    args.proxy_pool = ProxyPool(parse_proxies(_lines(args.proxies))) if args.proxies else None
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    out = sys.stdout if args.output == "-" else open(args.output, "a", encoding="utf-8")
+    out_lock = threading.Lock()
+
+    cache = None if args.no_cache else ResultCache(args.cache)
+    sweep = None
+    if args.sweep:
+        platforms = {p: load_checker(p).clean_username for p in args.platforms} if len(args.platforms) > 1 else None
+        sweep = Sweep(",".join(args.platforms), args.sweep, args.length, args.prefix, args.suffix, cache,
+                      shuffled=args.order == "shuffled", platforms=platforms)
+        src = sweep
+        if not args.quiet:
+            print(f"Sweeping {sweep.keyspace.size} names ({args.order}), starting at #{sweep.start}", file=sys.stderr, flush=True)
+    else:
+        src = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+
+    if len(args.platforms) == 1:
+        platform = args.platforms[0]
+        checker = build_checker(platform, read_usernames(src, load_checker(platform).clean_username), args)
+        checker.cache = cache
+    else:
+        checkers = {p: build_checker(p, [], args) for p in args.platforms}
+        for c in checkers.values():
+            c.cache = cache
+        checker = Engine(read_jobs(src, args.platforms), checkers)
+    if sweep is not None:
+        checker.result.connect(sweep.done)   # the sweep is read through read_usernames/read_jobs
+
+    def on_result(record):
+        if not args.quiet:
+            print(record.text, file=sys.stderr, flush=True)
+        if args.only_available and record.status != Status.AVAILABLE:
+            return
+        with out_lock:
+            out.write(json.dumps(record.to_dict(), ensure_ascii=False) + "\n")
+            out.flush()
+
+    checker.result.connect(on_result)
+    if not args.quiet:
+        checker.update.connect(lambda text: print(text, file=sys.stderr, flush=True))
+
+    # Run on a worker thread so Ctrl+C can ask the checker to stop cleanly
+    t = threading.Thread(target=checker.run, daemon=True)
+    t.start()
+    try:
+        while t.is_alive():
+            t.join(0.5)
+    except KeyboardInterrupt:
+        print("Stopping...", file=sys.stderr, flush=True)
+        checker.stop()
+        t.join(5)
+    finally:
+        if sweep is not None:
+            sweep.save()
+        if cache is not None:
+            cache.close()
+        if sweep is None and src is not sys.stdin:
+            src.close()
+        if out is not sys.stdout:
+            out.close()
+    return 0
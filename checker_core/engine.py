@@ -0,0 +1,169 @@
+import asyncio
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+from checker_core.base import BaseChecker
+from checker_core.pacing import Pacer
+from checker_core.pipeline import run_pool
+
+class Engine(BaseChecker):
+    """Runs (platform, username) jobs for several checkers on one asyncio loop.
+
+    Every platform gets its own worker pool, gated by the checker's own
+    AdaptiveLimiter (or a Pacer when `budgets` pins it), so a slow or
+    rate-limited platform never holds the others up. aiohttp checkers share
+    the loop directly, blocking ones run on a thread pool sized to their
+    combined concurrency. Jobs are read only while some platform is short
+    of work; a slower platform's share waits in its own queue, so it never
+    sets the pace for the rest, and reading only stops for it once that
+    queue holds MAX_BACKLOG names. Names a checker's cache already has a
+    fresh verdict for are replayed instead of queued. A checker with a
+    `chunk_size` (a bulk lookup mode) gets its names in chunks through
+    check_many(), waiting at most LINGER seconds for a chunk to fill.
+    """
+    platform = "multi"
+
+    MAX_BACKLOG = 100_000
+    LINGER = 0.5
+
+    def __init__(self, jobs, checkers, budgets=None):
+        super().__init__()
+        self.jobs = jobs
+        self.checkers = checkers      # platform -> checker instance
+        self.budgets = budgets or {}
+        self.loop = None
+        self.wake = None              # set whenever a platform takes a name, or on stop()
+        for checker in checkers.values():
+            checker.update.connect(self.update.emit)
+            checker.result.connect(self.result.emit)
+
+    def budget(self, platform):
+        checker = self.checkers[platform]
+        if platform in self.budgets:
+            return self.budgets[platform]
+        if platform == "discord":
+            return len(checker.lanes), 0.0   # the token lanes' own buckets do the pacing
+        if getattr(checker, "limiter", None):
+            return checker.limiter.max_concurrency, 0.0   # the limiter paces and shrinks the pool itself
+        return getattr(checker, "concurrency", 1), 0.0
+
+    def run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self.main())
+        finally:
+            loop.close()
+
+    def stop(self):
+        self.running = False
+        for checker in self.checkers.values():
+            checker.stop()
+        if self.loop is not None and self.wake is not None:
+            try:
+                self.loop.call_soon_threadsafe(self.wake.set)   # stop() is called from another thread
+            except RuntimeError:
+                pass   # the loop has already finished
+
+    async def main(self):
+        budgets = {p: self.budget(p) for p in self.checkers}
+        blocking = [p for p, c in self.checkers.items() if not hasattr(c, "open_session")]
+        workers = sum(budgets[p][0] for p in blocking)
+        executor = ThreadPoolExecutor(max_workers=max(1, workers))
+        loop = asyncio.get_running_loop()
+        queues = {p: asyncio.Queue() for p in self.checkers}
+        chunk_sizes = {p: c.chunk_size for p, c in self.checkers.items()}
+        wanted = {p: max(budgets[p][0] * 4, chunk_sizes[p] * 2) for p in self.checkers}
+        self.loop, self.wake = loop, asyncio.Event()
+
+        def saturated():
+            return (all(queues[p].qsize() >= wanted[p] for p in queues)
+                    or max(q.qsize() for q in queues.values()) >= self.MAX_BACKLOG)
+
+        async def dispatch():
+            """Read jobs only while some platform wants more, so huge inputs never sit in memory."""
+            try:
+                for platform, username in self.jobs:
+                    if not self.running:
+                        break
+                    if self.checkers[platform].replay_cached(username):
+                        self.count += 1
+                        self.pupdate.emit(self.count)
+                        continue
+                    queues[platform].put_nowait(username)
+                    while self.running and saturated():
+                        self.wake.clear()
+                        await self.wake.wait()
+            finally:
+                for queue in queues.values():
+                    if not self.running:
+                        while not queue.empty():
+                            queue.get_nowait()
+                    queue.put_nowait(None)
+
+        async def drain(queue):
+            while True:
+                username = await queue.get()
+                self.wake.set()
+                if username is None:
+                    return
+                yield username
+
+        async def drain_chunks(queue, size):
+            while True:
+                username = await queue.get()
+                self.wake.set()
+                if username is None:
+                    return
+                chunk = [username]
+                deadline = loop.time() + self.LINGER
+                while len(chunk) < size:
+                    try:
+                        username = await asyncio.wait_for(queue.get(), max(0.0, deadline - loop.time()))
+                    except asyncio.TimeoutError:
+                        break
+                    self.wake.set()
+                    if username is None:
+                        yield chunk
+                        return
+                    chunk.append(username)
+                yield chunk
+
+        async with contextlib.AsyncExitStack() as stack:
+            pools = []
+            for platform, checker in self.checkers.items():
+                concurrency, interval = budgets[platform]
+                pacer = Pacer(interval) if interval else None
+                limiter = None if platform in self.budgets else getattr(checker, "limiter", None)
+                session = None
+                if platform not in blocking:
+                    session = await stack.enter_async_context(checker.open_session())
+                worker = self.worker(checker, session, loop, executor)
+                size = chunk_sizes[platform]
+                items = drain_chunks(queues[platform], size) if size else drain(queues[platform])
+                pools.append(run_pool(items, worker, concurrency, pacer, lambda: self.running,
+                                      on_error=self.on_error(checker), limiter=limiter))
+            try:
+                await asyncio.gather(dispatch(), *pools)
+            finally:
+                executor.shutdown(wait=False)
+
+    def worker(self, checker, session, loop, executor):
+        async def run_one(idx, item):
+            check = checker.check_many if isinstance(item, list) else checker.check_one
+            try:
+                if session is None:
+                    await loop.run_in_executor(executor, check, item)
+                else:
+                    await check(item, session)
+            finally:
+                self.count += len(item) if isinstance(item, list) else 1
+                self.pupdate.emit(self.count)
+        return run_one
+
+    @staticmethod
+    def on_error(checker):
+        def report(item, e):
+            for u in item if isinstance(item, list) else [item]:
+                checker.report(u, "ERROR", f"⚠️ [ERROR] {u}: {str(e)[:80]}")
+        return report
@@ -0,0 +1,109 @@
+import atexit, json, os, threading, time
+
+_writers = {}
+_writers_lock = threading.Lock()
+_flusher = None
+
+
+class HitWriter:
+    """One append-only file of hits, kept open for the whole session.
+
+    write() takes a line of text or a dict (written as a JSON line) and only
+    buffers it; the buffer is flushed and fsync'd at most FLUSH_SECS after a
+    write, by whichever comes first of the next write or the background
+    flusher, so a crash loses at most that much. Once the file passes
+    `max_bytes` it is renamed aside to name.<timestamp>.ext in one
+    os.replace() and a fresh one is started. Safe to share between threads.
+    """
+
+    FLUSH_SECS = 1.0
+    MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, path, max_bytes=MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.file = None
+        self.dirty_since = None
+
+    def write(self, record):
+        line = record if isinstance(record, str) else json.dumps(record, ensure_ascii=False)
+        with self.lock:
+            if self.file is None:
+                self.file = open(self.path, "a", encoding="utf-8")
+            self.file.write(line.rstrip("\n") + "\n")
+            now = time.monotonic()
+            if self.dirty_since is None:
+                self.dirty_since = now
+            elif now - self.dirty_since >= self.FLUSH_SECS:
+                self._sync()
+            if self.file.tell() >= self.max_bytes:
+                self._rotate()
+        _start_flusher()
+
+    def flush(self, older_than=0.0):
+        """Flush and fsync what is buffered, if it was first written at least `older_than` seconds ago."""
+        with self.lock:
+            if self.dirty_since is not None and time.monotonic() - self.dirty_since >= older_than:
+                self._sync()
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self._sync()
+                self.file.close()
+                self.file = None
+
+    def _sync(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.dirty_since = None
+
+    def _rotate(self):
+        self._sync()
+        self.file.close()
+        self.file = None
+        root, ext = os.path.splitext(self.path)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        rotated, n = f"{root}.{stamp}{ext}", 1
+        while os.path.exists(rotated):
+            rotated, n = f"{root}.{stamp}-{n}{ext}", n + 1
+        os.replace(self.path, rotated)
+
+
+def writer(path):
+    """The process-wide HitWriter for `path`, so every checker saving there shares one handle."""
+    path = os.path.abspath(path)
+    with _writers_lock:
+        if path not in _writers:
+            _writers[path] = HitWriter(path)
+        return _writers[path]
+
+
+def _start_flusher():
+    global _flusher
+    with _writers_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_loop, name="hit-flusher", daemon=True)
+            _flusher.start()
+
+
+def _flush_loop():
+    while True:
+        time.sleep(HitWriter.FLUSH_SECS)
+        for w in list(_writers.values()):
+            try:
+                w.flush(HitWriter.FLUSH_SECS)
+            except OSError:
+                pass   # the next write() raises it where it can be reported
+
+
+def flush_all():
+    for w in list(_writers.values()):
+        w.flush()
+
+
+@atexit.register
+def close_all():
+    for w in list(_writers.values()):
+        w.close()
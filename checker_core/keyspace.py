@@ -0,0 +1,236 @@
+import hashlib, random, string, threading
+from math import prod
+
+from checker_core.cache import normalize
+
+LETTERS = string.ascii_lowercase
+DIGITS = string.digits
+ALNUM = LETTERS + DIGITS
+
+
+def pattern_layouts(pattern, length, prefix="", suffix=""):
+    """Layouts for one of the GUIs' generator patterns, plus whether to CamelCase them.
+
+    A layout is a list of slots, each slot a string of the characters allowed
+    there (literal text is one-character slots). Patterns are matched on their
+    name without the "(abc)" example, so "Letters only" and "Letters only (abc)"
+    are the same pattern.
+    """
+    name = " ".join(pattern.split("(")[0].split())
+    pre, post = list(prefix), list(suffix)
+    if name == "Prefix_Letters":
+        return [pre + ["_"] + [LETTERS] * length if prefix else [LETTERS] * length], False
+    if name == "Letters_Suffix":
+        return [[LETTERS] * length + ["_"] + post if suffix else [LETTERS] * length], False
+    if name == "Letters + Numbers":
+        cores = [[ALNUM] * length]
+    elif name == "Numbers + Letters":
+        cores = [[DIGITS] * n + [LETTERS] * (length - n) for n in range(1, max(1, length - 2) + 1)]
+    elif name == "Numbers only":
+        cores = [[DIGITS] * length]
+    elif name == "Letters_Letters":
+        cores = [[LETTERS] * (length // 2) + ["_"] + [LETTERS] * (length - length // 2)]
+    elif name == "4-char OG style":
+        cores = [[ALNUM] * 3, [ALNUM, ALNUM, "_.", ALNUM], [ALNUM, "_.", ALNUM, ALNUM]]
+    else:  # "Letters only", "CamelCase"
+        cores = [[LETTERS] * length]
+    return [pre + core + post for core in cores], name == "CamelCase"
+
+
+def camel_case(name, rng):
+    """Capitalise `name` in runs of 2-4 letters, the way the generators always have."""
+    parts, i = [], 0
+    while i < len(name):
+        remaining = len(name) - i
+        size = rng.randint(2, min(4, remaining)) if remaining > 1 else 1
+        parts.append(name[i:i + size].capitalize())
+        i += size
+    return "".join(parts)
+
+
+class Keyspace:
+    """Every name a set of layouts can produce, numbered 0..size-1 in lexicographic order per layout."""
+
+    def __init__(self, layouts):
+        self.layouts = [list(layout) for layout in layouts]
+        self.sizes = [prod(len(slot) for slot in layout) for layout in self.layouts]
+        self.size = sum(self.sizes)
+
+    def name(self, index):
+        for layout, size in zip(self.layouts, self.sizes):
+            if index < size:
+                chars = []
+                for slot in reversed(layout):
+                    index, r = divmod(index, len(slot))
+                    chars.append(slot[r])
+                return "".join(reversed(chars))
+            index -= size
+        raise IndexError(index)
+
+
+class Shuffle:
+    """A keyed pseudo-random permutation of range(n) that needs no memory.
+
+    A 4-round Feistel network over the smallest even number of bits that
+    covers n, re-applied (cycle walking) until the result falls below n.
+    """
+
+    ROUNDS = 4
+
+    def __init__(self, n, seed):
+        self.n = n
+        self.half = (max(2, (n - 1).bit_length()) + 1) // 2
+        self.mask = (1 << self.half) - 1
+        self.width = (self.half + 7) // 8
+        self.keys = [hashlib.blake2b(f"{seed}:{r}".encode(), digest_size=16).digest() for r in range(self.ROUNDS)]
+
+    def _round(self, x, key):
+        digest = hashlib.blake2b(x.to_bytes(self.width, "little"), key=key, digest_size=min(64, self.width + 1))
+        return int.from_bytes(digest.digest(), "little") & self.mask
+
+    def __getitem__(self, i):
+        x = i
+        while True:
+            left, right = x >> self.half, x & self.mask
+            for key in self.keys:
+                left, right = right, left ^ self._round(right, key)
+            x = (left << self.half) | right
+            if x < self.n:
+                return x
+
+
+class NameSampler:
+    """Draws names from a pattern's keyspace without replacement.
+
+    Walks a seeded Shuffle of the keyspace, so no name comes up twice, and
+    skips names the ResultCache already has a fresh verdict for. With a cache
+    the seed and position are saved, so the next Generate carries on where
+    this one stopped - even after a restart.
+    """
+
+    def __init__(self, platform, pattern, length, prefix="", suffix="", cache=None):
+        layouts, self.camel = pattern_layouts(pattern, length, prefix, suffix)
+        self.keyspace = Keyspace(layouts)
+        self.platform = platform
+        self.cache = cache
+        self.key = f"sample|{platform}|{pattern}|{length}|{prefix}|{suffix}"
+        state = cache.cursor(self.key) if cache is not None else None
+        self.seed, self.position = state or (random.getrandbits(62), 0)
+        self.shuffle = Shuffle(self.keyspace.size, self.seed)
+        self.rng = random.Random()
+        self.exhausted = False
+
+    def take(self, count, clean=None, max_attempts=None):
+        """Up to `count` names nobody has generated or checked yet.
+
+        `clean(name)` may rewrite a name or return None to reject it. Gives up
+        after `max_attempts` draws so a filter that rejects everything can't hang.
+        """
+        names = []
+        max_attempts = max_attempts or max(1000, count * 20)
+        for _ in range(max_attempts):
+            if len(names) >= count:
+                break
+            if self.position >= self.keyspace.size:
+                self.exhausted = True
+                break
+            name = self.keyspace.name(self.shuffle[self.position])
+            self.position += 1
+            if self.camel:
+                name = camel_case(name, self.rng)
+            if clean is not None:
+                name = clean(name)
+                if not name:
+                    continue
+            if self.cache is not None and self.cache.get(self.platform, name) is not None:
+                continue
+            names.append(name)
+        if self.cache is not None:
+            self.cache.save_cursor(self.key, self.seed, self.position)
+        return names
+
+
+class Sweep:
+    """Every name in a pattern's keyspace, produced lazily for a checker to consume.
+
+    Lexicographic or shuffled order. With a cache the position is saved as the
+    sweep goes, so stopping and sweeping again resumes where it left off; once
+    the whole keyspace is done the next sweep starts over. Checkers read ahead
+    of what they have finished, so the saved position is that of the oldest
+    name handed out without a result yet - BaseChecker.fresh() wires done() to
+    the checker's results. CamelCase sweeps yield plain lowercase names.
+
+    A sweep shared by several checkers takes `platforms`, a dict of platform
+    -> clean_username: a name then stays pending until every platform that
+    accepts it has reported it.
+    """
+
+    SAVE_EVERY = 500
+    MAX_LEN = 2 ** 31 - 1   # QProgressBar only counts that far
+
+    def __init__(self, platform, pattern, length, prefix="", suffix="", cache=None, shuffled=False, clean=None,
+                 platforms=None):
+        layouts, _ = pattern_layouts(pattern, length, prefix, suffix)
+        self.keyspace = Keyspace(layouts)
+        self.cache = cache
+        self.clean = clean
+        self.platforms = platforms
+        self.order = "shuffled" if shuffled else "lexicographic"
+        self.key = f"sweep|{platform}|{self.order}|{pattern}|{length}|{prefix}|{suffix}"
+        state = cache.cursor(self.key) if cache is not None else None
+        if state is None or state[1] >= self.keyspace.size:
+            state = (random.getrandbits(62), 0)
+        self.seed, self.start = state
+        self.position = self.start
+        self.shuffle = Shuffle(self.keyspace.size, self.seed) if shuffled else None
+        self.pending = {}   # normalised name -> [position, platforms still to report], handed out but not reported yet
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return min(self.keyspace.size - self.start, self.MAX_LEN)
+
+    def __iter__(self):
+        size = self.keyspace.size
+        try:
+            while self.position < size:
+                index = self.shuffle[self.position] if self.shuffle else self.position
+                name = self.keyspace.name(index)
+                if self.clean is not None:
+                    name = self.clean(name)
+                if name and self.platforms is not None:
+                    waiting = {p for p, clean in self.platforms.items() if clean(name)}
+                    name = name if waiting else None
+                else:
+                    waiting = None
+                if name:
+                    with self._lock:
+                        self.pending[normalize(name)] = [self.position, waiting]
+                self.position += 1
+                if self.position % self.SAVE_EVERY == 0:
+                    self.save()
+                if name:
+                    yield name
+        finally:
+            self.save()
+
+    def done(self, record):
+        """Result slot: the name in `record` needs no resuming any more."""
+        key = normalize(record.username)
+        with self._lock:
+            entry = self.pending.get(key)
+            if entry is None:
+                return
+            waiting = entry[1]
+            if waiting is not None:
+                waiting.discard(record.platform)
+                if waiting:
+                    return
+            del self.pending[key]
+
+    def resume_position(self):
+        with self._lock:
+            return min((position for position, _ in self.pending.values()), default=self.position)
+
+    def save(self):
+        if self.cache is not None:
+            self.cache.save_cursor(self.key, self.seed, self.resume_position())
@@ -0,0 +1,124 @@
+from collections import deque
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt, QTimer
+from PyQt5.QtGui import QColor, QKeySequence
+from PyQt5.QtWidgets import QAbstractItemView, QApplication, QListView
+
+from checker_core.results import Status
+
+
+class LogModel(QAbstractListModel):
+    """The (text, status) lines a LogView shows, dropped from the top once there are `limit` of them."""
+
+    def __init__(self, limit, colors=None):
+        super().__init__()
+        self.limit = limit
+        self.lines = deque()
+        self.colors = {Status(status): QColor(color) for status, color in (colors or {}).items()}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.lines)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            return self.lines[index.row()][0]
+        if role == Qt.ForegroundRole and self.colors:
+            return self.colors.get(self.lines[index.row()][1])
+        return None
+
+    def extend(self, lines):
+        lines = lines[-self.limit:]
+        if not lines:
+            return
+        overflow = len(self.lines) + len(lines) - self.limit
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self.lines.popleft()
+            self.endRemoveRows()
+        first = len(self.lines)
+        self.beginInsertRows(QModelIndex(), first, first + len(lines) - 1)
+        self.lines.extend(lines)
+        self.endInsertRows()
+
+    def reset(self, lines=()):
+        self.beginResetModel()
+        self.lines = deque(lines)
+        self.endResetModel()
+
+
+class LogView(QListView):
+    """Drop-in for the read-only QTextEdit logs: append(), clear() and toPlainText().
+
+    append() queues a plain line and add_results() a batch of CheckResults;
+    queued lines are added together at most FRAME_MS apart, so a checker
+    logging hundreds of lines a second costs a few repaints instead of one
+    layout per line. Only the last `limit` lines are kept. Result lines keep
+    their Status: set_only_hits(True) shows just the AVAILABLE ones and
+    `colors` maps a Status to the colour to draw its lines in.
+    """
+
+    FRAME_MS = 50
+    LIMIT = 10000
+
+    def __init__(self, parent=None, limit=LIMIT, colors=None):
+        super().__init__(parent)
+        self.lines = deque(maxlen=limit)   # everything, for toPlainText() and the filter
+        self.pending = []
+        self.only_hits = False
+        self.log_model = LogModel(limit, colors)
+        self.setModel(self.log_model)
+        self.setUniformItemSizes(True)
+        self.setWordWrap(False)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(self.FRAME_MS)
+        self.timer.timeout.connect(self.flush)
+
+    def append(self, text):
+        self.queue((line, None) for line in str(text).split("\n"))
+
+    def add_results(self, records):
+        self.queue((record.text, record.status) for record in records)
+
+    def queue(self, lines):
+        self.pending.extend(lines)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def flush(self):
+        batch, self.pending = self.pending, []
+        if not batch:
+            return
+        self.lines.extend(batch)
+        if self.only_hits:
+            batch = [line for line in batch if line[1] == Status.AVAILABLE]
+        bar = self.verticalScrollBar()
+        follow = bar.value() >= bar.maximum() - 2
+        self.log_model.extend(batch)
+        if follow:
+            self.scrollToBottom()
+
+    def clear(self):
+        self.pending = []
+        self.lines.clear()
+        self.log_model.reset()
+
+    def toPlainText(self):
+        self.flush()
+        return "\n".join(text for text, _ in self.lines)
+
+    def set_only_hits(self, only_hits):
+        self.flush()
+        self.only_hits = only_hits
+        self.log_model.reset(line for line in self.lines if not only_hits or line[1] == Status.AVAILABLE)
+        self.scrollToBottom()
+
+    def keyPressEvent(self, event):
+        if event.matches(QKeySequence.Copy):
+            rows = sorted(index.row() for index in self.selectedIndexes())
+            QApplication.clipboard().setText("\n".join(self.log_model.lines[row][0] for row in rows))
+            return
+        super().keyPressEvent(event)
@@ -0,0 +1,98 @@
+import asyncio, random, threading, time
+
+
+class Pacer:
+    """Spaces out request *starts* across every worker sharing this pacer.
+
+    Each call to wait() reserves the next start slot and sleeps until it
+    arrives, so N workers still honour a single global request rate while
+    their responses overlap. hold() pauses every worker at once.
+    """
+
+    def __init__(self, interval, jitter=0.0):
+        self.interval = max(0.0, float(interval))
+        self.jitter = max(0.0, float(jitter))  # fraction of interval, e.g. 0.3 = +/-30%
+        self._next_start = 0.0
+        self._resume_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _gap(self):
+        if not self.jitter:
+            return self.interval
+        spread = self.interval * self.jitter
+        return max(0.0, self.interval + random.uniform(-spread, spread))
+
+    async def wait(self):
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            start = max(now, self._next_start, self._resume_at)
+            self._next_start = start + self._gap()
+        delay = start - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+        # A hold() may have been issued while we were sleeping
+        while self._resume_at > loop.time():
+            await asyncio.sleep(self._resume_at - loop.time())
+
+    def hold(self, seconds):
+        """Block every worker for `seconds` from now (used for 429s/cooldowns)."""
+        loop = asyncio.get_running_loop()
+        resume = loop.time() + max(0.0, seconds)
+        if resume > self._resume_at:
+            self._resume_at = resume
+        if self._next_start < self._resume_at:
+            self._next_start = self._resume_at
+
+    @property
+    def held(self):
+        return self._resume_at > asyncio.get_running_loop().time()
+
+
+class TokenBucket:
+    """Non-blocking token bucket: `rate` requests per second, bursts of up to `capacity`.
+
+    reserve() takes a token if one is there, otherwise books the next one and
+    returns how long to wait for it. Nothing is held while waiting, so hundreds
+    of pending coroutines cost nothing and never serialise each other. Safe to
+    share between threads and coroutines.
+    """
+
+    def __init__(self, rate, capacity=1.0):
+        self.rate = max(0.01, float(rate))
+        self.capacity = max(1.0, float(capacity))
+        self._tokens = self.capacity
+        self._updated = None
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        if self._updated is not None:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, not_before=None):
+        """Claim one token; returns seconds until it may be used. No token is
+        handed out before the monotonic time `not_before`."""
+        now = time.monotonic()
+        with self._lock:
+            self._refill(now)
+            if not_before is not None and not_before > now:
+                self._tokens = min(self._tokens, 1 - (not_before - now) * self.rate)
+            self._tokens -= 1  # may go negative: that's a booked future token
+            return max(0.0, -self._tokens / self.rate)
+
+    async def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def set_rate(self, rate):
+        """Change the refill rate; tokens earned so far are kept at the old rate."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(0.01, float(rate))
@@ -0,0 +1,59 @@
+import asyncio
+
+
+async def run_pool(items, worker, concurrency, pacer=None, is_running=None, on_error=None, limiter=None):
+    """Feed `items` through a bounded queue to `concurrency` worker tasks.
+
+    worker(idx, item) is awaited once per item. If a pacer is given every
+    worker waits for a start slot before calling it. If an AdaptiveLimiter
+    is given each call also holds one of its concurrency slots, so fewer
+    than `concurrency` items may be in flight while it is backing off.
+    Stops pulling new items as soon as is_running() returns False. `items`
+    may be an async iterable; either way it is only read as fast as the
+    workers keep up.
+    """
+    concurrency = max(1, int(concurrency))
+    is_running = is_running or (lambda: True)
+    queue = asyncio.Queue(maxsize=concurrency * 2)
+
+    async def producer():
+        try:
+            if hasattr(items, "__aiter__"):
+                idx = 0
+                async for item in items:
+                    if not is_running():
+                        break
+                    await queue.put((idx, item))
+                    idx += 1
+            else:
+                for idx, item in enumerate(items):
+                    if not is_running():
+                        break
+                    await queue.put((idx, item))
+        finally:
+            for _ in range(concurrency):
+                await queue.put(None)
+
+    async def consumer():
+        while True:
+            job = await queue.get()
+            if job is None:
+                return
+            if not is_running():
+                continue  # drain so the producer never blocks
+            if pacer:
+                await pacer.wait()
+                if not is_running():
+                    continue
+            if limiter:
+                await limiter.acquire()
+            try:
+                await worker(*job)
+            except Exception as e:
+                if on_error:
+                    on_error(job[1], e)
+            finally:
+                if limiter:
+                    limiter.release()
+
+    await asyncio.gather(producer(), *(consumer() for _ in range(concurrency)))
@@ -0,0 +1 @@
+"""GUI-free checker implementations, one module per platform."""
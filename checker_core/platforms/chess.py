@@ -0,0 +1,257 @@
+import requests, time, traceback
+from checker_core.adaptive import AdaptiveLimiter, retry_after
+from checker_core.base import BaseChecker
+
+PLATFORMS = ["Chess.com", "Lichess.org"]
+
+# Public JSON APIs: a few hundred bytes per name instead of a whole profile page
+API_URLS = {
+    "Chess.com": "https://api.chess.com/pub/player/{}",
+    "Lichess.org": "https://lichess.org/api/user/{}",
+}
+PAGE_URLS = {
+    "Chess.com": "https://www.chess.com/member/{}",
+    "Lichess.org": "https://lichess.org/@/{}",
+}
+# Lichess resolves up to 300 comma-separated ids per POST and leaves out the ones with no account
+LICHESS_BULK_URL = "https://lichess.org/api/users"
+
+
+class ChessChecker(BaseChecker):
+
+    BATCH_SIZE = 300
+    BATCH_RETRIES = 3
+
+    def __init__(self, usernames, webhook_url=None, debug=False, save_to_file=True, platform="Chess.com", batch=False):
+        super().__init__()
+        self.usernames = usernames
+        self.webhook_url = webhook_url
+        self.debug = debug
+        self.save_to_file = save_to_file
+        self.site = platform  # "Chess.com" or "Lichess.org"
+        self.platform = "chess" if platform == "Chess.com" else "lichess"
+        self.consecutive_errors = 0
+        self.batch = batch and self.site == "Lichess.org"  # Chess.com has no bulk lookup
+        self.chunk_size = self.BATCH_SIZE if self.batch else 0
+        self.limiter = AdaptiveLimiter(2.0)  # adapts to what the site tolerates
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+
+    @staticmethod
+    def clean_username(line):
+        u = line.strip()
+        # Both platforms allow letters, numbers, and underscores
+        if u and all(c.isalnum() or c == '_' for c in u):
+            return u
+        return None
+
+    def run(self):
+        if self.batch:
+            self.run_batched()
+            return
+        for i, username in enumerate(self.fresh(self.usernames)):
+            if not self.running:
+                break
+            self.check_username(username)
+            self.count += 1
+            self.pupdate.emit(self.count)
+
+    def check_one(self, username):
+        """Check a single name (used by the multi-platform engine)."""
+        self.check_username(username)
+
+    def check_many(self, usernames):
+        """Check up to BATCH_SIZE names in one request (used by the multi-platform engine)."""
+        self.check_batch(usernames)
+
+    def run_batched(self):
+        """Resolve names BATCH_SIZE at a time; only the ones Lichess doesn't know get a page check."""
+        batch = []
+        for username in self.fresh(self.usernames):
+            if not self.running:
+                break
+            batch.append(username)
+            if len(batch) == self.BATCH_SIZE:
+                self.check_batch(batch)
+                batch = []
+        if batch and self.running:
+            self.check_batch(batch)
+
+    def check_batch(self, usernames):
+        rate_limited = False
+        absent = None
+        for attempt in range(self.BATCH_RETRIES):
+            if not self.running:
+                return
+            try:
+                if self.debug:
+                    self.update.emit(f"\n{'='*60}")
+                    self.update.emit(f"[DEBUG] Checking batch of {len(usernames)}: {usernames[0]} ... {usernames[-1]}")
+
+                self.limiter.pace_sync()
+                response = self.http.post(LICHESS_BULK_URL, data=",".join(usernames), headers={
+                    **self.headers, "Content-Type": "text/plain"}, timeout=15)
+
+                if self.debug:
+                    self.update.emit(f"[DEBUG] Status Code: {response.status_code}")
+
+                if response.status_code == 200:
+                    # Lichess ids are the lowercased names
+                    found = {str(user.get("id", "")).lower(): user for user in response.json()}
+                    absent = []
+                    for username in usernames:
+                        user = found.get(username.lower())
+                        if user is None:
+                            absent.append(username)
+                        elif user.get("disabled"):
+                            self.report(username, "UNCLAIMABLE", f"\u26a0\ufe0f [UNCLAIMABLE] {username}: Cannot be used to create a new account.")
+                        else:
+                            self.report(username, "TAKEN", f"\u274c [TAKEN] {username}")
+                    self.consecutive_errors = 0
+                    self.limiter.success()
+                    break
+
+                elif response.status_code == 429:
+                    rate_limited = True
+                    wait = self.limiter.backoff(retry_after(response.headers))  # next pace_sync() waits it out
+                    self.update.emit(f"\u26a0\ufe0f [RATE LIMIT] Batch of {len(usernames)}: waiting {wait:.0f}s ({self.limiter.describe()})...")
+                    self.consecutive_errors += 1
+
+                else:
+                    for username in usernames:
+                        self.report(username, "ERROR", f"\u26a0\ufe0f [ERROR] {username}: Status {response.status_code}")
+                    self.consecutive_errors += 1
+                    break
+
+            except Exception as e:
+                rate_limited = False
+                self.consecutive_errors += 1
+                self.update.emit(f"\u26a0\ufe0f [ERROR] Batch of {len(usernames)}: {str(e)[:80]}")
+                time.sleep(2)
+        else:
+            for username in usernames:
+                if rate_limited:
+                    self.report(username, "RATE_LIMITED", f"\u26a0\ufe0f [RATE LIMIT] {username}: batch still limited after {self.BATCH_RETRIES} attempts")
+                else:
+                    self.report(username, "ERROR", f"\u26a0\ufe0f [ERROR] {username}: batch failed after {self.BATCH_RETRIES} attempts")
+
+        self.count += len(usernames) - len(absent or [])
+        self.pupdate.emit(self.count)
+
+        # Deleted accounts are absent too but keep their name, so hits still get their page checked
+        for username in absent or []:
+            if not self.running:
+                return
+            self.check_username(username, page_only=True)
+            self.count += 1
+            self.pupdate.emit(self.count)
+
+    def api_verdict(self, response):
+        """TAKEN / AVAILABLE / UNCLAIMABLE from an API answer, or None if only the page can tell."""
+        if response.status_code == 200:
+            try:
+                data = response.json()
+            except ValueError:
+                return None
+            # Closed accounts keep their name: Lichess marks them disabled, Chess.com "closed..."
+            if data.get("disabled") or str(data.get("status", "")).startswith("closed"):
+                return "UNCLAIMABLE"
+            return "TAKEN"
+        if response.status_code == 404 and self.site == "Chess.com":
+            return "AVAILABLE"
+        return None   # a Lichess 404 may still be a deleted account whose name is gone
+
+    def page_verdict(self, response):
+        if self.site == "Lichess.org" and response.status_code == 404:
+            if "It cannot be used to create a new account." in response.text:
+                return "UNCLAIMABLE"
+            return "AVAILABLE"
+        return {200: "TAKEN", 404: "AVAILABLE"}.get(response.status_code)
+
+    def lookup(self, username, headers):
+        """(response, verdict) from the API, loading the profile page only when the API can't settle it."""
+        response = self.http.get(API_URLS[self.site].format(username), headers=headers, timeout=10)
+        verdict = self.api_verdict(response)
+        if verdict is not None or response.status_code in (403, 429):
+            return response, verdict
+        if self.debug:
+            self.update.emit(f"[DEBUG] API gave {response.status_code}, loading the profile page")
+        self.limiter.pace_sync()
+        response = self.http.get(PAGE_URLS[self.site].format(username), headers=headers, timeout=10, allow_redirects=True)
+        return response, self.page_verdict(response)
+
+    def check_username(self, username, page_only=False):
+        if not self.running:
+            return
+
+        try:
+            if self.site == "Chess.com":
+                webhook_desc = f"`{username}` [is available for **chess.com**!](https://www.chess.com/member/{username})"
+                webhook_color = 11045716
+                save_file = "available_chess_usernames.txt"
+                ratelimit_msg = "Chess.com is rate limiting!"
+                blocked_msg = "Chess.com blocked the request!"
+            else:
+                webhook_desc = f"`{username}` [is available for **lichess.org**!](https://lichess.org/@/{username})"
+                webhook_color = 0x6A4FB6
+                save_file = "available_lichess_usernames.txt"
+                ratelimit_msg = "Lichess.org is rate limiting!"
+                blocked_msg = "Lichess.org blocked the request!"
+
+            if self.debug:
+                self.update.emit(f"\n{'='*60}")
+                self.update.emit(f"[DEBUG] Checking: {username}")
+                self.update.emit(f"[DEBUG] URL: {(PAGE_URLS if page_only else API_URLS)[self.site].format(username)}")
+
+            self.limiter.pace_sync()
+            if page_only:
+                response = self.http.get(PAGE_URLS[self.site].format(username), headers=self.headers, timeout=10, allow_redirects=True)
+                verdict = self.page_verdict(response)
+            else:
+                response, verdict = self.lookup(username, self.headers)
+
+            if self.debug:
+                self.update.emit(f"[DEBUG] Status Code: {response.status_code}")
+
+            if verdict == "UNCLAIMABLE":
+                self.report(username, "UNCLAIMABLE", f"\u26a0\ufe0f [UNCLAIMABLE] {username}: Cannot be used to create a new account.")
+                self.consecutive_errors = 0
+                self.limiter.success()
+            elif verdict == "TAKEN":
+                self.report(username, "TAKEN", f"\u274c [TAKEN] {username}")
+                self.consecutive_errors = 0
+                self.limiter.success()
+            elif verdict == "AVAILABLE":
+                self.report(username, "AVAILABLE", f"\u2705 [AVAILABLE] {username}")
+                self.consecutive_errors = 0
+                self.limiter.success()
+                if self.save_to_file:
+                    self.save_hit(save_file, username)
+                if self.webhook_url:
+                    self.send_to_discord(username, webhook_desc, webhook_color)
+            elif response.status_code == 429:
+                self.report(username, "RATE_LIMITED", f"\u26a0\ufe0f [RATE LIMIT] {username}: {ratelimit_msg}")
+                self.consecutive_errors += 1
+                self.limiter.backoff(retry_after(response.headers))
+            elif response.status_code == 403:
+                self.report(username, "BLOCKED", f"\u26a0\ufe0f [BLOCKED] {username}: {blocked_msg}")
+                self.consecutive_errors += 1
+                self.limiter.backoff(retry_after(response.headers))
+            else:
+                self.report(username, "UNCLEAR", f"\u26a0\ufe0f [UNKNOWN] {username}: Status {response.status_code}")
+                self.consecutive_errors += 1
+        except requests.exceptions.Timeout:
+            self.consecutive_errors += 1
+            self.report(username, "ERROR", f"\u23f1\ufe0f [TIMEOUT] {username}")
+        except Exception as e:
+            self.consecutive_errors += 1
+            if self.debug:
+                error_msg = traceback.format_exc()
+                self.report(username, "ERROR", f"\u26a0\ufe0f [ERROR] {username}:\n{error_msg}")
+            else:
+                error_msg = str(e)
+                self.report(username, "ERROR", f"\u26a0\ufe0f [ERROR] {username}: {error_msg}")
+
+    def send_to_discord(self, username, desc, color):
+        self.post_webhook(username, {"description": desc, "color": color, "fields": []})
@@ -0,0 +1,372 @@
+import os
+import json
+import asyncio
+import aiohttp
+from checker_core.base import BaseChecker, Signal
+from checker_core.buckets import RateLimitBuckets
+from checker_core.proxies import ProxyPool
+
+UNAUTHED_URL  = "https://discord.com/api/v9/unique-username/username-attempt-unauthed"
+AUTHED_URL    = "https://discord.com/api/v9/users/@me/pomelo-attempt"
+LEGACY_URL    = "https://discord.com/api/v9/users/@me"
+USER_INFO_URL = "https://discord.com/api/v9/users/@me"
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+X_SUPER = (
+    "eyJvcyI6IldpbmRvd3MiLCJicm93c2VyIjoiQ2hyb21lIiwiZGV2aWNlIjoiIiwic3lzdGVtX2xvY2FsZSI6"
+    "ImVuLVVTIiwiYnJvd3Nlcl91c2VyX2FnZW50IjoiTW96aWxsYS81LjAgKFdpbmRvd3MgTlQgMTAuMDsgV2lu"
+    "NjQ7IHg2NCkgQXBwbGVXZWJLaXQvNTM3LjM2IChLSFRNTCwgbGlrZSBHZWNrbykgQ2hyb21lLzEyMC4wLjAu"
+    "MCBTYWZhcmkvNTM3LjM2IiwiYnJvd3Nlcl92ZXJzaW9uIjoiMTIwLjAuMC4wIiwib3NfdmVyc2lvbiI6IjEw"
+    "IiwicmVmZXJyZXIiOiIiLCJyZWZlcnJpbmdfZG9tYWluIjoiIiwicmVmZXJyZXJfY3VycmVudCI6IiIsInJl"
+    "ZmVycmluZ19kb21haW5fY3VycmVudCI6IiIsInJlbGVhc2VfY2hhbm5lbCI6InN0YWJsZSIsImNsaWVudF9i"
+    "dWlsZF9udW1iZXIiOjI1MDcxMCwiY2xpZW50X2V2ZW50X3NvdXJjZSI6bnVsbH0="
+)
+
+# A dead proxy fails the connect within seconds instead of eating the whole timeout
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=15, sock_connect=5)
+
+RETRY = "retry"   # check_pomelo_username result: hand the name to another lane
+
+
+class TokenLane:
+    """One token's independent lane: own rate-limit buckets, optional sticky proxy from the pool."""
+
+    def __init__(self, index, token="", proxied=False):
+        self.index = index
+        self.token = token
+        self.proxied = proxied
+        self.proxy = None   # the pool's current pick for this lane
+        self.url = AUTHED_URL if token else UNAUTHED_URL
+        self.buckets = RateLimitBuckets()   # fed from X-RateLimit-* headers on every response
+        self.alive = True
+        self.checked = 0
+        self.rate_limits = 0
+        self.retry_after_total = 0.0
+
+    @property
+    def name(self):
+        if self.token:
+            return f"Token {self.index + 1}"
+        return f"Proxy {self.index + 1}" if self.proxied else "Direct"
+
+    @property
+    def avg_retry_after(self):
+        return self.retry_after_total / self.rate_limits if self.rate_limits else 0.0
+
+    def stats_line(self):
+        if not self.alive:
+            state = "dead"
+        else:
+            wait = self.buckets.delay(self.url)
+            state = f"limited {wait:.1f}s" if wait > 0 else "ready"
+        return (f"{self.name:<10} checked {self.checked:>5}   429s {self.rate_limits:>4}   "
+                f"avg retry {self.avg_retry_after:>6.2f}s   [{state}]")
+
+
+class DiscordChecker(BaseChecker):
+    platform = "discord"
+
+    STATS_INTERVAL = 2.0
+
+    def __init__(self, usernames, tokens, check_mode="pomelo", proxies=None, debug=False, available_file=None):
+        super().__init__()
+        self.lane_stats = Signal()
+        self.usernames   = usernames
+        self.tokens      = tokens if isinstance(tokens, list) else ([tokens] if tokens else [])
+        self.check_mode  = check_mode
+        self.proxy_pool  = proxies if isinstance(proxies, ProxyPool) else (ProxyPool(proxies) if proxies else None)
+        self.running     = True
+        self.debug       = debug
+        self.available_file = available_file   # hits are appended here when set
+        self.consecutive_errors      = 0
+        self.max_errors_before_pause = 3
+        self.available_count = 0
+        self.taken_count     = 0
+        self.error_count     = 0
+        self.lanes = self.build_lanes()
+        self.lock = None
+
+    def build_lanes(self):
+        """One lane per token, else one per proxy, else one direct lane.
+
+        Lanes don't own a proxy: each asks the pool, which keeps handing it
+        the same one until that proxy fails or gets rate limited.
+        """
+        if self.tokens:
+            return [TokenLane(i, tok, bool(self.proxy_pool)) for i, tok in enumerate(self.tokens)]
+        if self.proxy_pool:
+            return [TokenLane(i, "", True) for i in range(len(self.proxy_pool))]
+        return [TokenLane(0)]
+
+    def run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self.main())
+        finally:
+            loop.close()
+
+    def save_available(self, username):
+        if self.available_file:
+            self.save_hit(self.available_file, username)
+
+    def emit_lane_stats(self):
+        lines = [lane.stats_line() for lane in self.lanes]
+        if self.proxy_pool:
+            lines.append(self.proxy_pool.describe())
+        self.lane_stats.emit("\n".join(lines))
+
+    async def check_pomelo_username(self, username, session, lane):
+        try:
+            payload = {"username": username}
+            req_headers = {"Authorization": lane.token} if lane.token else {}
+            with self.proxied(lane.name) as lane.proxy:
+                if self.debug and lane.proxy:
+                    self.update.emit(f"[DEBUG] {lane.name} using proxy: {lane.proxy}")
+                async with session.post(lane.url, json=payload, proxy=lane.proxy, timeout=REQUEST_TIMEOUT, headers=req_headers) as resp:
+                    status = resp.status
+                    if status != 429:
+                        lane.buckets.update(lane.url, resp.headers)
+
+                    if self.debug:
+                        self.update.emit(
+                            f"[DEBUG] Bucket {resp.headers.get('X-RateLimit-Bucket', '?')}: "
+                            f"{resp.headers.get('X-RateLimit-Remaining', '?')} left, "
+                            f"resets in {resp.headers.get('X-RateLimit-Reset-After', '?')}s"
+                        )
+
+                    if self.debug:
+                        self.update.emit(f"\n{'='*60}")
+                        self.update.emit(f"[DEBUG] Checking: {username}  ({lane.name})")
+                        self.update.emit(f"[DEBUG] Status Code: {status}")
+
+                    if status in (200, 201):
+                        data = await resp.json()
+                        lane.checked += 1
+
+                        if self.debug:
+                            self.update.emit(f"[DEBUG] Response: {json.dumps(data, indent=2)}")
+
+                        if "taken" in data:
+                            taken = data["taken"]
+                            if not taken:
+                                self.available_count += 1
+                                self.report(username, "AVAILABLE", f"[AVAILABLE] '{username}'  [Stats: {self.available_count} available / {self.taken_count + self.available_count} checked]")
+                                self.save_available(username)
+                            else:
+                                self.taken_count += 1
+                                self.report(username, "TAKEN", f"[TAKEN] '{username}'  [Stats: {self.available_count} available / {self.taken_count + self.available_count} checked]")
+                            return not taken
+                        else:
+                            self.report(username, "UNCLEAR", f"[UNCERTAIN] '{username}' - Unexpected response")
+                            return None
+
+                    elif status == 429:
+                        # Get retry_after from JSON body (same as friend's script)
+                        try:
+                            data = await resp.json()
+                            retry_after = float(data.get("retry_after", 5.0))
+                        except Exception:
+                            retry_after = 5.0
+                        lane.buckets.update(lane.url, resp.headers, retry_after)
+                        if lane.proxy and not lane.token:   # unauthed limits follow the IP: rest the proxy
+                            self.proxy_pool.rate_limited(lane.proxy, retry_after)
+                        lane.rate_limits += 1
+                        lane.retry_after_total += retry_after
+                        self.update.emit(f"[RATE LIMIT] {lane.name} limited for {retry_after:.2f}s")
+                        return RETRY  # another lane picks the name up if it is free
+
+                    elif status == 401:
+                        self.update.emit(f"[AUTH ERROR] Invalid {lane.name}, retiring its lane...")
+                        lane.alive = False
+                        return RETRY
+
+                    else:
+                        self.report(username, "UNCLEAR", f"[UNCERTAIN] '{username}' - Status {status}")
+                        return None
+
+        except aiohttp.ClientProxyConnectionError:
+            # The pool has counted it against the proxy; hand the name to a lane with a working one
+            self.update.emit(f"[PROXY ERROR] {lane.name}: could not connect via {lane.proxy}")
+            wait = self.proxy_pool.delay()   # every proxy is down: wait for the first to come back
+            while wait > 0 and self.running:
+                await asyncio.sleep(min(wait, 1.0))
+                wait -= 1.0
+            return RETRY
+        except Exception as e:
+            self.report(username, "ERROR", f"[ERROR] '{username}': {str(e)[:80]}")
+            return None
+
+    async def check_user(self, username, lane, session, lock):
+        """Returns False if the name has to be retried by another lane."""
+        try:
+            result = await self.check_pomelo_username(username, session, lane)
+            if result == RETRY:
+                return False
+
+            if result is None:
+                self.error_count += 1
+                self.consecutive_errors += 1
+                await self.check_for_cooldown()
+            else:
+                self.consecutive_errors = 0
+
+        except aiohttp.ClientProxyConnectionError:
+            self.report(username, "ERROR", f"[PROXY ERROR] {username}: Could not connect via {lane.proxy}")
+            self.consecutive_errors += 1
+            self.error_count += 1
+        except asyncio.TimeoutError:
+            self.consecutive_errors += 1
+            self.error_count += 1
+            self.report(username, "ERROR", f"[TIMEOUT] {username}")
+            await self.check_for_cooldown()
+        except Exception as e:
+            self.consecutive_errors += 1
+            self.error_count += 1
+            self.report(username, "ERROR", f"[ERROR] {username}: {str(e)[:80]}")
+            await self.check_for_cooldown()
+
+        async with lock:
+            self.count += 1
+        self.pupdate.emit(self.count)
+        return True
+
+    async def wait_for_budget(self, lane):
+        """Sleep until the lane's bucket has budget or the run stops; returns how long that took."""
+        waited = 0.0
+        while self.running:
+            delay = lane.buckets.delay(lane.url)
+            if delay <= 0:
+                break
+            step = min(delay, 1.0)  # short naps so stop() isn't kept waiting out a long retry_after
+            await asyncio.sleep(step)
+            waited += step
+        return waited
+
+    async def run_lane(self, lane, queue, session, lock):
+        while lane.alive:
+            # Only take a name once this lane can send it, so a token resting after a 429 leaves it to the others
+            waited = await self.wait_for_budget(lane)
+            username = await queue.get()
+            try:
+                if not self.running:
+                    continue  # drain the queue so main() can finish
+                # Send exactly when the bucket has budget - no fixed delay on top
+                wait = waited + await lane.buckets.acquire(lane.url)
+                if wait > 1 and self.debug:
+                    self.update.emit(f"[WAIT] {lane.name} bucket empty, waited {wait:.2f}s")
+                if not self.running:
+                    continue
+                if not await self.check_user(username, lane, session, lock):
+                    queue.put_nowait(username)
+            finally:
+                queue.task_done()
+
+        # Lane retired (invalid token). If it was the last one nobody can finish the queue.
+        if not any(l.alive for l in self.lanes):
+            self.update.emit("[TOKEN] All lanes are dead - stopping.")
+            while not queue.empty():
+                queue.get_nowait()
+                self.error_count += 1
+                self.count += 1
+                queue.task_done()
+            self.pupdate.emit(self.count)
+
+    async def feed(self, queue):
+        """Top the queue up as the lanes drain it instead of loading every name up front."""
+        ahead = max(16, 4 * len(self.lanes))
+        for username in self.fresh(self.usernames):
+            while queue.qsize() >= ahead and self.running and any(l.alive for l in self.lanes):
+                await asyncio.sleep(0.05)
+            # Once the last lane is dead nobody would take it off the queue again
+            if not self.running or not any(l.alive for l in self.lanes):
+                break
+            queue.put_nowait(username)
+
+    async def report_stats(self):
+        while True:
+            await asyncio.sleep(self.STATS_INTERVAL)
+            self.emit_lane_stats()
+
+    async def check_for_cooldown(self):
+        if self.consecutive_errors >= self.max_errors_before_pause:
+            await self.cooldown(15, f"{self.consecutive_errors} errors in a row")
+            self.consecutive_errors = 0
+
+    async def cooldown(self, duration, reason):
+        self.update.emit(f"\nCOOLDOWN: {reason}!")
+        self.update.emit(f"Waiting {duration}s...")
+        for remaining in range(duration, 0, -1):
+            if not self.running:
+                break
+            # Only print every 60s for long waits, every 5s for short ones
+            interval = 60 if duration > 60 else 5
+            if remaining % interval == 0 or remaining <= 5:
+                self.update.emit(f"Resuming in {remaining}s...")
+            await asyncio.sleep(1)
+        self.update.emit("Cooldown complete! Continuing...\n")
+
+    def open_session(self):
+        # Match friend's headers exactly - minimal, no X-Super-Properties
+        headers = {
+            "Content-Type":  "application/json",
+            "Origin":        "https://discord.com",
+            "Referer":       "https://discord.com/",
+            "User-Agent":    USER_AGENT,
+        }
+
+        connector = aiohttp.TCPConnector(limit=len(self.lanes), ssl=True, ttl_dns_cache=300)
+        timeout   = aiohttp.ClientTimeout(total=30)
+        return aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout)
+
+    async def check_one(self, username, session):
+        """Check one name on whichever live lane frees up first (used by the multi-platform engine)."""
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        while self.running:
+            live = [l for l in self.lanes if l.alive]
+            if not live:
+                self.report(username, "ERROR", f"[ERROR] {username}: all lanes are dead")
+                return
+            lane = min(live, key=lambda l: (l.buckets.delay(l.url), l.checked))
+            await lane.buckets.acquire(lane.url)
+            if await self.check_user(username, lane, session, self.lock):
+                return
+
+    async def main(self):
+        lock = asyncio.Lock()
+
+        mode = f"{len(self.tokens)} token lane(s)" if self.tokens else "unauthed"
+        if self.proxy_pool:
+            self.update.emit(f"Using {len(self.proxy_pool)} proxies across {len(self.lanes)} lanes ({mode})\n")
+        else:
+            self.update.emit(f"No proxies loaded - {len(self.lanes)} lane(s) on a direct connection ({mode})\n")
+
+        queue = asyncio.Queue()
+
+        async with self.open_session() as session:
+            lanes = [asyncio.create_task(self.run_lane(lane, queue, session, lock)) for lane in self.lanes]
+            stats = asyncio.create_task(self.report_stats())
+            try:
+                await self.feed(queue)
+                await queue.join()
+            finally:
+                for task in lanes + [stats]:
+                    task.cancel()
+                await asyncio.gather(*lanes, stats, return_exceptions=True)
+
+        self.emit_lane_stats()
+        total = self.available_count + self.taken_count + self.error_count
+        self.update.emit(f"\n{'-'*50}")
+        self.update.emit(f"Available : {self.available_count}")
+        self.update.emit(f"Taken     : {self.taken_count}")
+        self.update.emit(f"Errors    : {self.error_count}")
+        self.update.emit(f"Total     : {total}")
+        for lane in self.lanes:
+            self.update.emit(lane.stats_line())
+        if self.available_count and self.available_file:
+            self.update.emit(f"Saved {self.available_count} username(s) to {os.path.basename(self.available_file)}")
+        self.update.emit(f"{'-'*50}\n")
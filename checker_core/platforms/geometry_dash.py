@@ -0,0 +1,153 @@
+import requests, traceback
+from checker_core.adaptive import AdaptiveLimiter, retry_after
+from checker_core.base import BaseChecker
+
+
+class GeometryDashChecker(BaseChecker):
+    platform = "geometry_dash"
+
+    def __init__(self, usernames, webhook_url=None, debug=False):
+        super().__init__()
+        self.usernames = usernames
+        self.webhook_url = webhook_url
+        self.debug = debug
+        self.consecutive_errors = 0
+        self.max_errors_before_pause = 3
+        self.limiter = AdaptiveLimiter(1.0)  # starts at one request a second and adapts from there
+
+    @staticmethod
+    def clean_username(line):
+        u = line.strip()
+        if u and (u.replace('_', '').isalnum()):
+            return u
+        return None
+
+    def run(self):
+        for i, username in enumerate(self.fresh(self.usernames)):
+            if not self.running:
+                break
+            self.check_user(username)
+            self.count += 1
+            self.pupdate.emit(self.count)
+
+    def check_one(self, username):
+        """Check a single name (used by the multi-platform engine)."""
+        self.check_user(username)
+
+    def check_user(self, username):
+        if not self.running:
+            return
+
+        try:
+            # Official Geometry Dash API endpoint
+            url = "http://www.boomlings.com/database/getGJUsers20.php"
+            
+            # Required parameters for the official API
+            data = {
+                "str": username,
+                "total": 0,
+                "page": 0,
+                "secret": "Wmfd2893gb7"  # Public secret used by the game
+            }
+            
+            headers = {
+                "User-Agent": ""  # Empty User-Agent as used by the game
+            }
+            
+            if self.debug:
+                self.update.emit(f"\n{'='*60}")
+                self.update.emit(f"[DEBUG] Checking: {username}")
+                self.update.emit(f"[DEBUG] API URL: {url}")
+                self.update.emit(f"[DEBUG] Data: {data}")
+            
+            self.limiter.pace_sync()
+            response = self.http.post(url, data=data, headers=headers, timeout=10)
+            
+            if self.debug:
+                self.update.emit(f"[DEBUG] Status Code: {response.status_code}")
+                self.update.emit(f"[DEBUG] Response: {response.text[:200]}")
+            
+            if response.status_code == 200:
+                response_text = response.text.strip()
+                
+                # Check if the response is an error code
+                if response_text == "-1":
+                    # -1 means user not found (username is available!)
+                    self.report(username, "AVAILABLE", f"✅ [AVAILABLE] {username} - Verify in-game!")
+                    self.consecutive_errors = 0
+                    self.limiter.success()
+                    
+                    # Send to Discord webhook if provided
+                    if self.webhook_url:
+                        self.send_to_discord(username)
+                
+                elif response_text == "-2":
+                    # -2 can sometimes indicate rate limiting
+                    paused = self.limiter.backoff(retry_after(response.headers))
+                    self.report(username, "RATE_LIMITED", f"⚠️ [RATE LIMIT] {username}: Waiting {paused:.0f} seconds...")
+                    self.consecutive_errors += 1
+                
+                elif "#" in response_text and ":" in response_text:
+                    # User exists - parse the response
+                    # Format: username:playerID:stars:demons:...
+                    try:
+                        parts = response_text.split("#")[0].split(":")
+                        if len(parts) >= 4:
+                            found_username = parts[0]
+                            player_id = parts[1]
+                            stars = parts[2]
+                            demons = parts[3]
+                            self.report(username, "TAKEN", f"❌ [TAKEN] {username} (ID: {player_id}, Stars: {stars}, Demons: {demons})")
+                        else:
+                            self.report(username, "TAKEN", f"❌ [TAKEN] {username}")
+                    except:
+                        self.report(username, "TAKEN", f"❌ [TAKEN] {username}")
+                    
+                    self.consecutive_errors = 0
+                    self.limiter.success()
+                else:
+                    # Unexpected response
+                    self.report(username, "UNCLEAR", f"⚠️ [UNKNOWN] {username}: Unexpected response")
+                    if self.debug:
+                        self.update.emit(f"[DEBUG] Full response: {response_text}")
+                    self.consecutive_errors += 1
+                
+            elif response.status_code == 429:
+                paused = self.limiter.backoff(retry_after(response.headers))
+                self.report(username, "RATE_LIMITED", f"⚠️ [RATE LIMIT] {username}: Waiting {paused:.0f} seconds...")
+                self.consecutive_errors += 1
+                
+            else:
+                self.report(username, "ERROR", f"⚠️ [ERROR] {username}: Status {response.status_code}")
+                self.consecutive_errors += 1
+                
+        except requests.exceptions.Timeout:
+            self.consecutive_errors += 1
+            self.report(username, "ERROR", f"⏱️ [TIMEOUT] {username}")
+            
+        except Exception as e:
+            self.consecutive_errors += 1
+            if self.debug:
+                error_msg = traceback.format_exc()
+                self.report(username, "ERROR", f"⚠️ [ERROR] {username}:\n{error_msg}")
+            else:
+                error_msg = str(e)
+                self.report(username, "ERROR", f"⚠️ [ERROR] {username}: {error_msg}")
+
+    def send_to_discord(self, username):
+        """Queue the available username for the Discord webhook"""
+        self.post_webhook(username, {
+            "title": "🔺 Available Geometry Dash Username Found!",
+            "description": f"**Username:** `{username}`\n\n⚠️ **Note:** Always verify in-game! Some usernames may be banned/reserved.",
+            "color": 16760576,  # Orange/gold color
+            "fields": [
+                {
+                    "name": "📝 How to Claim",
+                    "value": "Open Geometry Dash → Account → Click 'More' → Change your username!",
+                    "inline": False
+                }
+            ],
+            "footer": {
+                "text": "Geometry Dash Username Checker"
+            }
+        })
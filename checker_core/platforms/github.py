@@ -0,0 +1,139 @@
+import requests, traceback
+from checker_core.adaptive import AdaptiveLimiter, retry_after
+from checker_core.base import BaseChecker
+
+
+class GitHubChecker(BaseChecker):
+    platform = "github"
+
+    PROFILE_URL = "https://github.com/{}"   # not www.github.com, which only redirects here
+
+    def __init__(self, usernames, webhook_url=None, debug=False, save_to_file=True):
+        super().__init__()
+        self.usernames = usernames
+        self.webhook_url = webhook_url
+        self.debug = debug
+        self.save_to_file = save_to_file
+        self.consecutive_errors = 0
+        self.limiter = AdaptiveLimiter(2.0)  # adapts to what the site tolerates
+
+    @staticmethod
+    def clean_username(line):
+        u = line.strip()
+        # GitHub allows letters, numbers, and hyphens
+        if u and all(c.isalnum() or c == '-' for c in u):
+            return u
+        return None
+
+    def run(self):
+        for i, username in enumerate(self.fresh(self.usernames)):
+            if not self.running:
+                break
+            self.check_username(username)
+            self.count += 1
+            self.pupdate.emit(self.count)
+
+    def check_one(self, username):
+        """Check a single name (used by the multi-platform engine)."""
+        self.check_username(username)
+
+    def lookup(self, url, headers):
+        """HEAD the profile: the same status code as the page without its ~200 KB body.
+
+        Only a HEAD that doesn't answer the question (a redirect, 405, ...)
+        is followed by a GET of the page.
+        """
+        response = self.http.head(url, headers=headers, timeout=10)
+        if response.status_code in (200, 403, 404, 429):
+            return response
+        if self.debug:
+            self.update.emit(f"[DEBUG] HEAD gave {response.status_code}, loading the page")
+        self.limiter.pace_sync()
+        return self.http.get(url, headers=headers, timeout=10, allow_redirects=True)
+
+    def check_username(self, username):
+        if not self.running:
+            return
+
+        try:
+            url = self.PROFILE_URL.format(username)
+            
+            if self.debug:
+                self.update.emit(f"\n{'='*60}")
+                self.update.emit(f"[DEBUG] Checking: {username}")
+                self.update.emit(f"[DEBUG] URL: {url}")
+            
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            }
+            
+            self.limiter.pace_sync()
+            response = self.lookup(url, headers)
+            
+            if self.debug:
+                self.update.emit(f"[DEBUG] Status Code: {response.status_code}")
+            
+            if response.status_code == 200:
+                # Username is taken
+                self.report(username, "TAKEN", f"❌ [TAKEN] {username}")
+                self.consecutive_errors = 0
+                self.limiter.success()
+                
+            elif response.status_code == 404:
+                # Username is available
+                self.report(username, "AVAILABLE", f"✅ [AVAILABLE] {username}")
+                self.consecutive_errors = 0
+                self.limiter.success()
+                
+                # Save to file
+                if self.save_to_file:
+                    self.save_hit("available_github_usernames.txt", username)
+                
+                # Send to Discord webhook
+                if self.webhook_url:
+                    self.send_to_discord(username)
+                    
+            elif response.status_code == 429:
+                self.report(username, "RATE_LIMITED", f"⚠️ [RATE LIMIT] {username}: GitHub is rate limiting!")
+                self.consecutive_errors += 1
+                self.limiter.backoff(retry_after(response.headers))
+                
+            elif response.status_code == 403:
+                self.report(username, "BLOCKED", f"⚠️ [BLOCKED] {username}: GitHub blocked the request!")
+                self.consecutive_errors += 1
+                self.limiter.backoff(retry_after(response.headers))
+                
+            else:
+                self.report(username, "UNCLEAR", f"⚠️ [UNKNOWN] {username}: Status {response.status_code}")
+                self.consecutive_errors += 1
+                
+        except requests.exceptions.Timeout:
+            self.consecutive_errors += 1
+            self.report(username, "ERROR", f"⏱️ [TIMEOUT] {username}")
+            
+        except Exception as e:
+            self.consecutive_errors += 1
+            if self.debug:
+                error_msg = traceback.format_exc()
+                self.report(username, "ERROR", f"⚠️ [ERROR] {username}:\n{error_msg}")
+            else:
+                error_msg = str(e)
+                self.report(username, "ERROR", f"⚠️ [ERROR] {username}: {error_msg}")
+
+    def send_to_discord(self, username):
+        """Queue the available username for the Discord webhook"""
+        self.post_webhook(username, {
+            "title": "🐙 Available GitHub Username Found!",
+            "description": f"**Username:** `{username}`",
+            "color": 6094199,  # GitHub dark color
+            "fields": [
+                {
+                    "name": "🔗 Direct Link",
+                    "value": f"https://github.com/{username}",
+                    "inline": False
+                }
+            ],
+            "footer": {
+                "text": "GitHub Username Checker"
+            }
+        })
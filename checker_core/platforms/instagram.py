@@ -0,0 +1,375 @@
+import aiohttp, asyncio, re
+from checker_core.base import BaseChecker
+from checker_core.adaptive import AdaptiveLimiter, retry_after
+from checker_core.pipeline import run_pool
+from checker_core.streaming import read_until
+
+# Explicit "page not found" signals; they come early in the page
+NOT_FOUND_SIGNALS = [
+    '"HttpError":{"statusCode":404',  # JSON error object
+    'page_not_found',  # Page type
+    '"PageNotFound"',  # React component
+    'Sorry, this page isn\'t available',  # Error message
+    '"status_code":404'  # Alternative error format
+]
+NOT_FOUND_LOWER = [signal.lower() for signal in NOT_FOUND_SIGNALS]
+OVERLAP = max(len(signal) for signal in NOT_FOUND_SIGNALS)  # a marker can straddle two chunks
+
+
+def not_found_seen():
+    """A read_until() check that is True once a not-found marker has shown up."""
+    state = {"tail": ""}
+
+    def done(piece):
+        text = state["tail"] + piece.lower()
+        state["tail"] = text[-OVERLAP:]
+        return any(signal in text for signal in NOT_FOUND_LOWER)
+    return done
+
+
+class InstagramChecker(BaseChecker):
+    platform = "instagram"
+
+    BASE_URL = "https://www.instagram.com/{}/"
+
+    def __init__(self, usernames, sessionid, user_agent, debug=False, concurrency=2, interval=2.0):
+        super().__init__()
+        self.usernames = usernames
+        self.sessionid = sessionid
+        self.user_agent = user_agent
+        self.debug = debug
+        self.concurrency = max(1, concurrency)  # Requests in flight at once on this session
+        self.interval = max(0.0, interval)  # Starting seconds between request starts (shared by all workers)
+        # Grows rate/concurrency while Instagram answers cleanly, halves them on 429s and blocks
+        self.limiter = AdaptiveLimiter(1 / self.interval if self.interval else 5.0, self.concurrency)
+        self.lock = None
+        self.cooling_down = False
+        self.consecutive_errors = 0  # Track errors in a row
+        self.rate_limit_count = 0  # Track rate limits
+        self.max_errors_before_pause = 3  # Pause after 3 errors in a row
+
+    @staticmethod
+    def clean_username(line):
+        u = line.strip().lower()
+        if u.startswith('@'):
+            u = u[1:]
+        if u and u.replace('_', '').replace('.', '').isalnum():
+            return u
+        return None
+
+    def run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self.main())
+        finally:
+            loop.close()
+
+    async def check_user(self, username, session, lock, idx):
+        if not self.running:
+            return
+
+        try:
+            url = self.BASE_URL.format(username)
+            await self.limiter.pace()
+            
+            with self.proxied() as proxy:
+                async with session.get(url, allow_redirects=True, timeout=20, proxy=proxy) as resp:
+                    status = resp.status
+                    if status == 429 and proxy:
+                        self.proxy_pool.rate_limited(proxy, retry_after(resp.headers))
+                
+                    # Debug mode - show raw indicators
+                    if self.debug:
+                        self.update.emit(f"\n{'='*60}")
+                        self.update.emit(f"[DEBUG] Checking: {username}")
+                        self.update.emit(f"[DEBUG] Status Code: {status}")
+                        self.update.emit(f"[DEBUG] Final URL: {resp.url}")
+                
+                    # ===== CLEAR SIGNALS =====
+                
+                    # 1. Explicit 404 status = AVAILABLE
+                    if status == 404:
+                        self.limiter.success()
+                        self.report(username, "AVAILABLE", f"✅ [AVAILABLE] {username} (404 status)")
+                        return
+                
+                    # 2. Rate limited
+                    if status == 429:
+                        self.rate_limit_count += 1
+                        paused = self.limiter.backoff(retry_after(resp.headers))  # Pause every worker, not just this one
+                        self.report(username, "RATE_LIMITED", f"⚠️ [RATE LIMIT] {username}: Slow down! Pausing {paused:.0f}s, now {self.limiter.describe()}")
+                        return
+                
+                    # 3. Blocked or forbidden
+                    if status in [400, 403]:
+                        self.consecutive_errors += 1
+                        self.limiter.backoff(retry_after(resp.headers))
+                        self.report(username, "BLOCKED", f"⚠️ [BLOCKED] {username}: Status {status} - Check session/IP")
+                        await self.check_for_cooldown()
+                        return
+                
+                    # 4. Redirected to login = session expired
+                    if 'login' in str(resp.url).lower():
+                        self.report(username, "ERROR", f"❌ [SESSION EXPIRED] {username}: Re-enter sessionid")
+                        return
+                
+                    self.limiter.success()
+                
+                    # Read the response, stopping early if it turns out to be a "not found" page
+                    try:
+                        body, complete = await read_until(resp, not_found_seen())
+                        body_lower = body.lower()
+                    except Exception:
+                        self.report(username, "ERROR", f"⚠️ [ERROR] {username}: Could not read response")
+                        return
+                
+                    if self.debug:
+                        self.update.emit(f"[DEBUG] Body Length: {len(body)} chars" + ("" if complete else " (stopped at a not-found marker)"))
+                
+                    # ===== ANALYZE BODY CONTENT =====
+                
+                    # Check for explicit "page not found" signals
+                    found_not_found = False
+                    for signal in NOT_FOUND_SIGNALS:
+                        if signal.lower() in body_lower:
+                            if self.debug:
+                                self.update.emit(f"[DEBUG] Found NOT FOUND signal: {signal}")
+                            found_not_found = True
+                            break
+                
+                    if found_not_found:
+                        self.report(username, "AVAILABLE", f"✅ [AVAILABLE] {username} (not found signal)")
+                        return
+                
+                    # Check for profile existence signals
+                    # These indicate a REAL, ACTIVE profile (not just placeholder data)
+                    profile_signals = {
+                        'has_real_user_id': False,
+                        'has_follower_count': False,
+                        'has_following_count': False,
+                        'has_post_count': False,
+                        'has_profile_pic': False,
+                        'has_biography_content': False,
+                        'has_username_match': False
+                    }
+                
+                    # User ID check - but verify it's actually in a user object, not just random
+                    # Real profiles have user data in specific structures
+                    user_id_match = re.search(r'"user"[:\s]*{[^}]*"id"[:\s]*"(\d{5,})"', body)
+                    if not user_id_match:
+                        user_id_match = re.search(r'"ProfilePage"[^}]*"user"[:\s]*{[^}]*"id"[:\s]*"(\d{5,})"', body, re.DOTALL)
+                
+                    if user_id_match:
+                        user_id = user_id_match.group(1)
+                        # Check if this user ID appears with the username (strong signal)
+                        if re.search(rf'"username"[:\s]*"{username}"[^}}]*"id"[:\s]*"{user_id}"', body, re.IGNORECASE):
+                            profile_signals['has_real_user_id'] = True
+                            if self.debug:
+                                self.update.emit(f"[DEBUG] ✓ Found REAL user ID linked to username: {user_id}")
+                        elif self.debug:
+                            self.update.emit(f"[DEBUG] ✗ Found user ID {user_id} but NOT linked to this username (likely placeholder)")
+                
+                    # Username appears in the user data (strong signal it's real)
+                    if re.search(rf'"username"[:\s]*"{username}"', body, re.IGNORECASE):
+                        profile_signals['has_username_match'] = True
+                        if self.debug:
+                            self.update.emit(f"[DEBUG] ✓ Username '{username}' found in user data")
+                
+                    # Follower count structure (new format)
+                    follower_match = re.search(r'"follower_count"[:\s]*(\d+)', body)
+                    if not follower_match:
+                        follower_match = re.search(r'"edge_followed_by"[:\s]*{[^}]*"count"[:\s]*(\d+)', body)
+                    if follower_match:
+                        profile_signals['has_follower_count'] = True
+                        if self.debug:
+                            self.update.emit(f"[DEBUG] ✓ Found follower count: {follower_match.group(1)}")
+
+                    # Following count structure (new format)
+                    if re.search(r'"following_count"[:\s]*\d+', body) or \
+                       re.search(r'"edge_follow"[:\s]*{[^}]*"count"[:\s]*\d+', body):
+                        profile_signals['has_following_count'] = True
+                        if self.debug:
+                            self.update.emit(f"[DEBUG] ✓ Found following count")
+
+                    # Post count (new format)
+                    if re.search(r'"media_count"[:\s]*\d+', body) or \
+                       re.search(r'"edge_owner_to_timeline_media"[:\s]*{[^}]*"count"[:\s]*\d+', body):
+                        profile_signals['has_post_count'] = True
+                        if self.debug:
+                            self.update.emit(f"[DEBUG] ✓ Found post count")
+                
+                    # Profile picture with actual URL (not default)
+                    if re.search(r'"profile_pic_url"[:\s]*"https://[^"]+(?:scontent|cdninstagram)[^"]*"', body):
+                        profile_signals['has_profile_pic'] = True
+                        if self.debug:
+                            self.update.emit(f"[DEBUG] ✓ Found profile pic URL")
+
+                    # User ID — also check new "pk" field format
+                    if not user_id_match:
+                        user_id_match = re.search(r'"pk"[:\s]*"?(\d{5,})"?', body)
+                    if user_id_match and not profile_signals['has_real_user_id']:
+                        uid = user_id_match.group(1)
+                        if re.search(rf'"username"[:\s]*"{re.escape(username)}"', body, re.IGNORECASE):
+                            profile_signals['has_real_user_id'] = True
+                            if self.debug:
+                                self.update.emit(f"[DEBUG] ✓ Found REAL user ID (pk) linked to username: {uid}")
+                
+                    # Biography with actual content (not empty string)
+                    bio_match = re.search(r'"biography"[:\s]*"([^"]+)"', body)
+                    if bio_match and bio_match.group(1).strip():
+                        profile_signals['has_biography_content'] = True
+                        if self.debug:
+                            bio_preview = bio_match.group(1)[:50]
+                            self.update.emit(f"[DEBUG] ✓ Found biography with content: {bio_preview}...")
+                    elif self.debug:
+                        self.update.emit(f"[DEBUG] ✗ Biography field empty or not found")
+                
+                    # Count how many profile signals we found
+                    signal_count = sum(profile_signals.values())
+                
+                    if self.debug:
+                        self.update.emit(f"[DEBUG] Profile signals found: {signal_count}/7")
+                        self.update.emit(f"[DEBUG] Signals: {profile_signals}")
+                
+                    # Decision logic - STRICTER:
+                    # Must have username match + real user ID to be considered taken
+                    # OR have multiple strong signals (follower counts, posts, pic)
+                
+                    if profile_signals['has_username_match'] and profile_signals['has_real_user_id']:
+                        self.report(username, "TAKEN", f"❌ [TAKEN] {username} (username + user_id confirmed)")
+                        return
+                
+                    if signal_count >= 4:
+                        self.report(username, "TAKEN", f"❌ [TAKEN] {username} ({signal_count} strong signals)")
+                        return
+                
+                    # Has follower/following/post counts = likely real
+                    engagement_signals = (
+                        profile_signals['has_follower_count'] + 
+                        profile_signals['has_following_count'] + 
+                        profile_signals['has_post_count']
+                    )
+                    if engagement_signals >= 2 and profile_signals['has_profile_pic']:
+                        self.report(username, "TAKEN", f"❌ [TAKEN] {username} (engagement data present)")
+                        return
+                
+                    # Additional check: Look for the username in the page title or meta
+                    username_in_meta = False
+                    title_match = re.search(r'<title>([^<]+)</title>', body, re.IGNORECASE)
+                    if title_match:
+                        title = title_match.group(1)
+                        title_lower = title.lower()
+                        username_lower = username.lower()
+                        # Instagram encodes @ as &#064; in titles
+                        has_username_in_title = (
+                            username_lower in title_lower or
+                            f'&#064;{username_lower}' in title_lower
+                        )
+                        has_profile_indicators = (
+                            'posts' in title_lower or
+                            'followers' in title_lower or
+                            f'@{username_lower}' in title_lower or
+                            f'&#064;{username_lower}' in title_lower or
+                            '• instagram photos and videos' in title_lower
+                        )
+                        if has_username_in_title and has_profile_indicators:
+                            username_in_meta = True
+                            if self.debug:
+                                self.update.emit(f"[DEBUG] ✓ Username found in profile title: {title}")
+                        elif self.debug:
+                            self.update.emit(f"[DEBUG] ✗ Title doesn't indicate real profile: {title}")
+                
+                    if username_in_meta and (signal_count >= 1 or profile_signals['has_username_match']):
+                        self.report(username, "TAKEN", f"❌ [TAKEN] {username} (profile title + {signal_count} signals)")
+                        return
+                
+                    # If we get here with very few signals, it's likely available
+                    if signal_count <= 1:
+                        self.consecutive_errors = 0  # Reset on success
+                        self.report(username, "AVAILABLE", f"✅ [AVAILABLE] {username} (no real profile data)")
+                        return
+                
+                    # Low signal count = probably available (just has placeholder data)
+                    if signal_count == 2 and not profile_signals['has_username_match']:
+                        self.consecutive_errors = 0  # Reset on success
+                        self.report(username, "AVAILABLE", f"✅ [AVAILABLE] {username} (only placeholder data)")
+                        return
+                
+                    # Edge case: Some signals but unclear
+                    self.consecutive_errors = 0  # Reset on success
+                    self.report(username, "UNCLEAR", f"❓ [UNCLEAR] {username} ({signal_count} signals - manual check recommended)")
+                    if self.debug:
+                        self.update.emit(f"[DEBUG] URL for manual check: {url}")
+                
+        except asyncio.TimeoutError:
+            self.consecutive_errors += 1
+            self.report(username, "ERROR", f"⏱️ [TIMEOUT] {username}")
+            await self.check_for_cooldown()
+        except Exception as e:
+            self.consecutive_errors += 1
+            error_msg = str(e)[:80]
+            self.report(username, "ERROR", f"⚠️ [ERROR] {username}: {error_msg}")
+            await self.check_for_cooldown()
+        finally:
+            async with lock:
+                self.count += 1
+            self.pupdate.emit(self.count)
+
+    async def check_for_cooldown(self):
+        """Check if we need to pause due to consecutive errors"""
+        if self.consecutive_errors >= self.max_errors_before_pause:
+            await self.cooldown(15, f"{self.consecutive_errors} errors in a row")
+            self.consecutive_errors = 0  # Reset counter after cooldown
+
+    async def cooldown(self, duration, reason):
+        """Pause checking for a specified duration (blocks every worker)"""
+        if self.cooling_down:
+            return
+        self.cooling_down = True
+        self.limiter.hold(duration)
+        self.update.emit(f"\n🛑 COOLDOWN: {reason}!")
+        self.update.emit(f"⏸️  Pausing for {duration} seconds to avoid being blocked...")
+        
+        for remaining in range(duration, 0, -1):
+            if not self.running:  # Allow user to stop during cooldown
+                break
+            self.update.emit(f"⏳ Resuming in {remaining} seconds...")
+            await asyncio.sleep(1)
+        
+        self.update.emit(f"✅ Cooldown complete! Continuing...\n")
+        self.cooling_down = False
+
+    def open_session(self):
+        headers = {
+            "User-Agent": self.user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Accept-Encoding": "gzip, deflate",  # Removed 'br' to avoid brotli requirement
+            "Connection": "keep-alive",
+            "Cookie": f"sessionid={self.sessionid}",
+            "Upgrade-Insecure-Requests": "1",
+            "Sec-Fetch-Dest": "document",
+            "Sec-Fetch-Mode": "navigate",
+            "Sec-Fetch-Site": "none"
+        }
+
+        connector = aiohttp.TCPConnector(limit=self.limiter.max_concurrency, ssl=True, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=30)
+        return aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout)
+
+    async def check_one(self, username, session):
+        """Check one name on a session from open_session() (used by the multi-platform engine)."""
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        await self.check_user(username, session, self.lock, self.count)
+
+    async def main(self):
+        lock = asyncio.Lock()
+        async with self.open_session() as session:
+            async def worker(i, username):
+                await self.check_user(username, session, lock, i)
+
+            await run_pool(self.fresh(self.usernames), worker, self.limiter.max_concurrency, None, lambda: self.running,
+                           on_error=lambda u, e: self.report(u, "ERROR", f"⚠️ [ERROR] {u}: {str(e)[:80]}"),
+                           limiter=self.limiter)
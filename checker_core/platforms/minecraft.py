@@ -0,0 +1,243 @@
+import aiohttp, asyncio, traceback
+from checker_core import hits
+from checker_core.base import BaseChecker
+from checker_core.adaptive import AdaptiveLimiter, retry_after
+from checker_core.pipeline import run_pool
+
+
+class MinecraftChecker(BaseChecker):
+    platform = "minecraft"
+
+    PROFILE_URL = "https://api.mojang.com/users/profiles/minecraft/{}"
+    BULK_URL = "https://api.mojang.com/profiles/minecraft"
+    BULK_SIZE = 10  # most names the bulk endpoint takes per request
+    SAVE_FILE = "available_minecraft_usernames.txt"
+
+    def __init__(self, usernames, webhook_url=None, debug=False, save_to_file=True, bulk=False, concurrency=5, rate=5.0):
+        super().__init__()
+        self.usernames = usernames
+        self.webhook_url = webhook_url
+        self.debug = debug
+        self.save_to_file = save_to_file
+        self.consecutive_errors = 0
+        self.bulk = bulk
+        self.chunk_size = self.BULK_SIZE if bulk else 0
+        # Starts at `rate` req/s with `concurrency` in flight, then adapts to what Mojang allows
+        self.limiter = AdaptiveLimiter(rate, concurrency)
+
+    @staticmethod
+    def clean_username(line):
+        u = line.strip()
+        # Minecraft allows letters, numbers, underscores, 3-16 chars
+        if u and all(c.isalnum() or c == '_' for c in u) and 3 <= len(u) <= 16:
+            return u
+        return None
+
+    def run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self.main())
+        finally:
+            loop.close()
+
+    async def main(self):
+        file_handle = hits.writer(self.SAVE_FILE) if self.save_to_file else None
+        rate_limited_usernames = []
+
+        try:
+            async with self.open_session() as session:
+                await self.check_all(self.fresh(self.usernames), session, file_handle, rate_limited_usernames,
+                                     self.limiter.max_concurrency, self.bulk)
+
+                # Pause before retrying rate-limited usernames
+                if rate_limited_usernames and self.running:
+                    self.update.emit(f"\n⏳ Waiting 30 seconds before retrying {len(rate_limited_usernames)} rate-limited usernames...")
+                    for _ in range(30):
+                        if not self.running:
+                            return
+                        await asyncio.sleep(1)
+                    self.count = 0
+                    await self.check_all(rate_limited_usernames, session, file_handle, None,
+                                         min(3, self.limiter.max_concurrency))
+        finally:
+            if file_handle:
+                file_handle.flush()
+
+    async def check_all(self, usernames, session, file_handle, rate_limited_usernames, concurrency, bulk=False):
+        async def worker(i, username):
+            await self.check_username(username, session, file_handle, rate_limited_usernames)
+            self.count += 1
+            self.pupdate.emit(self.count)
+
+        async def bulk_worker(i, chunk):
+            await self.check_chunk(chunk, session, file_handle, rate_limited_usernames)
+            self.count += len(chunk)
+            self.pupdate.emit(self.count)
+
+        if bulk:
+            await run_pool(self.chunks(usernames), bulk_worker, concurrency, None, lambda: self.running, self.on_error, self.limiter)
+        else:
+            await run_pool(usernames, worker, concurrency, None, lambda: self.running, self.on_error, self.limiter)
+
+    def on_error(self, item, e):
+        for username in item if isinstance(item, list) else [item]:
+            self.report(username, "ERROR", f"⚠️ [ERROR] {username}: {str(e)[:80]}")
+
+    def open_session(self):
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+        connector = aiohttp.TCPConnector(limit=self.limiter.max_concurrency, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=10)
+        return aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout)
+
+    async def check_one(self, username, session):
+        """Check one name on a session from open_session() (used by the multi-platform engine)."""
+        await self.check_username(username, session, hits.writer(self.SAVE_FILE) if self.save_to_file else None)
+
+    async def check_many(self, usernames, session):
+        """Check up to BULK_SIZE names in one POST (used by the multi-platform engine)."""
+        await self.check_chunk(usernames, session, hits.writer(self.SAVE_FILE) if self.save_to_file else None)
+
+    def chunks(self, usernames):
+        chunk = []
+        for username in usernames:
+            chunk.append(username)
+            if len(chunk) == self.BULK_SIZE:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    async def mark_available(self, username, file_handle=None):
+        self.report(username, "AVAILABLE", f"✅ [AVAILABLE] {username}")
+        self.consecutive_errors = 0
+        if file_handle:
+            try:
+                file_handle.write(username)
+            except Exception as e:
+                if self.debug:
+                    self.update.emit(f"[DEBUG] Failed to save to file: {e}")
+        if self.webhook_url:
+            self.send_to_discord(username)
+
+    async def check_chunk(self, usernames, session, file_handle=None, rate_limited_usernames=None):
+        """Look up to BULK_SIZE names up in one POST; names Mojang doesn't return are free."""
+        if not self.running:
+            return
+        await self.limiter.pace()
+        try:
+            if self.debug:
+                self.update.emit(f"\n{'='*60}")
+                self.update.emit(f"[DEBUG] Bulk checking: {', '.join(usernames)}")
+
+            with self.proxied() as proxy:
+                async with session.post(self.BULK_URL, json=usernames, proxy=proxy) as response:
+                    status = response.status
+                    headers = response.headers
+                    if status == 429 and proxy:
+                        self.proxy_pool.rate_limited(proxy, retry_after(headers))
+                    profiles = await response.json(content_type=None) if status == 200 else None
+
+            if self.debug:
+                self.update.emit(f"[DEBUG] Status Code: {status}")
+
+            if status == 200:
+                found = {p["name"].lower() for p in profiles if p.get("name")}
+                for username in usernames:
+                    if username.lower() in found:
+                        self.report(username, "TAKEN", f"❌ [TAKEN] {username}")
+                    else:
+                        await self.mark_available(username, file_handle)
+                self.consecutive_errors = 0
+                self.limiter.success()
+                return
+            if status == 429:
+                self.limiter.backoff(retry_after(headers))
+                if rate_limited_usernames is not None:
+                    self.update.emit(f"⚠️ [RATE LIMIT] {len(usernames)} names: Mojang is rate limiting! Skipping for now.")
+                    rate_limited_usernames.extend(usernames)
+                    return
+            reason = f"Status {status}"
+        except Exception as e:
+            reason = str(e)[:80] or type(e).__name__
+
+        # Anything we can't read as a clean bulk answer gets the single-name lookup
+        self.update.emit(f"⚠️ [BULK] {len(usernames)} names: {reason}, checking one by one")
+        for username in usernames:
+            if not self.running:
+                return
+            await self.check_username(username, session, file_handle, rate_limited_usernames)
+
+    async def check_username(self, username, session, file_handle=None, rate_limited_usernames=None):
+        if not self.running:
+            return
+
+        retries = 0
+        max_retries = 2
+        while retries <= max_retries:
+            if not self.running:
+                return
+            await self.limiter.pace()
+            try:
+                url = self.PROFILE_URL.format(username)
+                if self.debug:
+                    self.update.emit(f"\n{'='*60}")
+                    self.update.emit(f"[DEBUG] Checking: {username}")
+                    self.update.emit(f"[DEBUG] URL: {url}")
+
+                with self.proxied() as proxy:
+                    async with session.get(url, proxy=proxy) as response:
+                        status = response.status
+                        headers = response.headers
+                        if status == 429 and proxy:
+                            self.proxy_pool.rate_limited(proxy, retry_after(headers))
+
+                if self.debug:
+                    self.update.emit(f"[DEBUG] Status Code: {status}")
+
+                if status == 200:
+                    self.report(username, "TAKEN", f"❌ [TAKEN] {username}")
+                    self.consecutive_errors = 0
+                    self.limiter.success()
+                    return
+                elif status == 204 or status == 404:
+                    self.limiter.success()
+                    await self.mark_available(username, file_handle)
+                    return
+                elif status == 429:
+                    self.limiter.backoff(retry_after(headers))
+                    if rate_limited_usernames is not None:
+                        self.update.emit(f"⚠️ [RATE LIMIT] {username}: Mojang is rate limiting! Skipping for now.")
+                        rate_limited_usernames.append(username)
+                    else:
+                        self.report(username, "RATE_LIMITED", f"⚠️ [RATE LIMIT] {username}: Mojang is rate limiting!")
+                    return
+                else:
+                    self.update.emit(f"⚠️ [UNKNOWN] {username}: Status {status}")
+                    self.consecutive_errors += 1
+                    retries += 1
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError):
+                self.consecutive_errors += 1
+                self.update.emit(f"⏱️ [TIMEOUT/CONN ERROR] {username} (retry {retries+1})")
+                sleep_time = min(30, 2 ** self.consecutive_errors)
+                await asyncio.sleep(sleep_time)  # only this worker backs off
+                retries += 1
+            except Exception as e:
+                self.consecutive_errors += 1
+                if self.debug:
+                    error_msg = traceback.format_exc()
+                    self.update.emit(f"⚠️ [ERROR] {username}:\n{error_msg}")
+                else:
+                    error_msg = str(e)
+                    self.update.emit(f"⚠️ [ERROR] {username}: {error_msg}")
+                retries += 1
+        self.report(username, "ERROR", f"❌ [FAILED] {username} after {max_retries+1} attempts")
+
+    def send_to_discord(self, username):
+        self.post_webhook(username, {
+            "description": f"`{username}` [is available for **Minecraft**!](https://namemc.com/profile/{username})",
+            "fields": [],
+            "color": 9158523
+        })
@@ -0,0 +1,234 @@
+import time, traceback, requests
+from checker_core.adaptive import AdaptiveLimiter, retry_after
+from checker_core.base import BaseChecker
+
+# ---------------------------------------------------------------------------
+# Lazy-import PSNAWP so the app can still launch and show the install error
+# ---------------------------------------------------------------------------
+try:
+    from psnawp_api import PSNAWP
+    from psnawp_api.models.user import User
+    PSNAWP_AVAILABLE = True
+except ImportError:
+    PSNAWP_AVAILABLE = False
+
+
+class PSNChecker(BaseChecker):
+    platform = "psn"
+
+    def __init__(self, usernames, method="direct", npsso=None, webhook_url=None, debug=False):
+        super().__init__()
+        self.usernames   = usernames
+        self.method      = method  # "direct" or "psnawp"
+        self.npsso       = npsso
+        self.webhook_url = webhook_url
+        self.debug       = debug
+        self.psnawp      = None
+        # Starts at the old fixed gaps (1.2 s direct, 0.6 s PSNAWP) and adapts from there
+        self.limiter     = AdaptiveLimiter(1 / 0.6 if method == "psnawp" else 1 / 1.2)
+        
+        # Direct API settings
+        self.api_url = "https://accounts.api.playstation.com/api/v1/accounts/onlineIds"
+        self.api_headers = {
+            "Host": "accounts.api.playstation.com",
+            "Connection": "keep-alive",
+            "sec-ch-ua-platform": "\"Windows\"",
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+            "Content-Type": "application/json; charset=UTF-8",
+            "Accept": "*/*",
+            "Origin": "https://id.sonyentertainmentnetwork.com",
+            "Referer": "https://id.sonyentertainmentnetwork.com/",
+            "Accept-Language": "en-US,en;q=0.9"
+        }
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def clean_username(line):
+        u = line.strip()
+        if u and 3 <= len(u) <= 16:
+            clean = ''.join(c for c in u if c.isalnum() or c in '_-')
+            if clean:
+                return clean
+        return None
+
+    # ------------------------------------------------------------------
+    def run(self):
+        if self.method == "psnawp":
+            self.run_psnawp()
+        else:
+            self.run_direct()
+
+    # ------------------------------------------------------------------
+    def check_one(self, username):
+        """Check a single name (used by the multi-platform engine)."""
+        if self.method != "psnawp":
+            self.check_user_direct(username)
+            return
+        if self.psnawp is None:
+            try:
+                self.psnawp = PSNAWP(self.npsso)
+            except Exception as e:
+                self.report(username, "ERROR", f"[AUTH ERROR] {username}: Failed to authenticate with PSN ({e})")
+                return
+        self.check_user_psnawp(username)
+
+    # ------------------------------------------------------------------
+    def run_direct(self):
+        """Direct API method - no auth required"""
+        self.update.emit("[INFO] Using Direct API (no authentication required)")
+        
+        for username in self.fresh(self.usernames):
+            if not self.running:
+                break
+            self.check_user_direct(username)
+            self.count += 1
+            self.pupdate.emit(self.count)
+
+    # ------------------------------------------------------------------
+    def check_user_direct(self, username, attempt=0):
+        """Check username using direct Sony API"""
+        if not self.running:
+            return
+        self.limiter.pace_sync()
+        
+        payload = {
+            "onlineId": username,
+            "reserveIfAvailable": False
+        }
+        
+        try:
+            response = self.http.post(self.api_url, json=payload, headers=self.api_headers, timeout=10)
+            status = response.status_code
+            
+            if self.debug:
+                self.update.emit(f"[DEBUG] {username} → HTTP {status}")
+            
+            if status != 429:
+                self.limiter.success()
+            
+            # Available
+            if status in (200, 201):
+                self.report(username, "AVAILABLE", f"[AVAILABLE] {username}")
+                if self.webhook_url:
+                    self.send_to_discord(username)
+            
+            # Taken or invalid
+            elif status == 400:
+                try:
+                    data = response.json()
+                    header_code = response.headers.get("X-ErrorCode", "")
+                    body_code = data[0].get("code", "") if isinstance(data, list) and data else ""
+                    
+                    if header_code == "accounts:3101" or body_code == "3101":
+                        self.report(username, "TAKEN", f"[TAKEN] {username}")
+                    elif body_code == "1100":
+                        self.report(username, "INVALID", f"[INVALID PATTERN] {username}")
+                    elif body_code == "3208":
+                        self.report(username, "RESTRICTED", f"[IMPROPER/RESTRICTED] {username}")
+                    else:
+                        if self.debug:
+                            self.report(username, "ERROR", f"[ERROR] {username}: {data}")
+                        else:
+                            self.report(username, "ERROR", f"[ERROR] {username}: Unknown 400 error")
+                except Exception as e:
+                    self.report(username, "ERROR", f"[ERROR] {username}: Could not parse response")
+            
+            # Rejected by policy
+            elif status == 406:
+                self.report(username, "RESTRICTED", f"[REJECTED/RESTRICTED] {username}")
+            
+            # Rate limited
+            elif status == 429:
+                paused = self.limiter.backoff(retry_after(response.headers))
+                if attempt < 2:
+                    self.update.emit(f"[RATE LIMIT] {username} – waiting {paused:.0f}s ({self.limiter.describe()})...")
+                    self.check_user_direct(username, attempt + 1)
+                else:
+                    self.report(username, "RATE_LIMITED", f"[RATE LIMIT] {username}")
+            
+            # Other errors
+            else:
+                self.report(username, "ERROR", f"[HTTP {status}] {username}")
+                
+        except requests.Timeout:
+            self.report(username, "ERROR", f"[TIMEOUT] {username}")
+        except requests.RequestException as e:
+            self.report(username, "ERROR", f"[REQUEST ERROR] {username}: {e}")
+        except Exception as e:
+            if self.debug:
+                self.report(username, "ERROR", f"[ERROR] {username}:\n{traceback.format_exc()}")
+            else:
+                self.report(username, "ERROR", f"[ERROR] {username}: {e}")
+
+    # ------------------------------------------------------------------
+    def run_psnawp(self):
+        """PSNAWP method - requires npsso token"""
+        try:
+            self.psnawp = PSNAWP(self.npsso)
+            if self.debug:
+                self.update.emit("[DEBUG] PSNAWP initialised – token exchange successful.")
+        except Exception as e:
+            self.update.emit(f"[AUTH ERROR] Failed to authenticate with PSN.\n"
+                             f"  • Make sure your npsso token is fresh (< 24 h old).\n"
+                             f"  • Detail: {e}")
+            return
+
+        for username in self.fresh(self.usernames):
+            if not self.running:
+                break
+            self.check_user_psnawp(username)
+            self.count += 1
+            self.pupdate.emit(self.count)
+
+    # ------------------------------------------------------------------
+    def check_user_psnawp(self, username, attempt=0):
+        """Check username using PSNAWP library"""
+        if not self.running:
+            return
+        self.limiter.pace_sync()
+        try:
+            user = self.psnawp.user(online_id=username)
+            if self.debug:
+                self.update.emit(f"[DEBUG] {username} → accountId: {user.account_id}")
+            self.limiter.success()
+            self.report(username, "TAKEN", f"[TAKEN] {username}")
+
+        except Exception as e:
+            err_text = str(e).lower()
+
+            if any(phrase in err_text for phrase in
+                   ("not found", "no such user", "does not exist",
+                    "invalid online id", "user not found")):
+                self.limiter.success()
+                self.report(username, "AVAILABLE", f"[AVAILABLE] {username}")
+                if self.webhook_url:
+                    self.send_to_discord(username)
+
+            elif "rate" in err_text or "429" in err_text or "too many" in err_text:
+                paused = self.limiter.backoff()
+                if attempt < 2:
+                    self.update.emit(f"[RATE LIMIT] {username} – waiting {paused:.0f} s ({self.limiter.describe()}) …")
+                    self.check_user_psnawp(username, attempt + 1)
+                else:
+                    self.report(username, "RATE_LIMITED", f"[RATE LIMIT] {username}")
+
+            elif "401" in err_text or "unauthori" in err_text or "token" in err_text:
+                self.update.emit("[AUTH ERROR] Token expired – please get a fresh npsso and restart.")
+                self.running = False
+
+            else:
+                if self.debug:
+                    self.report(username, "ERROR", f"[ERROR] {username}:\n{traceback.format_exc()}")
+                else:
+                    self.report(username, "ERROR", f"[ERROR] {username}: {e}")
+
+    # ------------------------------------------------------------------
+    def send_to_discord(self, username):
+        self.post_webhook(username, {
+            "title": "🎮 Available PlayStation Username",
+            "description": f"**{username}** is available!",
+            "color": 0x00ff00,
+            "fields": [{"name": "Username", "value": f"`{username}`", "inline": True}],
+            "footer": {"text": "Claim it fast on PlayStation.com!"},
+            "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S')
+        })
@@ -0,0 +1,159 @@
+import aiohttp
+import asyncio
+import traceback
+from checker_core.base import BaseChecker
+from checker_core.adaptive import AdaptiveLimiter, retry_after
+from checker_core.pipeline import run_pool
+
+
+class RedditChecker(BaseChecker):
+    platform = "reddit"
+
+    def __init__(self, usernames, webhook_url=None, debug=False, save_to_file=True, concurrency=5, rate=5.0):
+        super().__init__()
+        self.usernames = usernames
+        self.webhook_url = webhook_url
+        self.debug = debug
+        self.save_to_file = save_to_file
+        self.consecutive_errors = 0
+        # starts at `rate` req/s with `concurrency` in flight, then adapts to what Reddit allows
+        self.limiter = AdaptiveLimiter(rate, concurrency)
+
+    @staticmethod
+    def clean_username(line):
+        u = line.strip()
+        if u and all(c.isalnum() or c == '_' for c in u):
+            return u
+        return None
+
+    def run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self.main())
+        finally:
+            loop.close()
+
+    async def main(self):
+        rate_limited_usernames = []
+        async with self.open_session() as session:
+            await self.check_all(self.fresh(self.usernames), session, rate_limited_usernames, self.limiter.max_concurrency)
+
+            # Pause before retrying rate-limited usernames
+            if rate_limited_usernames and self.running:
+                self.update.emit(f"\n⏳ Waiting 30 seconds before retrying {len(rate_limited_usernames)} rate-limited usernames...")
+                for _ in range(30):
+                    if not self.running:
+                        return
+                    await asyncio.sleep(1)
+                self.count = 0
+                await self.check_all(rate_limited_usernames, session, None, min(3, self.limiter.max_concurrency))
+
+    async def check_all(self, usernames, session, rate_limited_usernames, concurrency):
+        async def worker(i, username):
+            await self.check_username(username, session, rate_limited_usernames)
+            self.count += 1
+            self.pupdate.emit(self.count)
+
+        await run_pool(usernames, worker, concurrency, None, lambda: self.running,
+                       on_error=lambda u, e: self.report(u, "ERROR", f"⚠️ [ERROR] {u}: {str(e)[:80]}"),
+                       limiter=self.limiter)
+
+    def open_session(self):
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+        connector = aiohttp.TCPConnector(limit=self.limiter.max_concurrency, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=10)
+        return aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout)
+
+    async def check_one(self, username, session):
+        """Check one name on a session from open_session() (used by the multi-platform engine)."""
+        await self.check_username(username, session)
+
+    async def mark_available(self, username, http_status=None, attempts=1):
+        self.report(username, "AVAILABLE", f"✅ [AVAILABLE] {username}", http_status=http_status, attempts=attempts)
+        self.consecutive_errors = 0
+        if self.save_to_file:
+            self.save_hit("available_reddit_usernames.txt", username)
+        if self.webhook_url:
+            self.send_to_discord(username)
+
+    async def check_username(self, username, session, rate_limited_usernames=None):
+        if not self.running:
+            return
+        retries = 0
+        max_retries = 2
+        while retries <= max_retries:
+            if not self.running:
+                return
+            await self.limiter.pace()
+            try:
+                url = f"https://www.reddit.com/user/{username}"
+                with self.proxied() as proxy:
+                    async with session.get(url, allow_redirects=True, proxy=proxy) as response:
+                        status = response.status
+                        headers = response.headers
+                        if status == 429 and proxy:
+                            self.proxy_pool.rate_limited(proxy, retry_after(headers))
+                        page = await response.text(errors='ignore')
+                if self.debug:
+                    self.update.emit(f"\n{'='*60}")
+                    self.update.emit(f"[DEBUG] Checking: {username}")
+                    self.update.emit(f"[DEBUG] URL: {url}")
+                    self.update.emit(f"[DEBUG] Status Code: {status}")
+                if status == 200:
+                    if "Sorry, nobody on Reddit goes by that name." in page:
+                        await self.mark_available(username, status, retries + 1)
+                    elif "This account has been banned" in page:
+                        self.report(username, "BANNED", f"🚫 [BANNED] {username}", http_status=status, attempts=retries + 1)
+                        self.consecutive_errors = 0
+                    else:
+                        self.report(username, "TAKEN", f"❌ [TAKEN] {username}", http_status=status, attempts=retries + 1)
+                        self.consecutive_errors = 0
+                    self.limiter.success()
+                    return
+                elif status == 404:
+                    await self.mark_available(username, status, retries + 1)
+                    self.limiter.success()
+                    return
+                elif status == 429:
+                    self.limiter.backoff(retry_after(headers))
+                    if rate_limited_usernames is not None:
+                        self.update.emit(f"⚠️ [RATE LIMIT] {username}: Reddit is rate limiting! Skipping for now.")
+                        rate_limited_usernames.append(username)
+                    else:
+                        self.report(username, "RATE_LIMITED", f"⚠️ [RATE LIMIT] {username}: Reddit is rate limiting!", http_status=status, attempts=retries + 1)
+                    return
+                elif status == 403:
+                    self.update.emit(f"⚠️ [BLOCKED] {username}: Reddit blocked the request!")
+                    self.consecutive_errors += 1
+                    self.limiter.backoff(retry_after(headers))  # every worker waits before the retry
+                    retries += 1
+                else:
+                    self.update.emit(f"⚠️ [UNKNOWN] {username}: Status {status}")
+                    self.consecutive_errors += 1
+                    retries += 1
+            except asyncio.TimeoutError:
+                self.consecutive_errors += 1
+                self.update.emit(f"⏱️ [TIMEOUT] {username} (retry {retries+1})")
+                sleep_time = min(30, 2 ** self.consecutive_errors)
+                await asyncio.sleep(sleep_time)
+                retries += 1
+            except Exception as e:
+                self.consecutive_errors += 1
+                if self.debug:
+                    error_msg = traceback.format_exc()
+                    self.update.emit(f"⚠️ [ERROR] {username}:\n{error_msg}")
+                else:
+                    error_msg = str(e)
+                    self.update.emit(f"⚠️ [ERROR] {username}: {error_msg}")
+                retries += 1
+        self.report(username, "ERROR", f"❌ [FAILED] {username} after {max_retries+1} attempts")
+
+    def send_to_discord(self, username):
+        self.post_webhook(username, {
+            "description": f"`{username}` [is available for **Reddit**!](https://www.reddit.com/user/{username})",
+            "color": 0xFF4500,
+            "fields": []
+        })
@@ -0,0 +1,411 @@
+import requests, time, traceback
+from datetime import datetime
+from checker_core.adaptive import AdaptiveLimiter, retry_after
+from checker_core.base import BaseChecker
+
+try:
+    from DrissionPage import Chromium, ChromiumOptions, errors
+    DRISSION_AVAILABLE = True
+except ImportError:
+    DRISSION_AVAILABLE = False
+
+
+class RobloxChecker(BaseChecker):
+    platform = "roblox"
+
+    API_URL = "https://users.roblox.com/v1/usernames/users"
+    BATCH_SIZE = 100  # users.roblox.com accepts up to 100 names per request
+    BATCH_RETRIES = 3
+
+    def __init__(self, usernames, webhook_url=None, debug=False, auto_signup=False, signup_password=None, batch=False):
+        super().__init__()
+        self.usernames = usernames
+        self.webhook_url = webhook_url
+        self.debug = debug
+        self.consecutive_errors = 0
+        self.max_errors_before_pause = 3
+        self.auto_signup = auto_signup
+        self.signup_password = signup_password or "RobloxGen2024!"
+        self.created_accounts = []
+        self.batch = batch
+        self.chunk_size = self.BATCH_SIZE if batch else 0
+        self.limiter = AdaptiveLimiter(2.0)  # adapts to what users.roblox.com tolerates
+
+    @staticmethod
+    def clean_username(line):
+        u = line.strip()
+        if u and (u.replace('_', '').isalnum()):
+            return u
+        return None
+
+    def run(self):
+        if self.batch:
+            self.run_batched()
+            return
+        for i, username in enumerate(self.fresh(self.usernames)):
+            if not self.running:
+                break
+            self.check_user(username)
+            self.count += 1
+            self.pupdate.emit(self.count)
+
+    def check_one(self, username):
+        """Check a single name (used by the multi-platform engine)."""
+        self.check_user(username)
+
+    def check_many(self, usernames):
+        """Check up to BATCH_SIZE names in one request (used by the multi-platform engine)."""
+        self.check_batch(usernames)
+
+    def run_batched(self):
+        """Look names up BATCH_SIZE at a time instead of one request per name."""
+        batch = []
+        for username in self.fresh(self.usernames):
+            if not self.running:
+                break
+            batch.append(username)
+            if len(batch) == self.BATCH_SIZE:
+                self.check_batch(batch)
+                batch = []
+        if batch and self.running:
+            self.check_batch(batch)
+
+    def check_batch(self, usernames):
+        rate_limited = False
+        for attempt in range(self.BATCH_RETRIES):
+            if not self.running:
+                return
+            try:
+                if self.debug:
+                    self.update.emit(f"\n{'='*60}")
+                    self.update.emit(f"[DEBUG] Checking batch of {len(usernames)}: {usernames[0]} ... {usernames[-1]}")
+
+                self.limiter.pace_sync()
+                response = self.http.post(self.API_URL, json={"usernames": usernames}, timeout=15)
+
+                if self.debug:
+                    self.update.emit(f"[DEBUG] Status Code: {response.status_code}")
+
+                if response.status_code == 200:
+                    # Only existing users come back; match them on the name we asked for
+                    found = {}
+                    for user_data in response.json().get("data", []):
+                        requested = str(user_data.get("requestedUsername", "")).lower()
+                        if requested and user_data.get("id") is not None:
+                            found[requested] = user_data
+                    for username in usernames:
+                        user_data = found.get(username.lower())
+                        if user_data:
+                            display_name = user_data.get("displayName", username)
+                            self.report(username, "TAKEN", f"❌ [TAKEN] {username} (ID: {user_data['id']}, Display: {display_name})")
+                        else:
+                            self.handle_available(username)
+                    self.consecutive_errors = 0
+                    self.limiter.success()
+                    break
+
+                elif response.status_code == 429:
+                    rate_limited = True
+                    wait = self.limiter.backoff(retry_after(response.headers))  # next pace_sync() waits it out
+                    self.update.emit(f"⚠️ [RATE LIMIT] Batch of {len(usernames)}: waiting {wait:.0f}s ({self.limiter.describe()})...")
+                    self.consecutive_errors += 1
+
+                else:
+                    for username in usernames:
+                        self.report(username, "ERROR", f"⚠️ [ERROR] {username}: Status {response.status_code}")
+                    self.consecutive_errors += 1
+                    break
+
+            except Exception as e:
+                rate_limited = False
+                self.consecutive_errors += 1
+                self.update.emit(f"⚠️ [ERROR] Batch of {len(usernames)}: {str(e)[:80]}")
+                time.sleep(2)
+        else:
+            for username in usernames:
+                if rate_limited:
+                    self.report(username, "RATE_LIMITED", f"⚠️ [RATE LIMIT] {username}: batch still limited after {self.BATCH_RETRIES} attempts")
+                else:
+                    self.report(username, "ERROR", f"⚠️ [ERROR] {username}: batch failed after {self.BATCH_RETRIES} attempts")
+
+        self.count += len(usernames)
+        self.pupdate.emit(self.count)
+
+    def handle_available(self, username):
+        self.report(username, "AVAILABLE", f"✅ [AVAILABLE] {username}")
+        self.consecutive_errors = 0
+
+        # Send to Discord webhook if provided
+        if self.webhook_url:
+            self.send_to_discord(username)
+
+        # Auto sign-up if enabled
+        if self.auto_signup and DRISSION_AVAILABLE:
+            self.update.emit(f"🔄 [AUTO-SIGNUP] Attempting to create account: {username}")
+            success = self.create_account(username)
+            if success:
+                self.update.emit(f"🎉 [SUCCESS] Account created: {username}")
+            else:
+                self.update.emit(f"⚠️ [FAILED] Could not create account: {username}")
+
+    def check_user(self, username):
+        if not self.running:
+            return
+
+        try:
+            url = self.API_URL
+            data = {"usernames": [username]}
+            
+            if self.debug:
+                self.update.emit(f"\n{'='*60}")
+                self.update.emit(f"[DEBUG] Checking: {username}")
+                self.update.emit(f"[DEBUG] API URL: {url}")
+            
+            self.limiter.pace_sync()
+            response = self.http.post(url, json=data, timeout=10)
+            
+            if self.debug:
+                self.update.emit(f"[DEBUG] Status Code: {response.status_code}")
+                self.update.emit(f"[DEBUG] Response: {response.text[:200]}")
+            
+            if response.status_code == 200:
+                self.limiter.success()
+                result = response.json()
+                
+                if result.get("data") and len(result["data"]) > 0:
+                    user_data = result["data"][0]
+                    if user_data.get("id") is not None:
+                        user_id = user_data.get("id")
+                        display_name = user_data.get("displayName", username)
+                        self.report(username, "TAKEN", f"❌ [TAKEN] {username} (ID: {user_id}, Display: {display_name})")
+                        self.consecutive_errors = 0
+                        return
+                
+                # Username is available
+                self.handle_available(username)
+                
+            elif response.status_code == 429:
+                self.limiter.backoff(retry_after(response.headers))
+                self.report(username, "RATE_LIMITED", f"⚠️ [RATE LIMIT] {username}: Slow down!")
+                self.consecutive_errors += 1
+                
+            else:
+                self.report(username, "ERROR", f"⚠️ [ERROR] {username}: Status {response.status_code}")
+                self.consecutive_errors += 1
+                
+        except requests.exceptions.Timeout:
+            self.consecutive_errors += 1
+            self.report(username, "ERROR", f"⏱️ [TIMEOUT] {username}")
+            
+        except Exception as e:
+            self.consecutive_errors += 1
+            if self.debug:
+                error_msg = traceback.format_exc()
+                self.report(username, "ERROR", f"⚠️ [ERROR] {username}:\n{error_msg}")
+            else:
+                error_msg = str(e)
+                self.report(username, "ERROR", f"⚠️ [ERROR] {username}: {error_msg}")
+
+    def create_account(self, username):
+        """Create a Roblox account using DrissionPage"""
+        if not DRISSION_AVAILABLE:
+            self.update.emit(f"[DEBUG] DrissionPage not available")
+            return False
+        
+        chrome = None
+        try:
+            co = ChromiumOptions()
+            co.set_argument("--lang", "en")
+            co.auto_port().mute(True)
+            # Browser must be visible to properly detect redirects
+            
+            if self.debug:
+                self.update.emit(f"[DEBUG] Initializing browser for {username}")
+            
+            chrome = Chromium(addr_or_opts=co)
+            page = chrome.latest_tab
+            
+            if self.debug:
+                self.update.emit(f"[DEBUG] Navigating to signup page")
+            
+            # Navigate to signup page
+            page.get("https://www.roblox.com/CreateAccount")
+            
+            # Accept cookies if present
+            try:
+                page.ele('@class=btn-cta-lg cookie-btn btn-primary-md btn-min-width', timeout=3).click()
+                if self.debug:
+                    self.update.emit(f"[DEBUG] Accepted cookies")
+            except:
+                if self.debug:
+                    self.update.emit(f"[DEBUG] No cookie banner found")
+            
+            # Set birthday (random adult age)
+            from datetime import datetime
+            import locale
+            import time
+            
+            if self.debug:
+                self.update.emit(f"[DEBUG] Setting birthday")
+            
+            bdaymonthelement = page.ele("#MonthDropdown", timeout=10)
+            oldLocale = locale.getlocale(locale.LC_TIME)
+            try:
+                locale.setlocale(locale.LC_TIME, 'C')
+                currentMonth = datetime.now().strftime("%b")
+            finally:
+                try:
+                    locale.setlocale(locale.LC_TIME, oldLocale)
+                except:
+                    pass
+            
+            bdaymonthelement.select.by_value(currentMonth)
+            
+            bdaydayelement = page.ele("#DayDropdown", timeout=10)
+            currentDay = datetime.now().day
+            if currentDay <= 9:
+                bdaydayelement.select.by_value(f"0{currentDay}")
+            else:
+                bdaydayelement.select.by_value(str(currentDay))
+            
+            currentYear = datetime.now().year - 19
+            page.ele("#YearDropdown", timeout=10).select.by_value(str(currentYear))
+            
+            if self.debug:
+                self.update.emit(f"[DEBUG] Entering credentials")
+            
+            # Enter username and password
+            page.ele("#signup-username", timeout=10).input(username)
+            time.sleep(0.5)
+            page.ele("#signup-password", timeout=10).input(self.signup_password)
+            
+            # Wait a moment
+            time.sleep(2)
+            
+            # Accept terms
+            try:
+                checkbox = page.ele('@@id=signup-checkbox@@class=checkbox', timeout=3)
+                checkbox.click()
+                if self.debug:
+                    self.update.emit(f"[DEBUG] Accepted terms checkbox")
+            except:
+                # Try alternative checkbox selector
+                try:
+                    checkbox = page.ele('#signup-checkbox', timeout=2)
+                    checkbox.click()
+                    if self.debug:
+                        self.update.emit(f"[DEBUG] Accepted terms checkbox (alt method)")
+                except:
+                    if self.debug:
+                        self.update.emit(f"[DEBUG] Terms checkbox not required or already checked")
+                    pass
+            
+            time.sleep(1)
+            
+            if self.debug:
+                self.update.emit(f"[DEBUG] Submitting signup form")
+            
+            # Submit signup
+            page.ele("@@id=signup-button@@name=signupSubmit", timeout=10).click()
+            
+            # Wait longer and check for errors
+            time.sleep(8)
+            
+            # Check for error messages
+            try:
+                error_element = page.ele(".text-error", timeout=2)
+                if error_element:
+                    error_text = error_element.text
+                    self.update.emit(f"⚠️ [SIGNUP ERROR] {username}: {error_text}")
+                    if chrome:
+                        chrome.quit()
+                    return False
+            except:
+                pass
+            
+            # Check current URL
+            current_url = page.url
+            if self.debug:
+                self.update.emit(f"[DEBUG] Current URL: {current_url}")
+            
+            # Check if we're redirected to home (success)
+            if "home" in current_url.lower() or "/home" in current_url:
+                if self.debug:
+                    self.update.emit(f"[DEBUG] Successfully created account, getting cookies")
+                
+                # Get cookies
+                cookies = []
+                for cookie in page.cookies():
+                    cookies.append({
+                        "name": cookie["name"],
+                        "value": cookie["value"]
+                    })
+                
+                # Save account
+                account_data = {
+                    "username": username,
+                    "password": self.signup_password,
+                    "cookies": cookies,
+                    "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                }
+                self.created_accounts.append(account_data)
+                
+                # Save to file
+                self.save_account(account_data)
+                
+                if chrome:
+                    chrome.quit()
+                return True
+            else:
+                # Check if there's a captcha
+                try:
+                    captcha = page.get_frame('xpath://*[@id="arkose-iframe"]')
+                    if captcha:
+                        self.update.emit(f"⚠️ [CAPTCHA] {username}: Captcha detected, cannot auto-complete")
+                except:
+                    pass
+                
+                if self.debug:
+                    self.update.emit(f"[DEBUG] Signup did not redirect to home page")
+                
+                if chrome:
+                    chrome.quit()
+                return False
+                
+        except Exception as e:
+            error_msg = str(e)
+            if self.debug:
+                error_msg = traceback.format_exc()
+            self.update.emit(f"⚠️ [SIGNUP ERROR] {username}: {error_msg}")
+            try:
+                if chrome:
+                    chrome.quit()
+            except:
+                pass
+            return False
+    
+    def save_account(self, account_data):
+        """Save created account to files"""
+        # Save to accounts.txt
+        self.save_hit("auto_created_accounts.txt", f"Username: {account_data['username']}, Password: {account_data['password']} (Created: {account_data['created_at']})")
+        
+        # One JSON object per line with its cookies, appended rather than rewriting the whole file
+        self.save_hit("auto_created_cookies.jsonl", account_data)
+
+    def send_to_discord(self, username):
+        """Queue the available username for the Discord webhook"""
+        self.post_webhook(username, {
+            "title": "🎮 Available Roblox Username Found!",
+            "description": f"**Username:** `{username}`",
+            "color": 3447003,
+            "fields": [
+                {
+                    "name": "🔗 Direct Link",
+                    "value": f"https://www.roblox.com/search/users?keyword={username}",
+                    "inline": False
+                }
+            ],
+            "footer": {
+                "text": "Roblox Username Checker"
+            }
+        })
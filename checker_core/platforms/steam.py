@@ -0,0 +1,299 @@
+import requests, time, traceback
+from checker_core.adaptive import AdaptiveLimiter, retry_after
+from checker_core.base import BaseChecker
+
+
+COMMUNITY_URL = "https://steamcommunity.com"
+API_URL = "https://api.steampowered.com"
+PERSONA_STATES = {0: "offline", 1: "online", 2: "busy", 3: "away", 4: "snooze", 5: "looking to trade", 6: "looking to play"}
+
+
+class SteamChecker(BaseChecker):
+    platform = "steam"
+
+    BATCH_SIZE = 100  # GetPlayerSummaries takes up to 100 SteamID64s per call
+    BATCH_RETRIES = 3
+
+    def __init__(self, steam_ids, webhook_url=None, debug=False, api_key=None, api_url=API_URL):
+        super().__init__()
+        self.steam_ids = steam_ids
+        self.webhook_url = webhook_url
+        self.debug = debug
+        self.api_key = api_key
+        self.api_url = api_url.rstrip("/")
+        self.chunk_size = self.BATCH_SIZE if api_key else 0
+        self.limiter = AdaptiveLimiter(5.0)  # starts at the old 0.2 s gap and adapts from there
+
+    def run(self):
+        if self.api_key:
+            self.run_api()
+            return
+        for i, steam_id in enumerate(self.fresh(self.steam_ids)):
+            if not self.running:
+                break
+            self.check_steam_id(steam_id)
+            self.count += 1
+            self.pupdate.emit(self.count)
+
+    def check_one(self, steam_id):
+        """Check a single name (used by the multi-platform engine)."""
+        steam_id = steam_id.strip()
+        if not self.api_key:
+            self.check_steam_id(steam_id)
+        elif self.is_steam_id64(steam_id):
+            self.check_batch([steam_id])
+        else:
+            self.check_vanity(steam_id)
+
+    def check_many(self, steam_ids):
+        """Web API mode for a chunk of IDs (used by the multi-platform engine)."""
+        steam_ids = [steam_id.strip() for steam_id in steam_ids]
+        batch = [steam_id for steam_id in steam_ids if self.is_steam_id64(steam_id)]
+        if batch:
+            self.check_batch(batch)
+        for steam_id in steam_ids:
+            if not self.is_steam_id64(steam_id):
+                self.check_vanity(steam_id)
+
+    @staticmethod
+    def is_steam_id64(steam_id):
+        return steam_id.isdigit() and len(steam_id) == 17
+
+    def run_api(self):
+        """Web API mode: SteamID64s go BATCH_SIZE per GetPlayerSummaries call, custom IDs through ResolveVanityURL."""
+        batch = []
+        for steam_id in self.fresh(self.steam_ids):
+            if not self.running:
+                break
+            steam_id = steam_id.strip()
+            if self.is_steam_id64(steam_id):
+                batch.append(steam_id)
+                if len(batch) == self.BATCH_SIZE:
+                    self.check_batch(batch)
+                    batch = []
+            else:
+                self.check_vanity(steam_id)
+                self.count += 1
+                self.pupdate.emit(self.count)
+        if batch and self.running:
+            self.check_batch(batch)
+
+    def check_batch(self, steam_ids):
+        rate_limited = False
+        for attempt in range(self.BATCH_RETRIES):
+            if not self.running:
+                return
+            try:
+                if self.debug:
+                    self.update.emit(f"\n{'='*60}")
+                    self.update.emit(f"[DEBUG] Checking batch of {len(steam_ids)}: {steam_ids[0]} ... {steam_ids[-1]}")
+
+                self.limiter.pace_sync()
+                response = self.http.get(f"{self.api_url}/ISteamUser/GetPlayerSummaries/v2/",
+                                         params={"key": self.api_key, "steamids": ",".join(steam_ids)}, timeout=15)
+
+                if self.debug:
+                    self.update.emit(f"[DEBUG] Status Code: {response.status_code}")
+
+                if response.status_code == 200:
+                    # Only existing accounts come back
+                    found = {p.get("steamid"): p for p in response.json().get("response", {}).get("players", [])}
+                    for steam_id in steam_ids:
+                        player = found.get(steam_id)
+                        if player is None:
+                            self.report(steam_id, "AVAILABLE", f"[AVAILABLE] {steam_id}", http_status=response.status_code)
+                            if self.webhook_url:
+                                self.send_to_discord(steam_id)
+                        else:
+                            state = "in-game" if player.get("gameid") else PERSONA_STATES.get(player.get("personastate"), "offline")
+                            self.report(steam_id, "TAKEN", f"[TAKEN] {steam_id} | Name: {player.get('personaname')} | Status: {state}",
+                                        http_status=response.status_code)
+                    self.limiter.success()
+                    break
+
+                elif response.status_code == 429:
+                    rate_limited = True
+                    wait = self.limiter.backoff(retry_after(response.headers))  # next pace_sync() waits it out
+                    self.update.emit(f"[RATE LIMIT] Batch of {len(steam_ids)}: waiting {wait:.0f}s ({self.limiter.describe()})...")
+
+                else:
+                    reason = "API key rejected" if response.status_code in (401, 403) else f"HTTP {response.status_code}"
+                    for steam_id in steam_ids:
+                        self.report(steam_id, "ERROR", f"[ERROR] {steam_id}: {reason}", http_status=response.status_code)
+                    break
+
+            except Exception as e:
+                rate_limited = False
+                self.update.emit(f"[ERROR] Batch of {len(steam_ids)}: {str(e)[:80]}")
+                time.sleep(2)
+        else:
+            for steam_id in steam_ids:
+                if rate_limited:
+                    self.report(steam_id, "RATE_LIMITED", f"[RATE LIMIT] {steam_id}: batch still limited after {self.BATCH_RETRIES} attempts")
+                else:
+                    self.report(steam_id, "ERROR", f"[ERROR] {steam_id}: batch failed after {self.BATCH_RETRIES} attempts")
+
+        self.count += len(steam_ids)
+        self.pupdate.emit(self.count)
+
+    def check_vanity(self, steam_id):
+        """A custom ID through ResolveVanityURL: a few bytes of JSON instead of the XML profile."""
+        if not self.running:
+            return
+
+        try:
+            if self.debug:
+                self.update.emit(f"\n{'='*60}")
+                self.update.emit(f"[DEBUG] Resolving: {steam_id}")
+
+            self.limiter.pace_sync()
+            response = self.http.get(f"{self.api_url}/ISteamUser/ResolveVanityURL/v1/",
+                                     params={"key": self.api_key, "vanityurl": steam_id}, timeout=10)
+            latency = response.elapsed.total_seconds()
+
+            if self.debug:
+                self.update.emit(f"[DEBUG] Status Code: {response.status_code}")
+
+            if response.status_code == 200:
+                self.limiter.success()
+                result = response.json().get("response", {})
+                if result.get("success") == 1:
+                    self.report(steam_id, "TAKEN", f"[TAKEN] {steam_id} | SteamID64: {result.get('steamid')}",
+                                http_status=response.status_code, latency=latency)
+                elif result.get("success") == 42:   # k_EResultNoMatch
+                    self.report(steam_id, "AVAILABLE", f"[AVAILABLE] {steam_id}", http_status=response.status_code, latency=latency)
+                    if self.webhook_url:
+                        self.send_to_discord(steam_id)
+                else:
+                    self.report(steam_id, "UNCLEAR", f"[UNKNOWN] {steam_id}: {result.get('message', result.get('success'))}",
+                                http_status=response.status_code, latency=latency)
+
+            elif response.status_code == 429:
+                paused = self.limiter.backoff(retry_after(response.headers))
+                self.report(steam_id, "RATE_LIMITED", f"[RATE LIMIT] {steam_id} (pausing {paused:.0f}s, now {self.limiter.describe()})",
+                            http_status=response.status_code, latency=latency)
+
+            else:
+                reason = "API key rejected" if response.status_code in (401, 403) else f"HTTP {response.status_code}"
+                self.report(steam_id, "ERROR", f"[ERROR] {steam_id}: {reason}", http_status=response.status_code, latency=latency)
+
+        except requests.exceptions.Timeout:
+            self.report(steam_id, "ERROR", f"[TIMEOUT] {steam_id}")
+        except Exception as e:
+            if self.debug:
+                self.report(steam_id, "ERROR", f"[ERROR] {steam_id}:\n{traceback.format_exc()}")
+            else:
+                self.report(steam_id, "ERROR", f"[ERROR] {steam_id}: {e}")
+
+    def check_steam_id(self, steam_id):
+        if not self.running:
+            return
+
+        try:
+            steam_id = steam_id.strip()
+            
+            if self.debug:
+                self.update.emit(f"\n{'='*60}")
+                self.update.emit(f"[DEBUG] Checking: {steam_id}")
+            
+            # Handle both custom IDs and SteamID64
+            if steam_id.isdigit() and len(steam_id) == 17:
+                profile_url = f"{COMMUNITY_URL}/profiles/{steam_id}/?xml=1"
+            else:
+                profile_url = f"{COMMUNITY_URL}/id/{steam_id}/?xml=1"
+            
+            if self.debug:
+                self.update.emit(f"[DEBUG] XML URL: {profile_url}")
+            
+            try:
+                self.limiter.pace_sync()
+                response = self.http.get(profile_url, timeout=10)
+                
+                if self.debug:
+                    self.update.emit(f"[DEBUG] Status Code: {response.status_code}")
+                
+                if response.status_code != 429:
+                    self.limiter.success()
+                
+                if response.status_code == 200:
+                    xml_text = response.text
+                    
+                    if "<e>" in xml_text.lower() or "the specified profile could not be found" in xml_text.lower():
+                        self.report(steam_id, "AVAILABLE", f"[AVAILABLE] {steam_id}", http_status=response.status_code, latency=response.elapsed.total_seconds())
+                        
+                        # Send to webhook when ID is available
+                        if self.webhook_url:
+                            self.send_to_discord(steam_id)
+                        return
+                    
+                    # Profile exists - extract minimal information
+                    persona_name = self.extract_xml_tag(xml_text, "steamID")
+                    is_online = self.extract_xml_tag(xml_text, "onlineState")
+                    
+                    # Simple one-line output
+                    result = f"[TAKEN] {steam_id} | Name: {persona_name} | Status: {is_online}"
+                    self.report(steam_id, "TAKEN", result, http_status=response.status_code, latency=response.elapsed.total_seconds())
+                    
+                    return
+                
+                elif response.status_code == 429:
+                    paused = self.limiter.backoff(retry_after(response.headers))
+                    self.report(steam_id, "RATE_LIMITED", f"[RATE LIMIT] {steam_id} (pausing {paused:.0f}s, now {self.limiter.describe()})", http_status=response.status_code, latency=response.elapsed.total_seconds())
+                    
+                elif response.status_code == 403:
+                    self.report(steam_id, "PRIVATE", f"[PRIVATE] {steam_id}", http_status=response.status_code, latency=response.elapsed.total_seconds())
+                    
+                else:
+                    self.report(steam_id, "ERROR", f"[ERROR] {steam_id}: HTTP {response.status_code}", http_status=response.status_code, latency=response.elapsed.total_seconds())
+                    
+            except requests.exceptions.Timeout:
+                self.report(steam_id, "ERROR", f"[TIMEOUT] {steam_id}")
+                
+        except Exception as e:
+            if self.debug:
+                error_msg = traceback.format_exc()
+                self.report(steam_id, "ERROR", f"[ERROR] {steam_id}:\n{error_msg}")
+            else:
+                error_msg = str(e)
+                self.report(steam_id, "ERROR", f"[ERROR] {steam_id}: {error_msg}")
+
+    def extract_xml_tag(self, xml_text, tag_name):
+        try:
+            start_tag = f"<{tag_name}>"
+            end_tag = f"</{tag_name}>"
+            
+            start_idx = xml_text.find(start_tag)
+            if start_idx == -1:
+                start_tag = f"<{tag_name}><![CDATA["
+                end_tag = f"]]></{tag_name}>"
+                start_idx = xml_text.find(start_tag)
+            
+            if start_idx != -1:
+                end_idx = xml_text.find(end_tag, start_idx)
+                if end_idx != -1:
+                    content = xml_text[start_idx + len(start_tag):end_idx]
+                    return content.strip()
+            return None
+        except:
+            return None
+
+    def send_to_discord(self, steam_id):
+        self.post_webhook(steam_id, {
+            "title": "Available Steam ID Found!",
+            "color": 65280,
+            "fields": [
+                {
+                    "name": "Available ID",
+                    "value": f"`{steam_id}`",
+                    "inline": True
+                },
+                {
+                    "name": "Direct Link",
+                    "value": f"https://steamcommunity.com/id/{steam_id}",
+                    "inline": False
+                }
+            ],
+            "footer": {
+                "text": "Steam ID Checker"
+            }
+        })
@@ -0,0 +1,428 @@
+import aiohttp, asyncio, re, json
+from checker_core.base import BaseChecker
+from checker_core.adaptive import AdaptiveLimiter, retry_after
+from checker_core.pipeline import run_pool
+from checker_core.streaming import read_until
+
+
+# TikTok embeds the whole profile as JSON in one of these <script> tags
+DATA_SCRIPT_IDS = ('id="__UNIVERSAL_DATA_FOR_REHYDRATION__"', 'id="SIGI_STATE"')
+NOT_FOUND_CODES = (10202, 10221)  # statusCode TikTok uses for "user not found"
+
+TITLE_RE = re.compile(r'<title>([^<]+)</title>', re.IGNORECASE)
+OG_URL_RE = re.compile(r'<meta[^>]*property="og:url"[^>]*content="([^"]*)"', re.IGNORECASE)
+
+# Fallback for pages without a data blob: every JSON key we care about in one pass
+KEY_RE = re.compile(r'"(id|userId|uid|uniqueId|followerCount|fans|followingCount|following|videoCount|video'
+                    r'|signature|avatarLarger|avatarThumb|verified|privateAccount|statusCode)"[:\s]*("[^"]*"|\w+)')
+FOLLOWERS_HTML_RE = re.compile(r'data-e2e="followers-count"[^>]*>[0-9.KMB]+</strong>')
+KEY_SIGNALS = {'id': 'has_user_id', 'userId': 'has_user_id', 'uid': 'has_user_id',
+               'followerCount': 'has_follower_count', 'fans': 'has_follower_count',
+               'followingCount': 'has_following_count', 'following': 'has_following_count',
+               'videoCount': 'has_video_count', 'video': 'has_video_count'}
+NOT_FOUND_TEXT = ("couldn't find this account", "user not found", "page not found", "this account cannot be found")
+PRIVATE_TEXT = ("private account", "this account is private")
+
+
+def page_data(body):
+    """The page's embedded state JSON as (source, data), or (None, None)."""
+    for marker in DATA_SCRIPT_IDS:
+        i = body.find(marker)
+        if i == -1:
+            continue
+        start = body.find(">", i) + 1
+        end = body.find("</script>", start)
+        if start and end != -1:
+            try:
+                return marker[4:-1], json.loads(body[start:end])
+            except ValueError:
+                pass
+    return None, None
+
+
+def profile_loaded():
+    """A read_until() check that is True once the page's data blob has arrived in full - all classify_profile needs.
+
+    Each piece is searched together with the end of the one before, so a
+    marker split across two chunks is still found, and where the blob
+    starts is remembered rather than searched for again.
+    """
+    overlap = max(len(marker) for marker in DATA_SCRIPT_IDS)
+    state = {"tail": "", "in_blob": False}
+
+    def done(piece):
+        text = state["tail"] + piece
+        if not state["in_blob"]:
+            starts = [i for i in (text.find(marker) for marker in DATA_SCRIPT_IDS) if i != -1]
+            if not starts:
+                state["tail"] = text[-overlap:]
+                return False
+            state["in_blob"] = True
+            text = text[min(starts):]
+        if "</script>" in text:
+            return True
+        state["tail"] = text[-len("</script>"):]
+        return False
+    return done
+
+
+def user_from_data(data, username):
+    """(user, stats, statusCode) from either blob layout."""
+    scope = data.get("__DEFAULT_SCOPE__", {}).get("webapp.user-detail")
+    if scope is not None:
+        info = scope.get("userInfo") or {}
+        return info.get("user") or {}, info.get("stats") or {}, scope.get("statusCode")
+    module = data.get("UserModule") or {}
+    users, stats = module.get("users") or {}, module.get("stats") or {}
+    key = username if username in users else next(iter(users), None)
+    return users.get(key) or {}, stats.get(key) or {}, (data.get("UserPage") or {}).get("statusCode")
+
+
+def profile_signals(body, username):
+    """Every profile signal the TikTok verdict needs, from a single read of the page.
+
+    Returns (signals, found_not_found, title, source). Signals come from the
+    embedded state JSON when there is one, otherwise from one KEY_RE pass.
+    """
+    signals = dict.fromkeys(('has_user_id', 'has_follower_count', 'has_following_count', 'has_video_count',
+                             'has_verified_badge', 'has_signature', 'has_avatar', 'has_username_in_data',
+                             'has_seo_data', 'has_private_account'), False)
+    source, data = page_data(body)
+    if data is not None:
+        user, stats, status_code = user_from_data(data, username)
+        user_id = str(user.get("id") or "")
+        signals['has_user_id'] = user_id.isdigit() and len(user_id) >= 10
+        signals['has_username_in_data'] = str(user.get("uniqueId") or "").lower() == username.lower()
+        signals['has_follower_count'] = "followerCount" in stats
+        signals['has_following_count'] = "followingCount" in stats
+        signals['has_video_count'] = "videoCount" in stats
+        signals['has_verified_badge'] = user.get("verified") is True
+        signals['has_signature'] = bool(user.get("signature"))
+        signals['has_avatar'] = any(str(user.get(k) or "").startswith("https://") for k in ("avatarLarger", "avatarThumb"))
+        private = user.get("privateAccount") is True
+        found_not_found = status_code in NOT_FOUND_CODES
+    else:
+        source, private, found_not_found = "page scan", False, False
+        for m in KEY_RE.finditer(body):
+            key, value = m.groups()
+            if key in KEY_SIGNALS:
+                if key in ('id', 'userId', 'uid'):
+                    if value[1:-1].isdigit() and len(value) >= 12:
+                        signals['has_user_id'] = True
+                elif value.isdigit():
+                    signals[KEY_SIGNALS[key]] = True
+            elif key == 'uniqueId':
+                if value[1:-1].lower() == username.lower():
+                    signals['has_username_in_data'] = True
+            elif key == 'signature':
+                signals['has_signature'] = signals['has_signature'] or len(value) > 2
+            elif key in ('avatarLarger', 'avatarThumb'):
+                signals['has_avatar'] = signals['has_avatar'] or value.startswith('"https://')
+            elif value == 'true':
+                if key == 'verified':
+                    signals['has_verified_badge'] = True
+                elif key == 'privateAccount':
+                    private = True
+            elif key == 'statusCode' and value.isdigit() and int(value) in NOT_FOUND_CODES:
+                found_not_found = True
+        if 'verified-icon' in body:
+            signals['has_verified_badge'] = True
+        if FOLLOWERS_HTML_RE.search(body):
+            signals['has_follower_count'] = True
+        # Rendered messages vary in case; one lowered copy serves all of them
+        text = body.lower()
+        found_not_found = found_not_found or any(t in text for t in NOT_FOUND_TEXT)
+        private = private or any(t in text for t in PRIVATE_TEXT)
+
+    # Title and OpenGraph tags live in <head>; TikTok includes them even for private accounts
+    head_end = body.find("</head>")
+    head_end = len(body) if head_end == -1 else head_end
+    og_url = OG_URL_RE.search(body, 0, head_end)
+    if og_url and f"@{username.lower()}" in og_url.group(1).lower():
+        signals['has_seo_data'] = True
+    title_match = TITLE_RE.search(body, 0, head_end)
+    title = title_match.group(1) if title_match else None
+    if title and username.lower() in title.lower() and title.lower() != 'tiktok':
+        signals['has_seo_data'] = True
+
+    # "This account is private" is also shown for names that don't exist, so only
+    # trust it when something else says the account is real
+    if private and (signals['has_user_id'] or signals['has_username_in_data'] or signals['has_follower_count']):
+        signals['has_private_account'] = True
+    return signals, found_not_found, title, source
+
+
+def classify_profile(body, username):
+    """Verdict for a profile page that wasn't a redirect.
+
+    Returns (status, reason, signals, found_not_found, source) with status one of
+    AVAILABLE, TAKEN or UNCLEAR.
+    """
+    signals, found_not_found, title, source = profile_signals(body, username)
+    signal_count = sum(signals.values())
+
+    def verdict(status, reason):
+        return status, reason, signals, found_not_found, source
+
+    # PRIORITY 1: Check for REAL user data (strongest signals)
+    if signals['has_user_id'] and signals['has_username_in_data'] and signals['has_follower_count']:
+        kind = "private account" if signals['has_private_account'] else "public account"
+        return verdict("TAKEN", f"{kind} with confirmed data")
+    if signals['has_private_account'] and (signals['has_user_id'] or signals['has_follower_count']):
+        return verdict("TAKEN", "private account - exists but hidden")
+    if signals['has_seo_data'] and signal_count >= 2:
+        return verdict("TAKEN", "SEO data + profile signals")
+    if signals['has_username_in_data'] and signals['has_user_id']:
+        return verdict("TAKEN", "username + user_id confirmed")
+    if signal_count >= 4:
+        return verdict("TAKEN", f"{signal_count} strong signals")
+    if signals['has_follower_count'] + signals['has_following_count'] + signals['has_video_count'] >= 2:
+        return verdict("TAKEN", "engagement data present")
+
+    # PRIORITY 2: "not found" only counts when there's no real user data
+    if found_not_found and signal_count == 0:
+        return verdict("AVAILABLE", "not found + no profile data")
+    if found_not_found and signal_count == 1 and signals['has_private_account']:
+        return verdict("AVAILABLE", "generic error message, no real data")
+    if found_not_found and signal_count > 1:
+        return verdict("TAKEN", f"shows 'not found' but has {signal_count} real signals")
+
+    # Real profiles have the username in a "... | TikTok" title
+    if title and signal_count >= 1:
+        lowered = title.lower()
+        if (f'@{username}' in lowered or username in lowered) and 'tiktok' in lowered:
+            return verdict("TAKEN", f"title confirms + {signal_count} signals")
+
+    if signal_count <= 1:
+        return verdict("AVAILABLE", "no real profile data")
+    if signal_count <= 3 and not signals['has_username_in_data']:
+        return verdict("AVAILABLE", "only placeholder data")
+    return verdict("UNCLEAR", f"{signal_count} signals - manual check recommended")
+
+
+class TikTokChecker(BaseChecker):
+    platform = "tiktok"
+
+    BASE_URL = "https://tiktok.com/@{}"
+
+    def __init__(self, usernames, user_agent, debug=False, webhook_url=None, concurrency=2, interval=2.5):
+        super().__init__()
+        self.usernames = usernames
+        self.user_agent = user_agent
+        self.debug = debug
+        self.webhook_url = webhook_url
+        self.concurrency = max(1, concurrency)  # Requests in flight at once
+        self.interval = max(0.0, interval)  # Starting seconds between request starts (shared by all workers)
+        # Grows rate/concurrency while TikTok answers cleanly, halves them on 429s and blocks
+        self.limiter = AdaptiveLimiter(1 / self.interval if self.interval else 5.0, self.concurrency)
+        self.lock = None
+        self.consecutive_errors = 0  # Track errors in a row
+        self.max_errors_before_pause = 3  # Pause after 3 errors in a row
+        self.cooling_down = False
+
+    @staticmethod
+    def clean_username(line):
+        u = line.strip().lower()
+        if u.startswith('@'):
+            u = u[1:]
+        if u and u.replace('_', '').replace('.', '').isalnum():
+            return u
+        return None
+
+    def run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self.main())
+        finally:
+            loop.close()
+
+    async def check_user(self, username, session, lock, idx):
+        if not self.running:
+            return
+
+        retries = 2  # Try up to 2 times
+        for attempt in range(retries):
+            try:
+                url = self.BASE_URL.format(username)
+                await self.limiter.pace()
+                
+                with self.proxied() as proxy:
+                    async with session.get(url, allow_redirects=True, timeout=20, proxy=proxy) as resp:
+                        status = resp.status
+                        if status == 429 and proxy:
+                            self.proxy_pool.rate_limited(proxy, retry_after(resp.headers))
+                    
+                        # Debug mode - show raw indicators
+                        if self.debug:
+                            self.update.emit(f"\n{'='*60}")
+                            self.update.emit(f"[DEBUG] Checking: {username}")
+                            self.update.emit(f"[DEBUG] Status Code: {status}")
+                            self.update.emit(f"[DEBUG] Final URL: {resp.url}")
+                    
+                        # ===== CLEAR SIGNALS =====
+                    
+                        # 1. Rate limited
+                        if status == 429:
+                            paused = self.limiter.backoff(retry_after(resp.headers))  # Pause every worker, not just this one
+                            self.report(username, "RATE_LIMITED", f"⚠️ [RATE LIMIT] {username}: Slow down! Pausing {paused:.0f}s, now {self.limiter.describe()}", http_status=status, attempts=attempt + 1)
+                            return
+                    
+                        # 2. Blocked or forbidden
+                        if status in [403]:
+                            self.limiter.backoff(retry_after(resp.headers))
+                            self.report(username, "BLOCKED", f"⚠️ [BLOCKED] {username}: Status {status} - Try VPN or wait", http_status=status, attempts=attempt + 1)
+                            return
+                    
+                        self.limiter.success()
+                    
+                        # 3. Check if redirected (TikTok redirects invalid usernames)
+                        final_url = str(resp.url).lower()
+                        if username.lower() not in final_url:
+                            if self.debug:
+                                self.update.emit(f"[DEBUG] Redirected away from username - likely available")
+                            self.report(username, "AVAILABLE", f"✅ [AVAILABLE] {username} (redirected)", http_status=status, attempts=attempt + 1)
+                            if self.webhook_url:
+                                self.send_to_discord(username)
+                            return
+                    
+                        # Read the response, but only until the profile data has arrived
+                        try:
+                            body, complete = await read_until(resp, profile_loaded())
+                        except Exception:
+                            self.report(username, "ERROR", f"⚠️ [ERROR] {username}: Could not read response", http_status=status, attempts=attempt + 1)
+                            return
+                    
+                        if self.debug:
+                            self.update.emit(f"[DEBUG] Body Length: {len(body)} chars" + ("" if complete else " (stopped once the profile data arrived)"))
+                    
+                        # ===== ANALYZE BODY CONTENT =====
+                    
+                        verdict, reason, signals, found_not_found, source = classify_profile(body, username)
+                    
+                        if self.debug:
+                            self.update.emit(f"[DEBUG] Read profile from: {source}")
+                            self.update.emit(f"[DEBUG] Profile signals found: {sum(signals.values())}/10")
+                            self.update.emit(f"[DEBUG] Signals: {signals}")
+                            self.update.emit(f"[DEBUG] 'Not found' message present: {found_not_found}")
+                    
+                        if verdict == "AVAILABLE":
+                            self.report(username, "AVAILABLE", f"✅ [AVAILABLE] {username} ({reason})", http_status=status, attempts=attempt + 1)
+                            if self.webhook_url:
+                                self.send_to_discord(username)
+                            return
+                        if verdict == "TAKEN":
+                            self.report(username, "TAKEN", f"❌ [TAKEN] {username} ({reason})", http_status=status, attempts=attempt + 1)
+                            return
+                    
+                        # Unclear - needs manual check
+                        self.report(username, "UNCLEAR", f"❓ [UNCLEAR] {username} ({reason})", http_status=status, attempts=attempt + 1)
+                        if self.debug:
+                            self.update.emit(f"[DEBUG] URL for manual check: {url}")
+                    
+                        # Success - reset error counter
+                        self.consecutive_errors = 0
+                        break
+
+            except aiohttp.ClientConnectorError:
+                self.consecutive_errors += 1
+                if attempt < retries - 1:
+                    if self.debug:
+                        self.update.emit(f"[DEBUG] Connection failed, retrying {username}...")
+                    await asyncio.sleep(3)
+                    continue
+                else:
+                    self.report(username, "ERROR", f"⚠️ [CONNECTION ERROR] {username}: Cannot reach TikTok")
+                    await self.check_for_cooldown()
+
+            except asyncio.TimeoutError:
+                self.consecutive_errors += 1
+                if attempt < retries - 1:
+                    if self.debug:
+                        self.update.emit(f"[DEBUG] Timeout, retrying {username}...")
+                    await asyncio.sleep(2)
+                    continue
+                else:
+                    self.report(username, "ERROR", f"⏱️ [TIMEOUT] {username}")
+                    await self.check_for_cooldown()
+
+            except Exception as e:
+                self.consecutive_errors += 1
+                error_msg = str(e)[:80]
+                # Check if it's a DNS/connection issue
+                if 'nodename nor servname' in error_msg or 'ssl' in error_msg.lower() or 'connect' in error_msg.lower():
+                    self.report(username, "ERROR", f"⚠️ [CONNECTION ERROR] {username}: TikTok blocked or network issue")
+                    await self.check_for_cooldown()
+                else:
+                    self.report(username, "ERROR", f"⚠️ [ERROR] {username}: {error_msg}")
+                break
+
+            finally:
+                async with lock:
+                    self.count += 1
+                self.pupdate.emit(self.count)
+
+    async def check_for_cooldown(self):
+        """Check if we need to pause due to consecutive errors"""
+        if self.consecutive_errors >= self.max_errors_before_pause and not self.cooling_down:
+            cooldown_time = 15  # 15 seconds
+            self.cooling_down = True
+            self.limiter.hold(cooldown_time)  # Stops every worker from starting new requests
+            self.update.emit(f"\n🛑 COOLDOWN: {self.consecutive_errors} errors in a row detected!")
+            self.update.emit(f"⏸️ Pausing for {cooldown_time} seconds to avoid being blocked...")
+            for remaining in range(cooldown_time, 0, -1):
+                if not self.running:  # Allow user to stop during cooldown
+                    break
+                self.update.emit(f"⏳ Resuming in {remaining} seconds...")
+                await asyncio.sleep(1)
+            self.update.emit(f"✅ Cooldown complete! Continuing...\n")
+            self.consecutive_errors = 0  # Reset counter after cooldown
+            self.cooling_down = False
+
+    def open_session(self):
+        headers = {
+            "User-Agent": self.user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+            "Upgrade-Insecure-Requests": "1",
+            "Sec-Fetch-Dest": "document",
+            "Sec-Fetch-Mode": "navigate",
+            "Sec-Fetch-Site": "none",
+            "Cache-Control": "max-age=0"
+        }
+        # Use custom DNS resolver to avoid DNS issues
+        connector = aiohttp.TCPConnector(
+            limit=self.limiter.max_concurrency,
+            ssl=False,  # Disable SSL verification if needed
+            family=0,  # Allow both IPv4 and IPv6
+            ttl_dns_cache=300
+        )
+        timeout = aiohttp.ClientTimeout(total=30, connect=15)
+        return aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout)
+
+    async def check_one(self, username, session):
+        """Check one name on a session from open_session() (used by the multi-platform engine)."""
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        await self.check_user(username, session, self.lock, self.count)
+
+    async def main(self):
+        lock = asyncio.Lock()
+        async with self.open_session() as session:
+            async def worker(i, username):
+                await self.check_user(username, session, lock, i)
+
+            await run_pool(self.fresh(self.usernames), worker, self.limiter.max_concurrency, None, lambda: self.running,
+                           on_error=lambda u, e: self.report(u, "ERROR", f"⚠️ [ERROR] {u}: {str(e)[:80]}"),
+                           limiter=self.limiter)
+
+    def send_to_discord(self, username):
+        self.post_webhook(username, {
+            "title": "Available TikTok Username Found!",
+            "description": f"**@{username}** is available!",
+            "color": 16711680,
+            "fields": [{"name": "Link", "value": f"https://tiktok.com/@{username}"}],
+            "footer": {"text": "TikTok Checker"}
+        })
@@ -0,0 +1,199 @@
+import asyncio, random, threading, time
+from contextlib import contextmanager
+
+from requests.adapters import HTTPAdapter
+
+from checker_core.adaptive import retry_after
+
+SCHEMES = ("http://", "https://", "socks5://")
+
+
+def parse_proxies(lines):
+    """The proxy URLs among `lines`; blank lines and anything without a known scheme are skipped."""
+    return [l.strip() for l in lines if l.strip().startswith(SCHEMES)]
+
+
+class ProxyStats:
+    __slots__ = ("url", "latency", "ok", "errors", "rate_limits", "strikes",
+                 "quarantines", "down_until", "cool_until", "probing")
+
+    def __init__(self, url):
+        self.url = url
+        self.latency = None      # moving average, seconds
+        self.ok = 0
+        self.errors = 0
+        self.rate_limits = 0
+        self.strikes = 0         # connection failures in a row
+        self.quarantines = 0     # times quarantined in a row; each doubles the next one
+        self.down_until = 0.0    # quarantined until then, probed once it passes
+        self.cool_until = 0.0    # 429'd: skipped until then, but not considered broken
+        self.probing = False     # a probe request is in flight after quarantine
+
+    def describe(self, now):
+        if self.down_until > now:
+            state = f"quarantined {self.down_until - now:.0f}s"
+        elif self.cool_until > now:
+            state = f"cooling {self.cool_until - now:.0f}s"
+        else:
+            state = "probing" if self.quarantines else "ok"
+        latency = f"{self.latency * 1000:.0f}ms" if self.latency is not None else "-"
+        return (f"{self.url:<40} {latency:>7}   ok {self.ok:>5}   errors {self.errors:>4}   "
+                f"429s {self.rate_limits:>4}   [{state}]")
+
+
+class ProxyPool:
+    """Proxies scored by how requests through them go, shared by every checker.
+
+    pick() favours fast proxies: each healthy one is chosen with weight
+    1/latency, scaled down by its share of errors and 429s. `key` makes the
+    choice sticky - a token or session keeps its proxy until that proxy
+    fails. STRIKES connection failures in a row quarantine a proxy for
+    QUARANTINE seconds, doubling each time it fails again; when that runs
+    out it is let back for one probe request before getting traffic again.
+    A 429 only rests the proxy for a while. Report outcomes with success(),
+    failure() and rate_limited(), or wrap the request in track(). Safe to
+    share between threads and coroutines.
+    """
+
+    ALPHA = 0.3            # weight of the newest latency sample
+    STRIKES = 2
+    QUARANTINE = 30.0
+    MAX_QUARANTINE = 600.0
+    COOLDOWN = 10.0        # rest after a 429 without Retry-After
+
+    def __init__(self, proxies):
+        self.stats = {url: ProxyStats(url) for url in dict.fromkeys(proxies)}
+        self.assigned = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.stats)
+
+    def __bool__(self):
+        return bool(self.stats)
+
+    def _weight(self, s, typical):
+        latency = s.latency if s.latency is not None else typical
+        tries = s.ok + s.errors + s.rate_limits
+        return (s.ok + 1) / (tries + 1) / max(latency, 0.05)
+
+    def pick(self, key=None):
+        """A proxy URL for the next request, or None if the pool is empty."""
+        now = time.monotonic()
+        with self._lock:
+            if not self.stats:
+                return None
+            current = self.stats.get(self.assigned.get(key)) if key is not None else None
+            if current is not None and current.down_until <= now and current.cool_until <= now and not current.probing:
+                return current.url
+            ready = [s for s in self.stats.values()
+                     if s.down_until <= now and s.cool_until <= now and not s.probing]
+            if not ready:
+                # Everything is resting: take whatever comes back first rather than stall
+                s = min(self.stats.values(), key=lambda s: max(s.down_until, s.cool_until))
+            else:
+                known = sorted(s.latency for s in ready if s.latency is not None)
+                typical = known[len(known) // 2] if known else 1.0   # untried proxies get a fair go
+                s = random.choices(ready, [self._weight(p, typical) for p in ready])[0]
+            if s.quarantines:
+                s.probing = True
+            if key is not None:
+                self.assigned[key] = s.url
+            return s.url
+
+    def delay(self):
+        """Seconds until some proxy may be picked again; 0 while one is ready."""
+        now = time.monotonic()
+        with self._lock:
+            if not self.stats:
+                return 0.0
+            return max(0.0, min(max(s.down_until, s.cool_until) for s in self.stats.values()) - now)
+
+    def release(self, key):
+        with self._lock:
+            self.assigned.pop(key, None)
+
+    def success(self, url, latency=None):
+        with self._lock:
+            s = self.stats.get(url)
+            if s is None:
+                return
+            s.ok += 1
+            s.strikes = 0
+            s.quarantines = 0
+            s.probing = False
+            if latency is not None:
+                s.latency = latency if s.latency is None else s.latency + self.ALPHA * (latency - s.latency)
+
+    def failure(self, url):
+        """The proxy couldn't be reached or timed out."""
+        now = time.monotonic()
+        with self._lock:
+            s = self.stats.get(url)
+            if s is None:
+                return
+            s.errors += 1
+            s.strikes += 1
+            if s.probing or s.strikes >= self.STRIKES:
+                s.down_until = now + min(self.MAX_QUARANTINE, self.QUARANTINE * 2 ** s.quarantines)
+                s.quarantines += 1
+                s.strikes = 0
+                s.probing = False
+
+    def settle(self, url):
+        with self._lock:
+            if url in self.stats:
+                self.stats[url].probing = False
+
+    def rate_limited(self, url, retry_after=None):
+        with self._lock:
+            s = self.stats.get(url)
+            if s is None:
+                return
+            s.rate_limits += 1
+            s.probing = False
+            s.cool_until = time.monotonic() + (retry_after if retry_after is not None else self.COOLDOWN)
+
+    @contextmanager
+    def track(self, url):
+        """Score one request through `url`: connection errors and timeouts count against the proxy.
+
+        Yields `url`. Call rate_limited() yourself on a 429 inside the block.
+        """
+        started = time.monotonic()
+        before = self.stats[url].rate_limits if url in self.stats else 0
+        try:
+            yield url
+        except (OSError, asyncio.TimeoutError):   # connection, proxy and timeout errors of requests and aiohttp
+            self.failure(url)
+            raise
+        except BaseException:
+            self.settle(url)   # not the proxy's fault, but a probe isn't in flight any more
+            raise
+        if url in self.stats and self.stats[url].rate_limits == before:
+            self.success(url, time.monotonic() - started)
+
+    def describe(self):
+        now = time.monotonic()
+        with self._lock:
+            return "\n".join(s.describe(now) for s in self.stats.values())
+
+
+class ProxyAdapter(HTTPAdapter):
+    """A requests adapter that sends every request through a proxy from `pool` and scores it."""
+
+    def __init__(self, pool, key=None, **kwargs):
+        super().__init__(**kwargs)
+        self.pool = pool
+        self.key = key
+
+    def send(self, request, **kwargs):
+        proxy = self.pool.pick(self.key)
+        if proxy is None:
+            return super().send(request, **kwargs)
+        kwargs["proxies"] = {"http": proxy, "https": proxy}
+        with self.pool.track(proxy):
+            response = super().send(request, **kwargs)
+            if response.status_code == 429:
+                self.pool.rate_limited(proxy, retry_after(response.headers))
+        return response
@@ -0,0 +1,96 @@
+import threading
+
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QTextCursor
+
+from checker_core import hits
+from checker_core.cache import ResultCache
+from checker_core.wordlist import Wordlist
+
+_cache = None
+
+
+def shared_cache():
+    """The GUI's ResultCache, opened on first use and kept for the life of the process."""
+    global _cache
+    if _cache is None:
+        _cache = ResultCache()
+    return _cache
+
+
+def append_lines(edit, lines):
+    """Add lines to the end of a QTextEdit without re-setting everything already in it."""
+    if not lines:
+        return
+    doc = edit.document()
+    cursor = QTextCursor(doc)
+    cursor.movePosition(QTextCursor.End)
+    sep = "" if doc.isEmpty() or not doc.lastBlock().text() else "\n"
+    cursor.insertText(sep + "\n".join(lines))
+
+
+def describe(names, noun="usernames"):
+    """Status text for a run: "12 usernames", or the file a Wordlist reads them from."""
+    if isinstance(names, Wordlist):
+        return f"{noun} from {names}"
+    return f"{len(names)} {noun}"
+
+
+def progress_max(names):
+    """Where the progress bar ends: the name count, or Wordlist.STEPS for a file read as it goes."""
+    if isinstance(names, Wordlist):
+        return Wordlist.STEPS
+    return len(names)
+
+
+class QtChecker(QThread):
+    """Runs a GUI-free checker on a QThread and re-emits its signals as Qt signals.
+
+    Results are collected on the worker thread and handed to the GUI as
+    lists, `results`, at most BATCH_MS apart, instead of one queued signal
+    per name. Unless `cache` is False the checker skips names checked
+    recently (see cache.py).
+    """
+    update = pyqtSignal(str)
+    pupdate = pyqtSignal(int)
+    results = pyqtSignal(list)
+
+    BATCH_MS = 100
+
+    def __init__(self, checker, cache=True):
+        super().__init__()
+        self.checker = checker
+        if cache and checker.cache is None:
+            checker.cache = shared_cache()
+        checker.update.connect(self.update.emit)
+        checker.pupdate.connect(self.pupdate.emit)
+        self.batch = []
+        self.batch_lock = threading.Lock()
+        checker.result.connect(self.collect)
+        self.batch_timer = QTimer(self)
+        self.batch_timer.setInterval(self.BATCH_MS)
+        self.batch_timer.timeout.connect(self.flush_results)
+        self.started.connect(self.batch_timer.start)
+        self.finished.connect(self.batch_timer.stop)
+        self.finished.connect(self.flush_results)
+
+    def collect(self, record):
+        with self.batch_lock:
+            self.batch.append(record)
+
+    def flush_results(self):
+        with self.batch_lock:
+            batch, self.batch = self.batch, []
+        if batch:
+            self.results.emit(batch)
+
+    def run(self):
+        try:
+            self.checker.run()
+        finally:
+            hits.flush_all()
+            if self.checker.cache is not None:
+                self.checker.cache.flush()
+
+    def stop(self):
+        self.checker.stop()
@@ -0,0 +1,62 @@
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Optional
+
+
+class Status(str, Enum):
+    """What a check found. A str subclass, so `status == "AVAILABLE"` keeps working."""
+    AVAILABLE = "AVAILABLE"
+    TAKEN = "TAKEN"
+    BANNED = "BANNED"
+    PRIVATE = "PRIVATE"
+    UNCLAIMABLE = "UNCLAIMABLE"
+    INVALID = "INVALID"
+    RESTRICTED = "RESTRICTED"
+    UNCLEAR = "UNCLEAR"
+    RATE_LIMITED = "RATE_LIMITED"
+    BLOCKED = "BLOCKED"
+    ERROR = "ERROR"
+
+    def __str__(self):
+        return self.value
+
+
+@dataclass
+class CheckResult:
+    """One finished username, as BaseChecker.result carries it.
+
+    `detail` is the checker's own log line for it; the fields a checker didn't
+    measure stay None. The line is only needed by whatever shows it - the
+    cache, the CLI's JSON and the webhooks read the fields.
+    """
+    platform: str
+    username: str
+    status: Status
+    detail: str = ""
+    http_status: Optional[int] = None
+    latency: Optional[float] = None    # seconds from request to response
+    attempts: int = 1
+    checked_at: float = field(default_factory=time.time)
+    cached: bool = False
+
+    def __post_init__(self):
+        self.status = Status(self.status)
+
+    @property
+    def text(self):
+        """The log line: the checker's own, or a plain one if it gave none."""
+        return self.detail or f"[{self.status}] {self.username}"
+
+    def to_dict(self):
+        record = {"platform": self.platform, "username": self.username, "status": self.status.value,
+                  "detail": self.text, "checked_at": round(self.checked_at, 3)}
+        if self.http_status is not None:
+            record["http_status"] = self.http_status
+        if self.latency is not None:
+            record["latency"] = round(self.latency, 3)
+        if self.attempts != 1:
+            record["attempts"] = self.attempts
+        if self.cached:
+            record["cached"] = True
+        return record
@@ -0,0 +1,28 @@
+import codecs
+
+CHUNK_SIZE = 16 * 1024
+
+
+async def read_until(resp, done, chunk_size=CHUNK_SIZE):
+    """Read an aiohttp response body only until `done(piece)` says enough.
+
+    `done` is called with each newly decoded piece in turn, so it only ever
+    looks at what's new; a check that needs context across pieces keeps its
+    own (see profile_loaded() in tiktok.py). Pieces are joined once at the
+    end. Returns (text, complete). When the read is cut short the connection
+    is closed instead of drained, so the rest of the page is never
+    downloaded and the slot frees up at once.
+    """
+    try:
+        decoder = codecs.getincrementaldecoder(resp.charset or "utf-8")(errors="ignore")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    parts = []
+    async for chunk in resp.content.iter_chunked(chunk_size):
+        piece = decoder.decode(chunk)
+        parts.append(piece)
+        if done(piece):
+            resp.close()
+            return "".join(parts), False
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts), True
@@ -0,0 +1,109 @@
+import atexit, queue, threading, time
+
+import requests
+
+from checker_core.adaptive import retry_after
+from checker_core.buckets import RateLimitBuckets
+
+_senders = {}
+_senders_lock = threading.Lock()
+
+
+class WebhookSender:
+    """Posts Discord webhook embeds from a background thread.
+
+    send() only queues the embed, so a hit never waits on Discord. The
+    thread packs up to MAX_EMBEDS queued embeds into one message, waiting
+    at most LINGER seconds for a first one to get company, paces itself by
+    the webhook's X-RateLimit-* headers and retries 429s and failures with
+    backoff. Each embed's `done(error)` callback runs on that thread once
+    the message is delivered (error None) or given up on.
+    """
+
+    MAX_EMBEDS = 10     # Discord's limit per message
+    LINGER = 1.0
+    MAX_ATTEMPTS = 5
+
+    def __init__(self, url):
+        self.url = url
+        self.queue = queue.Queue()
+        self.buckets = RateLimitBuckets()
+        self.session = requests.Session()
+        self.thread = threading.Thread(target=self.run, name="webhook-sender", daemon=True)
+        self.thread.start()
+
+    def send(self, embed, done=None):
+        self.queue.put((embed, done))
+
+    def run(self):
+        while True:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self.LINGER
+            while len(batch) < self.MAX_EMBEDS:
+                try:
+                    batch.append(self.queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            error = self.post([embed for embed, _ in batch])
+            for _, done in batch:
+                if done is not None:
+                    try:
+                        done(error)
+                    except Exception:
+                        pass
+                self.queue.task_done()
+
+    def post(self, embeds):
+        """Deliver one message; returns None on success, else why it was given up on."""
+        error = None
+        for attempt in range(self.MAX_ATTEMPTS):
+            self.buckets.acquire_sync(self.url)
+            try:
+                response = self.session.post(self.url, json={"embeds": embeds}, timeout=10)
+            except requests.RequestException as e:
+                error = str(e)[:80]
+                time.sleep(min(30, 2 ** attempt))
+                continue
+            if response.status_code == 429:
+                try:
+                    wait = float(response.json().get("retry_after"))
+                except (ValueError, TypeError, AttributeError):
+                    wait = retry_after(response.headers, 2.0)
+                self.buckets.update(self.url, response.headers, wait)
+                error = "rate limited"
+                continue
+            self.buckets.update(self.url, response.headers)
+            if response.status_code < 300:
+                return None
+            error = f"Status {response.status_code}"
+            if response.status_code < 500:
+                return error   # a bad embed or a deleted webhook won't get better by retrying
+            time.sleep(min(30, 2 ** attempt))
+        return error
+
+    def flush(self, timeout=None):
+        """Wait until everything queued so far has been delivered or given up on."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.queue.all_tasks_done.wait(remaining)
+        return True
+
+
+def sender(url):
+    """The process-wide WebhookSender for `url`, so checkers posting to one webhook share its rate limit."""
+    with _senders_lock:
+        if url not in _senders:
+            _senders[url] = WebhookSender(url)
+        return _senders[url]
+
+
+@atexit.register
+def flush_all(timeout=10.0):
+    """Give queued hits a chance to go out before the process exits."""
+    deadline = time.monotonic() + timeout
+    for s in list(_senders.values()):
+        s.flush(max(0.0, deadline - time.monotonic()))
@@ -0,0 +1,49 @@
+import os
+
+
+def human_size(n):
+    for unit in ("B", "KB", "MB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+
+class Wordlist:
+    """Names from a text file, read a line at a time as the checker asks for them.
+
+    For lists too big for the input box: nothing is loaded up front, so a
+    million-line file costs no more memory than a ten-line one. How many names
+    it holds isn't known until the end, so progress is how far into the file
+    reading has got: progress() counts up to STEPS.
+    """
+
+    STEPS = 1000
+    BOX_LIMIT = 1024 * 1024   # files bigger than this are streamed rather than pasted into the input box
+
+    def __init__(self, path, clean=None):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.clean = clean
+        self.size = os.path.getsize(path)
+        self.offset = 0
+
+    def __bool__(self):
+        return self.size > 0
+
+    def __iter__(self):
+        self.offset = 0
+        with open(self.path, "rb") as f:
+            for raw in f:
+                self.offset += len(raw)
+                line = raw.decode("utf-8", errors="ignore")
+                name = self.clean(line) if self.clean is not None else line.strip()
+                if name:
+                    yield name
+
+    def progress(self):
+        """How far into the file reading has got, from 0 to STEPS."""
+        return self.offset * self.STEPS // self.size if self.size else self.STEPS
+
+    def __str__(self):
+        return f"{self.name} ({human_size(self.size)})"
@@ -1,41 +1,25 @@
 import sys
 import os
 import re
-import json
-import random
-import string
-import asyncio
-import aiohttp
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QTextEdit, QPushButton, QGroupBox, QRadioButton,
     QComboBox, QCheckBox, QProgressBar, QFileDialog, QMessageBox
 )
-from PyQt5.QtCore import QThread, pyqtSignal, Qt
+from PyQt5.QtCore import pyqtSignal, Qt
 from PyQt5.QtGui import QFont
 
-VERSION = "V3.0 - Unauthed + Async"
-
-UNAUTHED_URL  = "https://discord.com/api/v9/unique-username/username-attempt-unauthed"
-AUTHED_URL    = "https://discord.com/api/v9/users/@me/pomelo-attempt"
-LEGACY_URL    = "https://discord.com/api/v9/users/@me"
-USER_INFO_URL = "https://discord.com/api/v9/users/@me"
+DIR_PATH = os.path.dirname(os.path.realpath(__file__))
+sys.path.insert(0, os.path.dirname(DIR_PATH))  # shared checker_core package lives one level up
+from checker_core.keyspace import NameSampler, Sweep
+from checker_core.qt import QtChecker, append_lines, describe, progress_max, shared_cache
+from checker_core.logview import LogView
+from checker_core.proxies import parse_proxies
+from checker_core.wordlist import Wordlist
+from checker_core.platforms.discord import DiscordChecker
 
-USER_AGENT = (
-    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-)
-X_SUPER = (
-    "eyJvcyI6IldpbmRvd3MiLCJicm93c2VyIjoiQ2hyb21lIiwiZGV2aWNlIjoiIiwic3lzdGVtX2xvY2FsZSI6"
-    "ImVuLVVTIiwiYnJvd3Nlcl91c2VyX2FnZW50IjoiTW96aWxsYS81LjAgKFdpbmRvd3MgTlQgMTAuMDsgV2lu"
-    "NjQ7IHg2NCkgQXBwbGVXZWJLaXQvNTM3LjM2IChLSFRNTCwgbGlrZSBHZWNrbykgQ2hyb21lLzEyMC4wLjAu"
-    "MCBTYWZhcmkvNTM3LjM2IiwiYnJvd3Nlcl92ZXJzaW9uIjoiMTIwLjAuMC4wIiwib3NfdmVyc2lvbiI6IjEw"
-    "IiwicmVmZXJyZXIiOiIiLCJyZWZlcnJpbmdfZG9tYWluIjoiIiwicmVmZXJyZXJfY3VycmVudCI6IiIsInJl"
-    "ZmVycmluZ19kb21haW5fY3VycmVudCI6IiIsInJlbGVhc2VfY2hhbm5lbCI6InN0YWJsZSIsImNsaWVudF9i"
-    "dWlsZF9udW1iZXIiOjI1MDcxMCwiY2xpZW50X2V2ZW50X3NvdXJjZSI6bnVsbH0="
-)
+VERSION = "V3.0 - Unauthed + Async"
 
-DIR_PATH       = os.path.dirname(os.path.realpath(__file__))
 TOKENS_FILE    = os.path.join(DIR_PATH, "tokens.txt")
 AVAILABLE_FILE = os.path.join(DIR_PATH, "available_usernames.txt")
 USERNAMES_FILE = os.path.join(DIR_PATH, "usernames.txt")
@@ -48,241 +32,17 @@ def load_tokens_from_file():
     return []
 
 
-def save_available(username):
-    with open(AVAILABLE_FILE, "a", encoding="utf-8") as f:
-        f.write(f"{username}\n")
-
-
 # ---------------------------------------------------------------------------
 # Checker thread
 # ---------------------------------------------------------------------------
-class Checker(QThread):
-    update  = pyqtSignal(str)
-    pupdate = pyqtSignal(int)
-
-    POMELO_URL = "https://discord.com/api/v9/users/@me/pomelo-attempt"
-
-    def __init__(self, usernames, tokens, check_mode="pomelo", proxies=None, debug=False):
-        super().__init__()
-        self.usernames   = usernames
-        self.tokens      = tokens if isinstance(tokens, list) else ([tokens] if tokens else [])
-        self.token_index = 0
-        self.check_mode  = check_mode
-        self.proxies     = proxies or []
-        self.proxy_index = 0
-        self.running     = True
-        self.debug       = debug
-        self.consecutive_errors      = 0
-        self.max_errors_before_pause = 3
-        self.count           = 0
-        self.available_count = 0
-        self.taken_count     = 0
-        self.error_count     = 0
-        self.rate_limit_until = {}
-
-    @property
-    def token(self):
-        return self.tokens[self.token_index] if self.tokens else ""
-
-    def next_token(self):
-        """Rotate to next free token, wraps back to first."""
-        if not self.tokens:
-            return
-        import time
-        now = time.time()
-        for _ in range(len(self.tokens)):
-            self.token_index = (self.token_index + 1) % len(self.tokens)
-            if self.rate_limit_until.get(self.token_index, 0) <= now:
-                self.update.emit(f"[TOKEN] Switched to token {self.token_index + 1}/{len(self.tokens)}")
-                return
-        # All rate limited - pick soonest
-        best = min(range(len(self.tokens)), key=lambda i: self.rate_limit_until.get(i, 0))
-        self.token_index = best
-        wait = max(0, self.rate_limit_until.get(best, 0) - now)
-        self.update.emit(f"[TOKEN] All tokens rate limited. Token {self.token_index + 1} ready in {wait:.2f}s")
-
-    def run(self):
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(self.main())
-        finally:
-            loop.close()
+class Checker(QtChecker):
+    lane_stats = pyqtSignal(str)
 
-    def stop(self):
-        self.running = False
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("available_file", AVAILABLE_FILE)
+        super().__init__(DiscordChecker(*args, **kwargs))
+        self.checker.lane_stats.connect(self.lane_stats.emit)
 
-    def get_next_proxy(self):
-        if not self.proxies:
-            return None
-        proxy = self.proxies[self.proxy_index]
-        self.proxy_index = (self.proxy_index + 1) % len(self.proxies)
-        return proxy
-
-    async def check_pomelo_username(self, username, session, proxy=None):
-        try:
-            payload = {"username": username}
-
-            if self.debug and proxy:
-                self.update.emit(f"[DEBUG] Using proxy: {proxy}")
-
-            # Retry loop - same as friend's script
-            while True:
-                req_headers = {"Authorization": self.token} if self.token else {}
-                async with session.post(self.POMELO_URL, json=payload, proxy=proxy, timeout=15, headers=req_headers) as resp:
-                    status = resp.status
-
-                    if self.debug:
-                        self.update.emit(f"\n{'='*60}")
-                        self.update.emit(f"[DEBUG] Checking: {username}")
-                        self.update.emit(f"[DEBUG] Status Code: {status}")
-
-                    if status in (200, 201):
-                        data = await resp.json()
-
-                        if self.debug:
-                            self.update.emit(f"[DEBUG] Response: {json.dumps(data, indent=2)}")
-
-                        if "taken" in data:
-                            taken = data["taken"]
-                            if not taken:
-                                self.available_count += 1
-                                self.update.emit(f"[AVAILABLE] '{username}'  [Stats: {self.available_count} available / {self.taken_count + self.available_count} checked]")
-                                save_available(username)
-                            else:
-                                self.taken_count += 1
-                                self.update.emit(f"[TAKEN] '{username}'  [Stats: {self.available_count} available / {self.taken_count + self.available_count} checked]")
-                            return not taken
-                        else:
-                            self.update.emit(f"[UNCERTAIN] '{username}' - Unexpected response")
-                            return None
-
-                    elif status == 429:
-                        import time
-                        # Get retry_after from JSON body (same as friend's script)
-                        try:
-                            data = await resp.json()
-                            retry_after = data.get("retry_after", 5.0)
-                        except Exception:
-                            retry_after = 5.0
-                        self.rate_limit_until[self.token_index] = time.time() + retry_after
-                        self.update.emit(f"[RATE LIMIT] token {self.token_index + 1} limited for {retry_after:.2f}s")
-                        # Switch token and retry immediately - no sleep if new token is free
-                        self.next_token()
-                        wait = max(0, self.rate_limit_until.get(self.token_index, 0) - time.time())
-                        if wait > 1:
-                            self.update.emit(f"[WAIT] All tokens busy, waiting {wait:.2f}s...")
-                            await asyncio.sleep(wait + 1)
-                        continue  # retry same username with new token
-
-                    elif status == 401:
-                        self.update.emit(f"[AUTH ERROR] Invalid token {self.token_index + 1}, switching...")
-                        self.next_token()
-                        continue
-
-                    else:
-                        self.update.emit(f"[UNCERTAIN] '{username}' - Status {status}")
-                        return None
-
-        except Exception as e:
-            self.update.emit(f"[ERROR] '{username}': {str(e)[:80]}")
-            return None
-
-    async def check_user(self, username, sem, session, lock, idx):
-        if not self.running:
-            return
-        async with sem:
-            proxy = self.get_next_proxy()
-            try:
-                result = await self.check_pomelo_username(username, session, proxy)
-
-                if result is None:
-                    self.error_count += 1
-                    self.consecutive_errors += 1
-                    await self.check_for_cooldown()
-                else:
-                    self.consecutive_errors = 0
-
-            except aiohttp.ClientProxyConnectionError:
-                self.update.emit(f"[PROXY ERROR] {username}: Could not connect via proxy")
-                self.consecutive_errors += 1
-                self.error_count += 1
-            except asyncio.TimeoutError:
-                self.consecutive_errors += 1
-                self.error_count += 1
-                self.update.emit(f"[TIMEOUT] {username}")
-                await self.check_for_cooldown()
-            except Exception as e:
-                self.consecutive_errors += 1
-                self.error_count += 1
-                self.update.emit(f"[ERROR] {username}: {str(e)[:80]}")
-                await self.check_for_cooldown()
-            finally:
-                async with lock:
-                    self.count += 1
-                self.pupdate.emit(self.count)
-
-    async def check_for_cooldown(self):
-        if self.consecutive_errors >= self.max_errors_before_pause:
-            await self.cooldown(15, f"{self.consecutive_errors} errors in a row")
-            self.consecutive_errors = 0
-
-    async def cooldown(self, duration, reason):
-        self.update.emit(f"\nCOOLDOWN: {reason}!")
-        self.update.emit(f"Waiting {duration}s...")
-        for remaining in range(duration, 0, -1):
-            if not self.running:
-                break
-            # Only print every 60s for long waits, every 5s for short ones
-            interval = 60 if duration > 60 else 5
-            if remaining % interval == 0 or remaining <= 5:
-                self.update.emit(f"Resuming in {remaining}s...")
-            await asyncio.sleep(1)
-        self.update.emit("Cooldown complete! Continuing...\n")
-
-    async def main(self):
-        concurrent_limit = len(self.proxies) if self.proxies else 1
-        concurrent_limit = min(concurrent_limit, 5)
-        sem  = asyncio.Semaphore(concurrent_limit)
-        lock = asyncio.Lock()
-
-        if self.proxies:
-            self.update.emit(f"Using {len(self.proxies)} proxies with {concurrent_limit} concurrent requests\n")
-        else:
-            self.update.emit(f"No proxies loaded - using direct connection\n")
-
-        # Match friend's headers exactly - minimal, no X-Super-Properties
-        headers = {
-            "Content-Type":  "application/json",
-            "Origin":        "https://discord.com",
-            "Referer":       "https://discord.com/",
-            "User-Agent":    USER_AGENT,
-        }
-
-        connector = aiohttp.TCPConnector(limit=concurrent_limit, ssl=True)
-        timeout   = aiohttp.ClientTimeout(total=30)
-
-        async with aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout) as session:
-            for i, username in enumerate(self.usernames):
-                if not self.running:
-                    break
-                await self.check_user(username, sem, session, lock, i)
-                # Random delay matching friend's script: base ±30%, min 0.5s
-                base = 1.0 if self.proxies else 2.5
-                variation = base * 0.3
-                import random as _r
-                delay = max(0.5, base + _r.uniform(-variation, variation))
-                await asyncio.sleep(delay)
-
-        total = self.available_count + self.taken_count + self.error_count
-        self.update.emit(f"\n{'-'*50}")
-        self.update.emit(f"Available : {self.available_count}")
-        self.update.emit(f"Taken     : {self.taken_count}")
-        self.update.emit(f"Errors    : {self.error_count}")
-        self.update.emit(f"Total     : {total}")
-        if self.available_count:
-            self.update.emit(f"Saved {self.available_count} username(s) to available_usernames.txt")
-        self.update.emit(f"{'-'*50}\n")
 
 # ---------------------------------------------------------------------------
 # GUI
@@ -294,6 +54,9 @@ class App(QMainWindow):
         self.setGeometry(150, 150, 1150, 870)
         self.setMinimumSize(900, 700)
         self.thread = None
+        self.sweep = None
+        self.wordlist = None
+        self.source = None   # what the current run reads its names from
         self.initUI()
         self._try_load_tokens_file()
 
@@ -446,6 +209,16 @@ class App(QMainWindow):
             "background: #2196F3; color: white; padding: 7px 14px; font-weight: bold; border-radius: 4px;"
         )
         row2.addWidget(gen_btn)
+        self.sweep_button = QPushButton("🧭 Sweep")
+        self.sweep_button.setToolTip("Check every name this pattern can make, resuming where the last sweep stopped")
+        self.sweep_button.clicked.connect(self.sweep_clicked)
+        self.sweep_button.setStyleSheet(
+            "background: #2196F3; color: white; padding: 7px 14px; font-weight: bold; border-radius: 4px;"
+        )
+        row2.addWidget(self.sweep_button)
+        self.shuffle_checkbox = QCheckBox("Shuffled")
+        self.shuffle_checkbox.setToolTip("Sweep in a random order instead of a to z")
+        row2.addWidget(self.shuffle_checkbox)
 
         self.debug_chk = QCheckBox("Debug mode")
         self.debug_chk.setToolTip("Show detailed API responses in the log")
@@ -470,6 +243,15 @@ class App(QMainWindow):
             "Enter usernames here (one per line)\n\nPomelo:  username\nLegacy:  username#1234"
         )
         in_box.addWidget(self.input_text)
+        stream_row = QHBoxLayout()
+        self.stream_button = QPushButton("📂 Stream from file")
+        self.stream_button.setToolTip("Check a big list straight from a text file instead of pasting it here")
+        self.stream_button.clicked.connect(self.toggle_wordlist)
+        stream_row.addWidget(self.stream_button)
+        self.stream_label = QLabel()
+        stream_row.addWidget(self.stream_label)
+        stream_row.addStretch()
+        in_box.addLayout(stream_row)
 
         in_file_row = QHBoxLayout()
         load_list_btn = QPushButton("Load usernames.txt")
@@ -486,13 +268,15 @@ class App(QMainWindow):
         out_lbl.setStyleSheet("font-weight: bold;")
         out_box.addWidget(out_lbl)
 
-        self.output_text = QTextEdit()
-        self.output_text.setReadOnly(True)
+        self.output_text = LogView()
         self.output_text.setStyleSheet(
             "background: #1e1e2e; color: #cdd6f4;"
             "font-family: Consolas, Monaco, monospace; font-size: 12px; padding: 8px;"
         )
         out_box.addWidget(self.output_text)
+        self.hits_only_checkbox = QCheckBox("Only show AVAILABLE")
+        self.hits_only_checkbox.toggled.connect(self.output_text.set_only_hits)
+        out_box.addWidget(self.hits_only_checkbox)
 
         save_row = QHBoxLayout()
         save_btn = QPushButton("Save results")
@@ -504,6 +288,19 @@ class App(QMainWindow):
         save_row.addStretch()
         out_box.addLayout(save_row)
 
+        lanes_lbl = QLabel("Per-token stats:")
+        lanes_lbl.setStyleSheet("font-weight: bold;")
+        out_box.addWidget(lanes_lbl)
+
+        self.lane_stats_text = QTextEdit()
+        self.lane_stats_text.setReadOnly(True)
+        self.lane_stats_text.setMaximumHeight(100)
+        self.lane_stats_text.setStyleSheet(
+            "background: #1e1e2e; color: #a6e3a1;"
+            "font-family: Consolas, Monaco, monospace; font-size: 11px; padding: 4px;"
+        )
+        out_box.addWidget(self.lane_stats_text)
+
         io_lay.addLayout(in_box)
         io_lay.addLayout(out_box)
         io_grp.setLayout(io_lay)
@@ -594,6 +391,9 @@ class App(QMainWindow):
                 self, "Load Username List", "", "Text Files (*.txt);;All (*)"
             )
         if path:
+            if os.path.getsize(path) > Wordlist.BOX_LIMIT:
+                self.stream_file(path)
+                return
             try:
                 with open(path, "r", encoding="utf-8") as f:
                     content = f.read()
@@ -607,16 +407,33 @@ class App(QMainWindow):
         txt = self.proxy_input.toPlainText().strip()
         if not txt:
             return []
-        proxies = [
-            l.strip() for l in txt.splitlines()
-            if l.strip() and any(
-                l.strip().startswith(p) for p in ("http://", "https://", "socks5://")
-            )
-        ]
+        proxies = parse_proxies(txt.splitlines())
         self.proxy_count_lbl.setText(f"Proxies loaded: {len(proxies)}")
         return proxies
 
+    def toggle_wordlist(self):
+        if self.wordlist is not None:
+            self.wordlist = None
+            self.stream_button.setText("📂 Stream from file")
+            self.stream_label.clear()
+            self.input_text.setEnabled(True)
+            return
+        path, _ = QFileDialog.getOpenFileName(self, "Stream Usernames", "", "Text Files (*.txt);;All Files (*)")
+        if path:
+            self.stream_file(path)
+
+    def stream_file(self, path):
+        """Check the names in `path` straight from the file; the input box is ignored until the file is closed."""
+        self.wordlist = Wordlist(path, DiscordChecker.clean_username)
+        self.stream_button.setText("✖ Close file")
+        self.stream_label.setText(f"Reading usernames from {self.wordlist}")
+        self.input_text.setEnabled(False)
+
     def get_usernames(self):
+        if self.sweep is not None:
+            return self.sweep   # names are produced as the checker asks for them
+        if self.wordlist is not None:
+            return self.wordlist
         return [l.strip() for l in self.input_text.toPlainText().splitlines() if l.strip()]
 
     def save_results(self):
@@ -643,67 +460,38 @@ class App(QMainWindow):
 
         prefix  = self.prefix_input.text().strip()
         suffix  = self.suffix_input.text().strip()
-        pattern = self.pattern_combo.currentIndex()
-
-        L  = string.ascii_lowercase
-        D  = string.digits
-        LD = L + D
-
-        generated = []
-        seen      = set()
-        attempts  = 0
-        while len(generated) < count and attempts < count * 15:
-            attempts += 1
-            if pattern == 0:
-                core = "".join(random.choice(L) for _ in range(length))
-            elif pattern == 1:
-                core = "".join(random.choice(LD) for _ in range(length))
-            elif pattern == 2:
-                n    = random.randint(1, max(1, length - 1))
-                core = "".join(random.choice(D) for _ in range(n)) + \
-                       "".join(random.choice(L) for _ in range(length - n))
-            elif pattern == 3:
-                h    = length // 2
-                core = "".join(random.choice(L) for _ in range(h)) + "_" + \
-                       "".join(random.choice(L) for _ in range(length - h))
-            elif pattern == 4:
-                parts, rem = [], length
-                while rem > 0:
-                    pl = random.randint(2, min(4, rem))
-                    parts.append(
-                        "".join(random.choice(L) for _ in range(pl)).capitalize()
-                    )
-                    rem -= pl
-                core = "".join(parts)
-            elif pattern == 5:
-                base = "".join(random.choice(LD) for _ in range(3))
-                p    = random.choice("_.")
-                pos  = random.choice(["end", "start", "mid1", "mid2"])
-                if pos == "end":
-                    core = base + p
-                elif pos == "start":
-                    core = p + base
-                elif pos == "mid1":
-                    core = base[:2] + p + base[2:]
-                else:
-                    core = base[:1] + p + base[1:]
-            else:
-                core = "".join(random.choice(LD) for _ in range(length))
-
-            u = prefix + core + suffix
-            u = re.sub(r'[^a-zA-Z0-9_.]', '', u)
+        pattern = self.pattern_combo.currentText()
+
+        def clean(username):
+            u = re.sub(r'[^a-zA-Z0-9_.]', '', username)
             u = re.sub(r'\.\.+', '.', u)
             u = re.sub(r'__+', '_', u)
             u = u.strip('._')
-            if u and u not in seen and 2 <= len(u) <= 32:
-                seen.add(u)
-                generated.append(u)
+            return u if 2 <= len(u) <= 32 else None
+        sampler = NameSampler("discord", pattern, length, prefix, suffix, shared_cache())
+        generated = sampler.take(count, clean)
 
-        existing = self.input_text.toPlainText().strip()
-        new_text = "\n".join(generated)
-        self.input_text.setText((existing + "\n" + new_text) if existing else new_text)
+        append_lines(self.input_text, generated)
         self.set_status(f"Generated {len(generated)} usernames", "green")
 
+    def sweep_clicked(self):
+        """Check every name the pattern can make instead of a generated batch."""
+        if self.thread is not None and self.thread.isRunning():
+            return
+        try:
+            length = int(self.len_input.text())
+        except Exception:
+            length = 5
+        prefix  = self.prefix_input.text().strip()
+        suffix  = self.suffix_input.text().strip()
+        pattern = self.pattern_combo.currentText()
+        self.sweep = Sweep("discord", pattern, length, prefix, suffix, shared_cache(),
+                           shuffled=self.shuffle_checkbox.isChecked(), clean=DiscordChecker.clean_username)
+        try:
+            self.start_clicked()   # takes the sweep through get_usernames()
+        finally:
+            self.sweep = None
+
     def start_clicked(self):
         tokens = self.get_tokens()
 
@@ -715,21 +503,25 @@ class App(QMainWindow):
         proxies = self.get_proxies()
         debug   = self.debug_chk.isChecked()
 
-        self.progress.setMaximum(len(usernames))
+        self.progress.setMaximum(progress_max(usernames))
         self.progress.setValue(0)
         self.output_text.clear()
+        self.lane_stats_text.clear()
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
 
         proxy_note = f" with {len(proxies)} proxies" if proxies else ""
         token_note = f"authed ({len(tokens)} token(s))" if tokens else "unauthed (no token)"
         self.set_status(
-            f"Checking {len(usernames)} usernames{proxy_note}  [{token_note}]...", "yellow"
+            f"Checking {describe(usernames)}{proxy_note}  [{token_note}]...", "yellow"
         )
 
+        self.source = usernames
         self.thread = Checker(usernames, tokens, "pomelo", proxies, debug)
         self.thread.update.connect(self.on_update)
+        self.thread.results.connect(self.output_text.add_results)
         self.thread.pupdate.connect(self.on_progress)
+        self.thread.lane_stats.connect(self.lane_stats_text.setPlainText)
         self.thread.finished.connect(self.on_finished)
         self.thread.start()
 
@@ -747,11 +539,13 @@ class App(QMainWindow):
 
     def on_update(self, text):
         self.output_text.append(text)
-        c = self.output_text.textCursor()
-        c.movePosition(c.End)
-        self.output_text.setTextCursor(c)
 
     def on_progress(self, value):
+        if isinstance(self.source, Wordlist):   # count unknown, so go by how far into the file we are
+            step = self.source.progress()
+            self.progress.setValue(step)
+            self.set_status(f"Progress: {value} checked, {step * 100 // Wordlist.STEPS}% of {self.source.name}", "yellow")
+            return
         self.progress.setValue(value)
         total   = self.progress.maximum()
         percent = int((value / total) * 100) if total else 0
@@ -1,166 +1,19 @@
-import sys, requests, random, string, traceback
+import sys, os, requests
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import QFont
 
-# ------------------- Checker Thread ------------------- #
-class Checker(QThread):
-    update = pyqtSignal(str)
-    pupdate = pyqtSignal(int)
-    count = 0
-
-    def __init__(self, usernames, webhook_url=None, debug=False):
-        super().__init__()
-        self.usernames = usernames
-        self.webhook_url = webhook_url
-        self.running = True
-        self.debug = debug
-        self.consecutive_errors = 0
-        self.max_errors_before_pause = 3
-
-    def run(self):
-        for i, username in enumerate(self.usernames):
-            if not self.running:
-                break
-            self.check_user(username)
-            self.count += 1
-            self.pupdate.emit(self.count)
-            # Longer delay to avoid rate limiting (1 second between requests)
-            QThread.msleep(1000)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))  # shared checker_core package lives one level up
+from checker_core.keyspace import NameSampler, Sweep
+from checker_core.qt import QtChecker, append_lines, describe, progress_max, shared_cache
+from checker_core.logview import LogView
+from checker_core.wordlist import Wordlist
+from checker_core.platforms.geometry_dash import GeometryDashChecker
 
-    def stop(self):
-        self.running = False
-
-    def check_user(self, username):
-        if not self.running:
-            return
-
-        try:
-            # Official Geometry Dash API endpoint
-            url = "http://www.boomlings.com/database/getGJUsers20.php"
-            
-            # Required parameters for the official API
-            data = {
-                "str": username,
-                "total": 0,
-                "page": 0,
-                "secret": "Wmfd2893gb7"  # Public secret used by the game
-            }
-            
-            headers = {
-                "User-Agent": ""  # Empty User-Agent as used by the game
-            }
-            
-            if self.debug:
-                self.update.emit(f"\n{'='*60}")
-                self.update.emit(f"[DEBUG] Checking: {username}")
-                self.update.emit(f"[DEBUG] API URL: {url}")
-                self.update.emit(f"[DEBUG] Data: {data}")
-            
-            response = requests.post(url, data=data, headers=headers, timeout=10)
-            
-            if self.debug:
-                self.update.emit(f"[DEBUG] Status Code: {response.status_code}")
-                self.update.emit(f"[DEBUG] Response: {response.text[:200]}")
-            
-            if response.status_code == 200:
-                response_text = response.text.strip()
-                
-                # Check if the response is an error code
-                if response_text == "-1":
-                    # -1 means user not found (username is available!)
-                    self.update.emit(f"✅ [AVAILABLE] {username} - Verify in-game!")
-                    self.consecutive_errors = 0
-                    
-                    # Send to Discord webhook if provided
-                    if self.webhook_url:
-                        self.send_to_discord(username)
-                
-                elif response_text == "-2":
-                    # -2 can sometimes indicate rate limiting
-                    self.update.emit(f"⚠️ [RATE LIMIT] {username}: Waiting 60 seconds...")
-                    self.consecutive_errors += 1
-                    QThread.msleep(60000)  # Wait 60 seconds
-                
-                elif "#" in response_text and ":" in response_text:
-                    # User exists - parse the response
-                    # Format: username:playerID:stars:demons:...
-                    try:
-                        parts = response_text.split("#")[0].split(":")
-                        if len(parts) >= 4:
-                            found_username = parts[0]
-                            player_id = parts[1]
-                            stars = parts[2]
-                            demons = parts[3]
-                            self.update.emit(f"❌ [TAKEN] {username} (ID: {player_id}, Stars: {stars}, Demons: {demons})")
-                        else:
-                            self.update.emit(f"❌ [TAKEN] {username}")
-                    except:
-                        self.update.emit(f"❌ [TAKEN] {username}")
-                    
-                    self.consecutive_errors = 0
-                else:
-                    # Unexpected response
-                    self.update.emit(f"⚠️ [UNKNOWN] {username}: Unexpected response")
-                    if self.debug:
-                        self.update.emit(f"[DEBUG] Full response: {response_text}")
-                    self.consecutive_errors += 1
-                
-            elif response.status_code == 429:
-                self.update.emit(f"⚠️ [RATE LIMIT] {username}: Waiting 60 seconds...")
-                self.consecutive_errors += 1
-                QThread.msleep(60000)  # Wait 60 seconds (1 minute) on rate limit
-                
-            else:
-                self.update.emit(f"⚠️ [ERROR] {username}: Status {response.status_code}")
-                self.consecutive_errors += 1
-                
-        except requests.exceptions.Timeout:
-            self.consecutive_errors += 1
-            self.update.emit(f"⏱️ [TIMEOUT] {username}")
-            
-        except Exception as e:
-            self.consecutive_errors += 1
-            if self.debug:
-                error_msg = traceback.format_exc()
-                self.update.emit(f"⚠️ [ERROR] {username}:\n{error_msg}")
-            else:
-                error_msg = str(e)
-                self.update.emit(f"⚠️ [ERROR] {username}: {error_msg}")
-
-    def send_to_discord(self, username):
-        """Send available username to Discord webhook"""
-        try:
-            webhook_data = {
-                "embeds": [{
-                    "title": "🔺 Available Geometry Dash Username Found!",
-                    "description": f"**Username:** `{username}`\n\n⚠️ **Note:** Always verify in-game! Some usernames may be banned/reserved.",
-                    "color": 16760576,  # Orange/gold color
-                    "fields": [
-                        {
-                            "name": "📝 How to Claim",
-                            "value": "Open Geometry Dash → Account → Click 'More' → Change your username!",
-                            "inline": False
-                        }
-                    ],
-                    "footer": {
-                        "text": "Geometry Dash Username Checker"
-                    }
-                }]
-            }
-            
-            response = requests.post(self.webhook_url, json=webhook_data, timeout=5)
-            
-            if response.status_code == 204:
-                if self.debug:
-                    self.update.emit(f"[DEBUG] ✅ Sent {username} to Discord webhook")
-            else:
-                if self.debug:
-                    self.update.emit(f"[DEBUG] ⚠️ Webhook failed: Status {response.status_code}")
-                    
-        except Exception as e:
-            if self.debug:
-                self.update.emit(f"[DEBUG] ⚠️ Webhook error: {str(e)}")
+# ------------------- Checker Thread ------------------- #
+class Checker(QtChecker):
+    def __init__(self, *args, **kwargs):
+        super().__init__(GeometryDashChecker(*args, **kwargs))
 
 # ------------------- GUI App ------------------- #
 class App(QMainWindow):
@@ -169,6 +22,9 @@ class App(QMainWindow):
         self.setWindowTitle("Geometry Dash Username Checker")
         self.setGeometry(150, 150, 1100, 800)
         self.thread = None
+        self.sweep = None
+        self.wordlist = None
+        self.source = None   # what the current run reads its names from
         self.initUI()
 
     def initUI(self):
@@ -269,6 +125,14 @@ class App(QMainWindow):
         gen_btn.clicked.connect(self.generate_usernames)
         gen_btn.setStyleSheet("background-color: #28a745; color: white; padding: 8px; font-weight: bold;")
         row2.addWidget(gen_btn)
+        self.sweep_button = QPushButton("🧭 Sweep")
+        self.sweep_button.setToolTip("Check every name this pattern can make, resuming where the last sweep stopped")
+        self.sweep_button.clicked.connect(self.sweep_clicked)
+        self.sweep_button.setStyleSheet("background-color: #28a745; color: white; padding: 8px; font-weight: bold;")
+        row2.addWidget(self.sweep_button)
+        self.shuffle_checkbox = QCheckBox("Shuffled")
+        self.shuffle_checkbox.setToolTip("Sweep in a random order instead of a to z")
+        row2.addWidget(self.shuffle_checkbox)
         row2.addStretch()
         
         gen_layout.addLayout(row2)
@@ -287,6 +151,15 @@ class App(QMainWindow):
         self.input_text.setPlaceholderText("Username1\nUsername2\nUsername3\n...")
         self.input_text.setMaximumHeight(150)
         input_layout.addWidget(self.input_text)
+        stream_row = QHBoxLayout()
+        self.stream_button = QPushButton("📂 Stream from file")
+        self.stream_button.setToolTip("Check a big list straight from a text file instead of pasting it here")
+        self.stream_button.clicked.connect(self.toggle_wordlist)
+        stream_row.addWidget(self.stream_button)
+        self.stream_label = QLabel()
+        stream_row.addWidget(self.stream_label)
+        stream_row.addStretch()
+        input_layout.addLayout(stream_row)
         
         input_group.setLayout(input_layout)
         main_layout.addWidget(input_group)
@@ -296,10 +169,12 @@ class App(QMainWindow):
         output_group.setStyleSheet("QGroupBox { font-weight: bold; }")
         output_layout = QVBoxLayout()
         
-        self.output_text = QTextEdit()
-        self.output_text.setReadOnly(True)
+        self.output_text = LogView()
         self.output_text.setStyleSheet("background-color: #1e1e1e; color: #00ff00; font-family: 'Courier New'; font-size: 10pt;")
         output_layout.addWidget(self.output_text)
+        self.hits_only_checkbox = QCheckBox("Only show AVAILABLE")
+        self.hits_only_checkbox.toggled.connect(self.output_text.set_only_hits)
+        output_layout.addWidget(self.hits_only_checkbox)
         
         output_group.setLayout(output_layout)
         main_layout.addWidget(output_group)
@@ -352,50 +227,15 @@ class App(QMainWindow):
         except:
             count = 20
 
-        generated = []
-        
-        for _ in range(count):
-            username = ""
-            
-            if pattern == "Letters only (abc)":
-                username = "".join(random.choice(string.ascii_lowercase) for _ in range(length))
-            
-            elif pattern == "Letters + Numbers (a1b2)":
-                chars = string.ascii_lowercase + string.digits
-                username = "".join(random.choice(chars) for _ in range(length))
-            
-            elif pattern == "Numbers + Letters (12ab)":
-                num_count = random.randint(1, max(1, length - 2))
-                letter_count = length - num_count
-                username = "".join(random.choice(string.digits) for _ in range(num_count))
-                username += "".join(random.choice(string.ascii_lowercase) for _ in range(letter_count))
-            
-            elif pattern == "Numbers only (1234)":
-                username = "".join(random.choice(string.digits) for _ in range(length))
-            
-            elif pattern == "CamelCase (AbcDef)":
-                parts = []
-                remaining = length
-                while remaining > 0:
-                    part_len = random.randint(2, min(4, remaining))
-                    part = "".join(random.choice(string.ascii_lowercase) for _ in range(part_len))
-                    part = part.capitalize()
-                    parts.append(part)
-                    remaining -= part_len
-                username = "".join(parts)
-            
-            username = prefix + username + suffix
-            
+        def clean(username):
             # GD usernames can contain letters, numbers, and underscores
             username = ''.join(c for c in username if c.isalnum() or c == '_')
-            
             # GD username length is typically 3-15 characters
-            if 3 <= len(username) <= 15:
-                generated.append(username)
+            return username if 3 <= len(username) <= 15 else None
+        sampler = NameSampler("geometry_dash", pattern, length, prefix, suffix, shared_cache())
+        generated = sampler.take(count, clean)
 
-        existing = self.input_text.toPlainText().strip()
-        all_users = ("\n".join(generated) if not existing else existing + "\n" + "\n".join(generated))
-        self.input_text.setText(all_users)
+        append_lines(self.input_text, generated)
         
         self.status_label.setText(f"✅ Generated {len(generated)} usernames")
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #c8e6c9; border-radius: 3px;")
@@ -429,6 +269,24 @@ class App(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"❌ Failed to send test message:\n{str(e)}")
 
+    def sweep_clicked(self):
+        """Check every name the pattern can make instead of a generated batch."""
+        if self.thread is not None and self.thread.isRunning():
+            return
+        try:
+            length = int(self.length_input.text())
+        except:
+            length = 6
+        prefix = self.prefix_input.text().strip()
+        suffix = self.suffix_input.text().strip()
+        pattern = self.pattern_combo.currentText()
+        self.sweep = Sweep("geometry_dash", pattern, length, prefix, suffix, shared_cache(),
+                           shuffled=self.shuffle_checkbox.isChecked(), clean=GeometryDashChecker.clean_username)
+        try:
+            self.start_clicked()   # takes the sweep through get_usernames()
+        finally:
+            self.sweep = None
+
     def start_clicked(self):
         usernames = self.get_usernames()
         if not usernames:
@@ -438,20 +296,22 @@ class App(QMainWindow):
         debug = self.debug_checkbox.isChecked()
         webhook_url = self.webhook_input.text().strip() or None
         
-        self.progress_bar.setMaximum(len(usernames))
+        self.progress_bar.setMaximum(progress_max(usernames))
         self.progress_bar.setValue(0)
         self.output_text.clear()
         self.start_button.setEnabled(False)
         self.stop_button.setEnabled(True)
         
         if webhook_url:
-            self.status_label.setText(f"🔄 Checking {len(usernames)} usernames (webhook enabled)...")
+            self.status_label.setText(f"🔄 Checking {describe(usernames)} (webhook enabled)...")
         else:
-            self.status_label.setText(f"🔄 Checking {len(usernames)} usernames...")
+            self.status_label.setText(f"🔄 Checking {describe(usernames)}...")
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #fff9c4; border-radius: 3px;")
 
+        self.source = usernames
         self.thread = Checker(usernames, webhook_url, debug)
         self.thread.update.connect(self.update_text)
+        self.thread.results.connect(self.output_text.add_results)
         self.thread.pupdate.connect(self.update_progress)
         self.thread.finished.connect(self.checking_finished)
         self.thread.start()
@@ -471,22 +331,46 @@ class App(QMainWindow):
 
     def update_text(self, text):
         self.output_text.append(text)
-        cursor = self.output_text.textCursor()
-        cursor.movePosition(cursor.End)
-        self.output_text.setTextCursor(cursor)
 
     def update_progress(self, value):
+        if isinstance(self.source, Wordlist):   # count unknown, so go by how far into the file we are
+            step = self.source.progress()
+            self.progress_bar.setValue(step)
+            self.status_label.setText(f"🔄 Progress: {value} checked, {step * 100 // Wordlist.STEPS}% of {self.source.name}")
+            return
         self.progress_bar.setValue(value)
         total = self.progress_bar.maximum()
         percent = int((value / total) * 100) if total > 0 else 0
         self.status_label.setText(f"🔄 Progress: {value}/{total} ({percent}%)")
 
+    def toggle_wordlist(self):
+        if self.wordlist is not None:
+            self.wordlist = None
+            self.stream_button.setText("📂 Stream from file")
+            self.stream_label.clear()
+            self.input_text.setEnabled(True)
+            return
+        path, _ = QFileDialog.getOpenFileName(self, "Stream Usernames", "", "Text Files (*.txt);;All Files (*)")
+        if path:
+            self.stream_file(path)
+
+    def stream_file(self, path):
+        """Check the names in `path` straight from the file; the input box is ignored until the file is closed."""
+        self.wordlist = Wordlist(path, GeometryDashChecker.clean_username)
+        self.stream_button.setText("✖ Close file")
+        self.stream_label.setText(f"Reading usernames from {self.wordlist}")
+        self.input_text.setEnabled(False)
+
     def get_usernames(self):
+        if self.sweep is not None:
+            return self.sweep   # names are produced as the checker asks for them
+        if self.wordlist is not None:
+            return self.wordlist
         txt = self.input_text.toPlainText().strip()
         usernames = []
         for line in txt.splitlines():
-            u = line.strip()
-            if u and (u.replace('_', '').isalnum()):
+            u = GeometryDashChecker.clean_username(line)
+            if u:
                 usernames.append(u)
         return usernames
 
@@ -1,140 +1,17 @@
-import sys, requests, random, string, traceback
+import sys, requests
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import QFont
+from checker_core.keyspace import NameSampler, Sweep
+from checker_core.qt import QtChecker, append_lines, describe, progress_max, shared_cache
+from checker_core.logview import LogView
+from checker_core.wordlist import Wordlist
+from checker_core.platforms.github import GitHubChecker
 
 # ------------------- Checker Thread ------------------- #
-class Checker(QThread):
-    update = pyqtSignal(str)
-    pupdate = pyqtSignal(int)
-    count = 0
-
-    def __init__(self, usernames, webhook_url=None, debug=False, save_to_file=True):
-        super().__init__()
-        self.usernames = usernames
-        self.webhook_url = webhook_url
-        self.running = True
-        self.debug = debug
-        self.save_to_file = save_to_file
-        self.consecutive_errors = 0
-
-    def run(self):
-        for i, username in enumerate(self.usernames):
-            if not self.running:
-                break
-            self.check_username(username)
-            self.count += 1
-            self.pupdate.emit(self.count)
-
-    def stop(self):
-        self.running = False
-
-    def check_username(self, username):
-        if not self.running:
-            return
-
-        try:
-            url = f"https://www.github.com/{username}/"
-            
-            if self.debug:
-                self.update.emit(f"\n{'='*60}")
-                self.update.emit(f"[DEBUG] Checking: {username}")
-                self.update.emit(f"[DEBUG] URL: {url}")
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10, allow_redirects=True)
-            
-            if self.debug:
-                self.update.emit(f"[DEBUG] Status Code: {response.status_code}")
-            
-            if response.status_code == 200:
-                # Username is taken
-                self.update.emit(f"❌ [TAKEN] {username}")
-                self.consecutive_errors = 0
-                
-            elif response.status_code == 404:
-                # Username is available
-                self.update.emit(f"✅ [AVAILABLE] {username}")
-                self.consecutive_errors = 0
-                
-                # Save to file
-                if self.save_to_file:
-                    try:
-                        with open("available_github_usernames.txt", "a") as f:
-                            f.write(f"{username}\n")
-                    except Exception as e:
-                        if self.debug:
-                            self.update.emit(f"[DEBUG] Failed to save to file: {e}")
-                
-                # Send to Discord webhook
-                if self.webhook_url:
-                    self.send_to_discord(username)
-                    
-            elif response.status_code == 429:
-                self.update.emit(f"⚠️ [RATE LIMIT] {username}: GitHub is rate limiting!")
-                self.consecutive_errors += 1
-                import time
-                time.sleep(5)  # Wait 5 seconds
-                
-            elif response.status_code == 403:
-                self.update.emit(f"⚠️ [BLOCKED] {username}: GitHub blocked the request!")
-                self.consecutive_errors += 1
-                import time
-                time.sleep(10)  # Wait longer
-                
-            else:
-                self.update.emit(f"⚠️ [UNKNOWN] {username}: Status {response.status_code}")
-                self.consecutive_errors += 1
-                
-        except requests.exceptions.Timeout:
-            self.consecutive_errors += 1
-            self.update.emit(f"⏱️ [TIMEOUT] {username}")
-            
-        except Exception as e:
-            self.consecutive_errors += 1
-            if self.debug:
-                error_msg = traceback.format_exc()
-                self.update.emit(f"⚠️ [ERROR] {username}:\n{error_msg}")
-            else:
-                error_msg = str(e)
-                self.update.emit(f"⚠️ [ERROR] {username}: {error_msg}")
-
-    def send_to_discord(self, username):
-        """Send available username to Discord webhook"""
-        try:
-            webhook_data = {
-                "embeds": [{
-                    "title": "🐙 Available GitHub Username Found!",
-                    "description": f"**Username:** `{username}`",
-                    "color": 6094199,  # GitHub dark color
-                    "fields": [
-                        {
-                            "name": "🔗 Direct Link",
-                            "value": f"https://github.com/{username}",
-                            "inline": False
-                        }
-                    ],
-                    "footer": {
-                        "text": "GitHub Username Checker"
-                    }
-                }]
-            }
-            
-            response = requests.post(self.webhook_url, json=webhook_data, timeout=5)
-            
-            if response.status_code == 204:
-                if self.debug:
-                    self.update.emit(f"[DEBUG] ✅ Sent {username} to Discord webhook")
-            else:
-                if self.debug:
-                    self.update.emit(f"[DEBUG] ⚠️ Webhook failed: Status {response.status_code}")
-                    
-        except Exception as e:
-            if self.debug:
-                self.update.emit(f"[DEBUG] ⚠️ Webhook error: {str(e)}")
+class Checker(QtChecker):
+    def __init__(self, *args, **kwargs):
+        super().__init__(GitHubChecker(*args, **kwargs))
 
 # ------------------- GUI App ------------------- #
 class App(QMainWindow):
@@ -143,6 +20,9 @@ class App(QMainWindow):
         self.setWindowTitle("GitHub Username Checker")
         self.setGeometry(150, 150, 1100, 800)
         self.thread = None
+        self.sweep = None
+        self.wordlist = None
+        self.source = None   # what the current run reads its names from
         self.initUI()
 
     def initUI(self):
@@ -248,6 +128,14 @@ class App(QMainWindow):
         self.gen_button.clicked.connect(self.generate_usernames)
         self.gen_button.setStyleSheet("background-color: #24292e; color: white; padding: 8px; font-weight: bold;")
         row2.addWidget(self.gen_button)
+        self.sweep_button = QPushButton("🧭 Sweep")
+        self.sweep_button.setToolTip("Check every name this pattern can make, resuming where the last sweep stopped")
+        self.sweep_button.clicked.connect(self.sweep_clicked)
+        self.sweep_button.setStyleSheet("background-color: #24292e; color: white; padding: 8px; font-weight: bold;")
+        row2.addWidget(self.sweep_button)
+        self.shuffle_checkbox = QCheckBox("Shuffled")
+        self.shuffle_checkbox.setToolTip("Sweep in a random order instead of a to z")
+        row2.addWidget(self.shuffle_checkbox)
         
         self.debug_checkbox = QCheckBox("🐛 Debug Mode (Detailed)")
         self.debug_checkbox.setToolTip("Show detailed responses")
@@ -278,6 +166,15 @@ class App(QMainWindow):
         self.input_text = QTextEdit()
         self.input_text.setPlaceholderText("Enter usernames here\n(one per line)\n\nExample:\nabc\nxyz\ndev123")
         input_box.addWidget(self.input_text)
+        stream_row = QHBoxLayout()
+        self.stream_button = QPushButton("📂 Stream from file")
+        self.stream_button.setToolTip("Check a big list straight from a text file instead of pasting it here")
+        self.stream_button.clicked.connect(self.toggle_wordlist)
+        stream_row.addWidget(self.stream_button)
+        self.stream_label = QLabel()
+        stream_row.addWidget(self.stream_label)
+        stream_row.addStretch()
+        input_box.addLayout(stream_row)
         
         # Output side
         output_box = QVBoxLayout()
@@ -285,10 +182,12 @@ class App(QMainWindow):
         output_label.setStyleSheet("font-weight: bold;")
         output_box.addWidget(output_label)
         
-        self.output_text = QTextEdit()
-        self.output_text.setReadOnly(True)
+        self.output_text = LogView()
         self.output_text.setStyleSheet("background-color: #1a1a1a; color: #00ff00; font-family: Consolas, Monaco, monospace; padding: 10px;")
         output_box.addWidget(self.output_text)
+        self.hits_only_checkbox = QCheckBox("Only show AVAILABLE")
+        self.hits_only_checkbox.toggled.connect(self.output_text.set_only_hits)
+        output_box.addWidget(self.hits_only_checkbox)
         
         io_layout.addLayout(input_box)
         io_layout.addLayout(output_box)
@@ -341,65 +240,18 @@ class App(QMainWindow):
         except:
             count = 10
 
-        generated = []
-        attempts = 0
-        max_attempts = count * 3
-        
-        while len(generated) < count and attempts < max_attempts:
-            attempts += 1
-            username = ""
-            
-            if pattern == "Letters only (abc)":
-                username = "".join(random.choice(string.ascii_lowercase) for _ in range(length))
-            
-            elif pattern == "Letters + Numbers (a1b2)":
-                chars = string.ascii_lowercase + string.digits
-                username = "".join(random.choice(chars) for _ in range(length))
-            
-            elif pattern == "Numbers + Letters (12ab)":
-                num_count = random.randint(1, max(1, length - 2))
-                letter_count = length - num_count
-                username = "".join(random.choice(string.digits) for _ in range(num_count))
-                username += "".join(random.choice(string.ascii_lowercase) for _ in range(letter_count))
-            
-            elif pattern == "Numbers only (1234)":
-                username = "".join(random.choice(string.digits) for _ in range(length))
-            
-            elif pattern == "Letters_Letters (abc_def)":
-                part1_len = length // 2
-                part2_len = length - part1_len
-                part1 = "".join(random.choice(string.ascii_lowercase) for _ in range(part1_len))
-                part2 = "".join(random.choice(string.ascii_lowercase) for _ in range(part2_len))
-                username = f"{part1}_{part2}"
-            
-            elif pattern == "CamelCase (AbcDef)":
-                parts = []
-                remaining = length
-                while remaining > 0:
-                    part_len = random.randint(2, min(4, remaining))
-                    part = "".join(random.choice(string.ascii_lowercase) for _ in range(part_len))
-                    part = part.capitalize()
-                    parts.append(part)
-                    remaining -= part_len
-                username = "".join(parts)
-            
-            # Add prefix and suffix
-            username = prefix + username + suffix
-            
+        def clean(username):
             # GitHub username validation: alphanumeric and hyphens only
-            username = ''.join(c for c in username if c.isalnum() or c == '-')
-            
-            if len(username) > 0 and username not in generated:
-                generated.append(username)
+            return ''.join(c for c in username if c.isalnum() or c == '-')
+        sampler = NameSampler("github", pattern, length, prefix, suffix, shared_cache())
+        generated = sampler.take(count, clean)
 
         if len(generated) == 0:
             self.status_label.setText(f"⚠️ No valid usernames generated")
             self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #fff3cd; border-radius: 3px;")
             return
 
-        existing = self.input_text.toPlainText().strip()
-        all_usernames = ("\n".join(generated) if not existing else existing + "\n" + "\n".join(generated))
-        self.input_text.setText(all_usernames)
+        append_lines(self.input_text, generated)
         
         self.status_label.setText(f"✅ Generated {len(generated)} usernames")
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #c8e6c9; border-radius: 3px;")
@@ -433,6 +285,24 @@ class App(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"❌ Failed to send test message:\n{str(e)}")
 
+    def sweep_clicked(self):
+        """Check every name the pattern can make instead of a generated batch."""
+        if self.thread is not None and self.thread.isRunning():
+            return
+        try:
+            length = int(self.length_input.text())
+        except:
+            length = 3
+        prefix = self.prefix_input.text().strip()
+        suffix = self.suffix_input.text().strip()
+        pattern = self.pattern_combo.currentText()
+        self.sweep = Sweep("github", pattern, length, prefix, suffix, shared_cache(),
+                           shuffled=self.shuffle_checkbox.isChecked(), clean=GitHubChecker.clean_username)
+        try:
+            self.start_clicked()   # takes the sweep through get_usernames()
+        finally:
+            self.sweep = None
+
     def start_clicked(self):
         usernames = self.get_usernames()
         if not usernames:
@@ -443,13 +313,13 @@ class App(QMainWindow):
         save_to_file = self.save_checkbox.isChecked()
         webhook_url = self.webhook_input.text().strip() or None
         
-        self.progress_bar.setMaximum(len(usernames))
+        self.progress_bar.setMaximum(progress_max(usernames))
         self.progress_bar.setValue(0)
         self.output_text.clear()
         self.start_button.setEnabled(False)
         self.stop_button.setEnabled(True)
         
-        status_text = f"🔄 Checking {len(usernames)} usernames"
+        status_text = f"🔄 Checking {describe(usernames)}"
         if save_to_file:
             status_text += " (saving to file)"
         if webhook_url:
@@ -459,8 +329,10 @@ class App(QMainWindow):
         self.status_label.setText(status_text)
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #fff9c4; border-radius: 3px;")
 
+        self.source = usernames
         self.thread = Checker(usernames, webhook_url, debug, save_to_file)
         self.thread.update.connect(self.update_text)
+        self.thread.results.connect(self.output_text.add_results)
         self.thread.pupdate.connect(self.update_progress)
         self.thread.finished.connect(self.checking_finished)
         self.thread.start()
@@ -480,23 +352,46 @@ class App(QMainWindow):
 
     def update_text(self, text):
         self.output_text.append(text)
-        cursor = self.output_text.textCursor()
-        cursor.movePosition(cursor.End)
-        self.output_text.setTextCursor(cursor)
 
     def update_progress(self, value):
+        if isinstance(self.source, Wordlist):   # count unknown, so go by how far into the file we are
+            step = self.source.progress()
+            self.progress_bar.setValue(step)
+            self.status_label.setText(f"🔄 Progress: {value} checked, {step * 100 // Wordlist.STEPS}% of {self.source.name}")
+            return
         self.progress_bar.setValue(value)
         total = self.progress_bar.maximum()
         percent = int((value / total) * 100) if total > 0 else 0
         self.status_label.setText(f"🔄 Progress: {value}/{total} ({percent}%)")
 
+    def toggle_wordlist(self):
+        if self.wordlist is not None:
+            self.wordlist = None
+            self.stream_button.setText("📂 Stream from file")
+            self.stream_label.clear()
+            self.input_text.setEnabled(True)
+            return
+        path, _ = QFileDialog.getOpenFileName(self, "Stream Usernames", "", "Text Files (*.txt);;All Files (*)")
+        if path:
+            self.stream_file(path)
+
+    def stream_file(self, path):
+        """Check the names in `path` straight from the file; the input box is ignored until the file is closed."""
+        self.wordlist = Wordlist(path, GitHubChecker.clean_username)
+        self.stream_button.setText("✖ Close file")
+        self.stream_label.setText(f"Reading usernames from {self.wordlist}")
+        self.input_text.setEnabled(False)
+
     def get_usernames(self):
+        if self.sweep is not None:
+            return self.sweep   # names are produced as the checker asks for them
+        if self.wordlist is not None:
+            return self.wordlist
         txt = self.input_text.toPlainText().strip()
         usernames = []
         for line in txt.splitlines():
-            u = line.strip()
-            # GitHub allows letters, numbers, and hyphens
-            if u and all(c.isalnum() or c == '-' for c in u):
+            u = GitHubChecker.clean_username(line)
+            if u:
                 usernames.append(u)
         return usernames
 
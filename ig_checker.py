@@ -1,332 +1,17 @@
-import sys, aiohttp, asyncio, random, string, re, json
+import sys, random, string
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import QFont
+from checker_core.keyspace import NameSampler, Sweep
+from checker_core.qt import QtChecker, append_lines, describe, progress_max, shared_cache
+from checker_core.logview import LogView
+from checker_core.wordlist import Wordlist
+from checker_core.platforms.instagram import InstagramChecker
 
 # ------------------- Checker Thread ------------------- #
-class Checker(QThread):
-    update = pyqtSignal(str)
-    pupdate = pyqtSignal(int)
-    count = 0
-
-    BASE_URL = "https://www.instagram.com/{}/"
-
-    def __init__(self, usernames, sessionid, user_agent, debug=False):
-        super().__init__()
-        self.usernames = usernames
-        self.sessionid = sessionid
-        self.user_agent = user_agent
-        self.running = True
-        self.debug = debug
-        self.consecutive_errors = 0  # Track errors in a row
-        self.rate_limit_count = 0  # Track rate limits
-        self.max_errors_before_pause = 3  # Pause after 3 errors in a row
-
-    def run(self):
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(self.main())
-        finally:
-            loop.close()
-
-    def stop(self):
-        self.running = False
-
-    async def check_user(self, username, sem, session, lock, idx):
-        if not self.running:
-            return
-
-        async with sem:
-            try:
-                url = self.BASE_URL.format(username)
-                
-                async with session.get(url, allow_redirects=True, timeout=20) as resp:
-                    status = resp.status
-                    
-                    # Read the response
-                    try:
-                        body = await resp.text(errors='ignore')
-                        body_lower = body.lower()
-                    except Exception as e:
-                        self.update.emit(f"⚠️ [ERROR] {username}: Could not read response")
-                        return
-                    
-                    # Debug mode - show raw indicators
-                    if self.debug:
-                        self.update.emit(f"\n{'='*60}")
-                        self.update.emit(f"[DEBUG] Checking: {username}")
-                        self.update.emit(f"[DEBUG] Status Code: {status}")
-                        self.update.emit(f"[DEBUG] Final URL: {resp.url}")
-                        self.update.emit(f"[DEBUG] Body Length: {len(body)} chars")
-                    
-                    # ===== CLEAR SIGNALS =====
-                    
-                    # 1. Explicit 404 status = AVAILABLE
-                    if status == 404:
-                        self.update.emit(f"✅ [AVAILABLE] {username} (404 status)")
-                        return
-                    
-                    # 2. Rate limited
-                    if status == 429:
-                        self.update.emit(f"⚠️ [RATE LIMIT] {username}: Slow down!")
-                        await asyncio.sleep(5)
-                        return
-                    
-                    # 3. Blocked or forbidden
-                    if status in [400, 403]:
-                        self.consecutive_errors += 1
-                        self.update.emit(f"⚠️ [BLOCKED] {username}: Status {status} - Check session/IP")
-                        await self.check_for_cooldown()
-                        return
-                    
-                    # 4. Redirected to login = session expired
-                    if 'login' in str(resp.url).lower():
-                        self.update.emit(f"❌ [SESSION EXPIRED] {username}: Re-enter sessionid")
-                        return
-                    
-                    # ===== ANALYZE BODY CONTENT =====
-                    
-                    # Check for explicit "page not found" signals
-                    not_found_signals = [
-                        '"HttpError":{"statusCode":404',  # JSON error object
-                        'page_not_found',  # Page type
-                        '"PageNotFound"',  # React component
-                        'Sorry, this page isn\'t available',  # Error message
-                        '"status_code":404'  # Alternative error format
-                    ]
-                    
-                    found_not_found = False
-                    for signal in not_found_signals:
-                        if signal.lower() in body_lower:
-                            if self.debug:
-                                self.update.emit(f"[DEBUG] Found NOT FOUND signal: {signal}")
-                            found_not_found = True
-                            break
-                    
-                    if found_not_found:
-                        self.update.emit(f"✅ [AVAILABLE] {username} (not found signal)")
-                        return
-                    
-                    # Check for profile existence signals
-                    # These indicate a REAL, ACTIVE profile (not just placeholder data)
-                    profile_signals = {
-                        'has_real_user_id': False,
-                        'has_follower_count': False,
-                        'has_following_count': False,
-                        'has_post_count': False,
-                        'has_profile_pic': False,
-                        'has_biography_content': False,
-                        'has_username_match': False
-                    }
-                    
-                    # User ID check - but verify it's actually in a user object, not just random
-                    # Real profiles have user data in specific structures
-                    user_id_match = re.search(r'"user"[:\s]*{[^}]*"id"[:\s]*"(\d{5,})"', body)
-                    if not user_id_match:
-                        user_id_match = re.search(r'"ProfilePage"[^}]*"user"[:\s]*{[^}]*"id"[:\s]*"(\d{5,})"', body, re.DOTALL)
-                    
-                    if user_id_match:
-                        user_id = user_id_match.group(1)
-                        # Check if this user ID appears with the username (strong signal)
-                        if re.search(rf'"username"[:\s]*"{username}"[^}}]*"id"[:\s]*"{user_id}"', body, re.IGNORECASE):
-                            profile_signals['has_real_user_id'] = True
-                            if self.debug:
-                                self.update.emit(f"[DEBUG] ✓ Found REAL user ID linked to username: {user_id}")
-                        elif self.debug:
-                            self.update.emit(f"[DEBUG] ✗ Found user ID {user_id} but NOT linked to this username (likely placeholder)")
-                    
-                    # Username appears in the user data (strong signal it's real)
-                    if re.search(rf'"username"[:\s]*"{username}"', body, re.IGNORECASE):
-                        profile_signals['has_username_match'] = True
-                        if self.debug:
-                            self.update.emit(f"[DEBUG] ✓ Username '{username}' found in user data")
-                    
-                    # Follower count structure (new format)
-                    follower_match = re.search(r'"follower_count"[:\s]*(\d+)', body)
-                    if not follower_match:
-                        follower_match = re.search(r'"edge_followed_by"[:\s]*{[^}]*"count"[:\s]*(\d+)', body)
-                    if follower_match:
-                        profile_signals['has_follower_count'] = True
-                        if self.debug:
-                            self.update.emit(f"[DEBUG] ✓ Found follower count: {follower_match.group(1)}")
-
-                    # Following count structure (new format)
-                    if re.search(r'"following_count"[:\s]*\d+', body) or \
-                       re.search(r'"edge_follow"[:\s]*{[^}]*"count"[:\s]*\d+', body):
-                        profile_signals['has_following_count'] = True
-                        if self.debug:
-                            self.update.emit(f"[DEBUG] ✓ Found following count")
-
-                    # Post count (new format)
-                    if re.search(r'"media_count"[:\s]*\d+', body) or \
-                       re.search(r'"edge_owner_to_timeline_media"[:\s]*{[^}]*"count"[:\s]*\d+', body):
-                        profile_signals['has_post_count'] = True
-                        if self.debug:
-                            self.update.emit(f"[DEBUG] ✓ Found post count")
-                    
-                    # Profile picture with actual URL (not default)
-                    if re.search(r'"profile_pic_url"[:\s]*"https://[^"]+(?:scontent|cdninstagram)[^"]*"', body):
-                        profile_signals['has_profile_pic'] = True
-                        if self.debug:
-                            self.update.emit(f"[DEBUG] ✓ Found profile pic URL")
-
-                    # User ID — also check new "pk" field format
-                    if not user_id_match:
-                        user_id_match = re.search(r'"pk"[:\s]*"?(\d{5,})"?', body)
-                    if user_id_match and not profile_signals['has_real_user_id']:
-                        uid = user_id_match.group(1)
-                        if re.search(rf'"username"[:\s]*"{re.escape(username)}"', body, re.IGNORECASE):
-                            profile_signals['has_real_user_id'] = True
-                            if self.debug:
-                                self.update.emit(f"[DEBUG] ✓ Found REAL user ID (pk) linked to username: {uid}")
-                    
-                    # Biography with actual content (not empty string)
-                    bio_match = re.search(r'"biography"[:\s]*"([^"]+)"', body)
-                    if bio_match and bio_match.group(1).strip():
-                        profile_signals['has_biography_content'] = True
-                        if self.debug:
-                            bio_preview = bio_match.group(1)[:50]
-                            self.update.emit(f"[DEBUG] ✓ Found biography with content: {bio_preview}...")
-                    elif self.debug:
-                        self.update.emit(f"[DEBUG] ✗ Biography field empty or not found")
-                    
-                    # Count how many profile signals we found
-                    signal_count = sum(profile_signals.values())
-                    
-                    if self.debug:
-                        self.update.emit(f"[DEBUG] Profile signals found: {signal_count}/7")
-                        self.update.emit(f"[DEBUG] Signals: {profile_signals}")
-                    
-                    # Decision logic - STRICTER:
-                    # Must have username match + real user ID to be considered taken
-                    # OR have multiple strong signals (follower counts, posts, pic)
-                    
-                    if profile_signals['has_username_match'] and profile_signals['has_real_user_id']:
-                        self.update.emit(f"❌ [TAKEN] {username} (username + user_id confirmed)")
-                        return
-                    
-                    if signal_count >= 4:
-                        self.update.emit(f"❌ [TAKEN] {username} ({signal_count} strong signals)")
-                        return
-                    
-                    # Has follower/following/post counts = likely real
-                    engagement_signals = (
-                        profile_signals['has_follower_count'] + 
-                        profile_signals['has_following_count'] + 
-                        profile_signals['has_post_count']
-                    )
-                    if engagement_signals >= 2 and profile_signals['has_profile_pic']:
-                        self.update.emit(f"❌ [TAKEN] {username} (engagement data present)")
-                        return
-                    
-                    # Additional check: Look for the username in the page title or meta
-                    username_in_meta = False
-                    title_match = re.search(r'<title>([^<]+)</title>', body, re.IGNORECASE)
-                    if title_match:
-                        title = title_match.group(1)
-                        title_lower = title.lower()
-                        username_lower = username.lower()
-                        # Instagram encodes @ as &#064; in titles
-                        has_username_in_title = (
-                            username_lower in title_lower or
-                            f'&#064;{username_lower}' in title_lower
-                        )
-                        has_profile_indicators = (
-                            'posts' in title_lower or
-                            'followers' in title_lower or
-                            f'@{username_lower}' in title_lower or
-                            f'&#064;{username_lower}' in title_lower or
-                            '• instagram photos and videos' in title_lower
-                        )
-                        if has_username_in_title and has_profile_indicators:
-                            username_in_meta = True
-                            if self.debug:
-                                self.update.emit(f"[DEBUG] ✓ Username found in profile title: {title}")
-                        elif self.debug:
-                            self.update.emit(f"[DEBUG] ✗ Title doesn't indicate real profile: {title}")
-                    
-                    if username_in_meta and (signal_count >= 1 or profile_signals['has_username_match']):
-                        self.update.emit(f"❌ [TAKEN] {username} (profile title + {signal_count} signals)")
-                        return
-                    
-                    # If we get here with very few signals, it's likely available
-                    if signal_count <= 1:
-                        self.consecutive_errors = 0  # Reset on success
-                        self.update.emit(f"✅ [AVAILABLE] {username} (no real profile data)")
-                        return
-                    
-                    # Low signal count = probably available (just has placeholder data)
-                    if signal_count == 2 and not profile_signals['has_username_match']:
-                        self.consecutive_errors = 0  # Reset on success
-                        self.update.emit(f"✅ [AVAILABLE] {username} (only placeholder data)")
-                        return
-                    
-                    # Edge case: Some signals but unclear
-                    self.consecutive_errors = 0  # Reset on success
-                    self.update.emit(f"❓ [UNCLEAR] {username} ({signal_count} signals - manual check recommended)")
-                    if self.debug:
-                        self.update.emit(f"[DEBUG] URL for manual check: {url}")
-                    
-            except asyncio.TimeoutError:
-                self.consecutive_errors += 1
-                self.update.emit(f"⏱️ [TIMEOUT] {username}")
-                await self.check_for_cooldown()
-            except Exception as e:
-                self.consecutive_errors += 1
-                error_msg = str(e)[:80]
-                self.update.emit(f"⚠️ [ERROR] {username}: {error_msg}")
-                await self.check_for_cooldown()
-            finally:
-                async with lock:
-                    self.count += 1
-                self.pupdate.emit(self.count)
-
-    async def check_for_cooldown(self):
-        """Check if we need to pause due to consecutive errors"""
-        if self.consecutive_errors >= self.max_errors_before_pause:
-            await self.cooldown(15, f"{self.consecutive_errors} errors in a row")
-            self.consecutive_errors = 0  # Reset counter after cooldown
-
-    async def cooldown(self, duration, reason):
-        """Pause checking for a specified duration"""
-        self.update.emit(f"\n🛑 COOLDOWN: {reason}!")
-        self.update.emit(f"⏸️  Pausing for {duration} seconds to avoid being blocked...")
-        
-        for remaining in range(duration, 0, -1):
-            if not self.running:  # Allow user to stop during cooldown
-                break
-            self.update.emit(f"⏳ Resuming in {remaining} seconds...")
-            await asyncio.sleep(1)
-        
-        self.update.emit(f"✅ Cooldown complete! Continuing...\n")
-
-    async def main(self):
-        sem = asyncio.Semaphore(2)  # Max 2 concurrent requests
-        lock = asyncio.Lock()
-
-        headers = {
-            "User-Agent": self.user_agent,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate",  # Removed 'br' to avoid brotli requirement
-            "Connection": "keep-alive",
-            "Cookie": f"sessionid={self.sessionid}",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none"
-        }
-
-        connector = aiohttp.TCPConnector(limit=2, ssl=True)
-        timeout = aiohttp.ClientTimeout(total=30)
-        
-        async with aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout) as session:
-            for i, username in enumerate(self.usernames):
-                if not self.running:
-                    break
-                await self.check_user(username, sem, session, lock, i)
-                await asyncio.sleep(2)  # Increased delay to avoid rate limits
+class Checker(QtChecker):
+    def __init__(self, *args, **kwargs):
+        super().__init__(InstagramChecker(*args, **kwargs))
 
 # ------------------- GUI App ------------------- #
 class App(QMainWindow):
@@ -335,6 +20,9 @@ class App(QMainWindow):
         self.setWindowTitle("Instagram Username Checker - Improved")
         self.setGeometry(150, 150, 1100, 800)
         self.thread = None
+        self.sweep = None
+        self.wordlist = None
+        self.source = None   # what the current run reads its names from
         self.initUI()
 
     def initUI(self):
@@ -428,11 +116,31 @@ class App(QMainWindow):
         self.gen_button.clicked.connect(self.generate_usernames)
         self.gen_button.setStyleSheet("background-color: #2196F3; color: white; padding: 8px; font-weight: bold;")
         row2.addWidget(self.gen_button)
+        self.sweep_button = QPushButton("🧭 Sweep")
+        self.sweep_button.setToolTip("Check every name this pattern can make, resuming where the last sweep stopped")
+        self.sweep_button.clicked.connect(self.sweep_clicked)
+        self.sweep_button.setStyleSheet("background-color: #2196F3; color: white; padding: 8px; font-weight: bold;")
+        row2.addWidget(self.sweep_button)
+        self.shuffle_checkbox = QCheckBox("Shuffled")
+        self.shuffle_checkbox.setToolTip("Sweep in a random order instead of a to z")
+        row2.addWidget(self.shuffle_checkbox)
         
         self.debug_checkbox = QCheckBox("🐛 Debug Mode (Detailed)")
         self.debug_checkbox.setToolTip("Show detailed analysis of each username")
         row2.addWidget(self.debug_checkbox)
         
+        row2.addWidget(QLabel("Workers:"))
+        self.workers_input = QLineEdit("2")
+        self.workers_input.setMaximumWidth(50)
+        self.workers_input.setToolTip("Starting number of requests in flight on this session (adapts up to 4x)")
+        row2.addWidget(self.workers_input)
+        
+        row2.addWidget(QLabel("Delay (s):"))
+        self.delay_input = QLineEdit("2")
+        self.delay_input.setMaximumWidth(50)
+        self.delay_input.setToolTip("Starting spacing between request starts, shared by all workers (adapts to 429s)")
+        row2.addWidget(self.delay_input)
+        
         row2.addStretch()
         gen_layout.addLayout(row2)
         
@@ -453,6 +161,15 @@ class App(QMainWindow):
         self.input_text = QTextEdit()
         self.input_text.setPlaceholderText("Enter usernames here\n(one per line)\n\nExample:\ncoolname\nawesomeguy\ntestuser123")
         input_box.addWidget(self.input_text)
+        stream_row = QHBoxLayout()
+        self.stream_button = QPushButton("📂 Stream from file")
+        self.stream_button.setToolTip("Check a big list straight from a text file instead of pasting it here")
+        self.stream_button.clicked.connect(self.toggle_wordlist)
+        stream_row.addWidget(self.stream_button)
+        self.stream_label = QLabel()
+        stream_row.addWidget(self.stream_label)
+        stream_row.addStretch()
+        input_box.addLayout(stream_row)
         
         # Output side
         output_box = QVBoxLayout()
@@ -460,10 +177,12 @@ class App(QMainWindow):
         output_label.setStyleSheet("font-weight: bold;")
         output_box.addWidget(output_label)
         
-        self.output_text = QTextEdit()
-        self.output_text.setReadOnly(True)
+        self.output_text = LogView()
         self.output_text.setStyleSheet("background-color: #2b2b2b; color: #ffffff; font-family: Consolas, Monaco, monospace; padding: 10px;")
         output_box.addWidget(self.output_text)
+        self.hits_only_checkbox = QCheckBox("Only show AVAILABLE")
+        self.hits_only_checkbox.toggled.connect(self.output_text.set_only_hits)
+        output_box.addWidget(self.hits_only_checkbox)
         
         io_layout.addLayout(input_box)
         io_layout.addLayout(output_box)
@@ -522,73 +241,41 @@ class App(QMainWindow):
         except:
             count = 10
 
-        generated = []
-        
-        for _ in range(count):
-            username = ""
-            
-            if pattern == "Letters only (abc)":
-                # Just random letters
-                username = "".join(random.choice(string.ascii_lowercase) for _ in range(length))
-            
-            elif pattern == "Letters + Numbers (a1b2)":
-                # Mix of letters and numbers
-                chars = string.ascii_lowercase + string.digits
-                username = "".join(random.choice(chars) for _ in range(length))
-            
-            elif pattern == "Numbers + Letters (12ab)":
-                # Start with numbers, then letters
-                num_count = random.randint(1, max(1, length - 2))
-                letter_count = length - num_count
-                username = "".join(random.choice(string.digits) for _ in range(num_count))
-                username += "".join(random.choice(string.ascii_lowercase) for _ in range(letter_count))
-            
-            elif pattern == "Letters_Letters (abc_def)":
-                # Two parts separated by underscore
-                part1_len = length // 2
-                part2_len = length - part1_len
-                part1 = "".join(random.choice(string.ascii_lowercase) for _ in range(part1_len))
-                part2 = "".join(random.choice(string.ascii_lowercase) for _ in range(part2_len))
-                username = f"{part1}_{part2}"
-            
-            elif pattern == "Prefix_Letters (og_abc)":
-                # Use prefix field + underscore + random letters
-                if prefix:
-                    letters = "".join(random.choice(string.ascii_lowercase) for _ in range(length))
-                    username = f"{prefix}_{letters}"
-                else:
-                    # Fallback if no prefix
-                    username = "".join(random.choice(string.ascii_lowercase) for _ in range(length))
-            
-            elif pattern == "Letters_Suffix (abc_og)":
-                # Random letters + underscore + suffix field
-                if suffix:
-                    letters = "".join(random.choice(string.ascii_lowercase) for _ in range(length))
-                    username = f"{letters}_{suffix}"
-                else:
-                    # Fallback if no suffix
-                    username = "".join(random.choice(string.ascii_lowercase) for _ in range(length))
-            
-            # Add prefix and suffix if provided (for non-pattern modes)
-            if pattern in ["Letters only (abc)", "Letters + Numbers (a1b2)", "Numbers + Letters (12ab)"]:
-                username = prefix + username + suffix
-            
+        def clean(username):
             # Instagram rule: Cannot end with underscore or dot
             # Fix by replacing trailing _ or . with a random letter
             while username and username[-1] in ['_', '.']:
                 username = username[:-1] + random.choice(string.ascii_lowercase)
-            
             # Make sure it's valid
             if username and username.replace('_', '').replace('.', '').isalnum():
-                generated.append(username)
+                return username
+            return None
+        sampler = NameSampler("instagram", pattern, length, prefix, suffix, shared_cache())
+        generated = sampler.take(count, clean)
 
-        existing = self.input_text.toPlainText().strip()
-        all_users = ("\n".join(generated) if not existing else existing + "\n" + "\n".join(generated))
-        self.input_text.setText(all_users)
+        append_lines(self.input_text, generated)
         
         self.status_label.setText(f"✅ Generated {len(generated)} usernames")
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #c8e6c9; border-radius: 3px;")
 
+    def sweep_clicked(self):
+        """Check every name the pattern can make instead of a generated batch."""
+        if self.thread is not None and self.thread.isRunning():
+            return
+        try:
+            length = int(self.length_input.text())
+        except:
+            length = 5
+        prefix = self.prefix_input.text().strip()
+        suffix = self.suffix_input.text().strip()
+        pattern = self.pattern_combo.currentText()
+        self.sweep = Sweep("instagram", pattern, length, prefix, suffix, shared_cache(),
+                           shuffled=self.shuffle_checkbox.isChecked(), clean=InstagramChecker.clean_username)
+        try:
+            self.start_clicked()   # takes the sweep through get_usernames()
+        finally:
+            self.sweep = None
+
     def start_clicked(self):
         sessionid = ''.join(self.sessionid_input.text().split())  # Remove ALL whitespace incl. hidden \n \r
         if not sessionid:
@@ -602,17 +289,27 @@ class App(QMainWindow):
         
         ua = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         debug = self.debug_checkbox.isChecked()
+        try:
+            workers = max(1, int(self.workers_input.text()))
+        except:
+            workers = 2
+        try:
+            delay = max(0.0, float(self.delay_input.text()))
+        except:
+            delay = 2.0
         
-        self.progress_bar.setMaximum(len(usernames))
+        self.progress_bar.setMaximum(progress_max(usernames))
         self.progress_bar.setValue(0)
         self.output_text.clear()
         self.start_button.setEnabled(False)
         self.stop_button.setEnabled(True)
-        self.status_label.setText(f"🔄 Checking {len(usernames)} usernames...")
+        self.status_label.setText(f"🔄 Checking {describe(usernames)}...")
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #fff9c4; border-radius: 3px;")
 
-        self.thread = Checker(usernames, sessionid, ua, debug)
+        self.source = usernames
+        self.thread = Checker(usernames, sessionid, ua, debug, workers, delay)
         self.thread.update.connect(self.update_text)
+        self.thread.results.connect(self.output_text.add_results)
         self.thread.pupdate.connect(self.update_progress)
         self.thread.finished.connect(self.checking_finished)
         self.thread.start()
@@ -632,24 +329,46 @@ class App(QMainWindow):
 
     def update_text(self, text):
         self.output_text.append(text)
-        cursor = self.output_text.textCursor()
-        cursor.movePosition(cursor.End)
-        self.output_text.setTextCursor(cursor)
 
     def update_progress(self, value):
+        if isinstance(self.source, Wordlist):   # count unknown, so go by how far into the file we are
+            step = self.source.progress()
+            self.progress_bar.setValue(step)
+            self.status_label.setText(f"🔄 Progress: {value} checked, {step * 100 // Wordlist.STEPS}% of {self.source.name}")
+            return
         self.progress_bar.setValue(value)
         total = self.progress_bar.maximum()
         percent = int((value / total) * 100) if total > 0 else 0
         self.status_label.setText(f"🔄 Progress: {value}/{total} ({percent}%)")
 
+    def toggle_wordlist(self):
+        if self.wordlist is not None:
+            self.wordlist = None
+            self.stream_button.setText("📂 Stream from file")
+            self.stream_label.clear()
+            self.input_text.setEnabled(True)
+            return
+        path, _ = QFileDialog.getOpenFileName(self, "Stream Usernames", "", "Text Files (*.txt);;All Files (*)")
+        if path:
+            self.stream_file(path)
+
+    def stream_file(self, path):
+        """Check the names in `path` straight from the file; the input box is ignored until the file is closed."""
+        self.wordlist = Wordlist(path, InstagramChecker.clean_username)
+        self.stream_button.setText("✖ Close file")
+        self.stream_label.setText(f"Reading usernames from {self.wordlist}")
+        self.input_text.setEnabled(False)
+
     def get_usernames(self):
+        if self.sweep is not None:
+            return self.sweep   # names are produced as the checker asks for them
+        if self.wordlist is not None:
+            return self.wordlist
         txt = self.input_text.toPlainText().strip()
         usernames = []
         for line in txt.splitlines():
-            u = line.strip().lower()
-            if u.startswith('@'):
-                u = u[1:]
-            if u and u.replace('_', '').replace('.', '').isalnum():
+            u = InstagramChecker.clean_username(line)
+            if u:
                 usernames.append(u)
         return usernames
 
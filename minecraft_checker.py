@@ -1,205 +1,18 @@
 # super fast bulk minecraft username checker with rate contol, so don't panick if it slows down.
-import sys, requests, random, string, traceback, time, threading, concurrent.futures
+import sys, requests
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import QFont
+from checker_core.keyspace import NameSampler, Sweep
+from checker_core.qt import QtChecker, append_lines, describe, progress_max, shared_cache
+from checker_core.logview import LogView
+from checker_core.wordlist import Wordlist
+from checker_core.platforms.minecraft import MinecraftChecker
 
 # ------------------- Checker Thread ------------------- #
-class Checker(QThread):
-	update = pyqtSignal(str)
-	pupdate = pyqtSignal(int)
-
-
-	def __init__(self, usernames, webhook_url=None, debug=False, save_to_file=True):
-		super().__init__()
-		self.usernames = usernames
-		self.webhook_url = webhook_url
-		self.running = True
-		self.debug = debug
-		self.save_to_file = save_to_file
-		self.consecutive_errors = 0
-		self.count = 0
-		self.count_lock = threading.Lock()
-		self.file_lock = threading.Lock()
-		self.thread_local = threading.local()
-		self.request_delay = 0.2
-		self.rate_lock = threading.Lock()
-		self.last_request_time = 0
-
-	def run(self):
-		available_usernames = []
-		file_handle = None
-		rate_limited_usernames = []
-		if self.save_to_file:
-			try:
-				file_handle = open("available_minecraft_usernames.txt", "a")
-			except Exception as e:
-				file_handle = None
-				if self.debug:
-					self.update.emit(f"[DEBUG] Failed to open file: {e}")
-
-		def worker(username):
-			if not self.running:
-				return
-			result = self.check_username(username, file_handle, rate_limited_usernames)
-			with self.count_lock:
-				self.count += 1
-				self.pupdate.emit(self.count)
-			return result
-
-		with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-			for username in self.usernames:
-				executor.submit(worker, username)
-
-		if file_handle:
-			file_handle.close()
-
-		# Pause before retrying rate-limited usernames
-		if rate_limited_usernames:
-			self.update.emit(f"\n⏳ Waiting 30 seconds before retrying {len(rate_limited_usernames)} rate-limited usernames...")
-			time.sleep(30)
-			self.count_lock.acquire()
-			self.count = 0
-			self.count_lock.release()
-			if self.save_to_file:
-				try:
-					file_handle = open("available_minecraft_usernames.txt", "a")
-				except Exception as e:
-					file_handle = None
-					if self.debug:
-						self.update.emit(f"[DEBUG] Failed to open file for retry: {e}")
-			def retry_worker(username):
-				if not self.running:
-					return
-				result = self.check_username(username, file_handle)
-				with self.count_lock:
-					self.count += 1
-					self.pupdate.emit(self.count)
-				return result
-			with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-				for username in rate_limited_usernames:
-					executor.submit(retry_worker, username)
-			if file_handle:
-				file_handle.close()
-
-	def stop(self):
-		self.running = False
-
-	def get_session(self):
-		if not hasattr(self.thread_local, 'session'):
-			session = requests.Session()
-			session.headers.update({
-				'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-			})
-			self.thread_local.session = session
-		return self.thread_local.session
-
-	def check_username(self, username, file_handle=None, rate_limited_usernames=None):
-		if not self.running:
-			return
-
-		retries = 0
-		max_retries = 2
-		while retries <= max_retries:
-			if not self.running:
-				return
-			# Global request limiter
-			with self.rate_lock:
-				now = time.time()
-				wait = self.request_delay - (now - self.last_request_time)
-				if wait > 0:
-					time.sleep(wait)
-				self.last_request_time = time.time()
-			# Random jitter
-			time.sleep(random.uniform(0.02, 0.08))
-			try:
-				url = f"https://api.mojang.com/users/profiles/minecraft/{username}"
-				if self.debug:
-					self.update.emit(f"\n{'='*60}")
-					self.update.emit(f"[DEBUG] Checking: {username}")
-					self.update.emit(f"[DEBUG] URL: {url}")
-
-				session = self.get_session()
-				response = session.get(url, timeout=10)
-
-				if self.debug:
-					self.update.emit(f"[DEBUG] Status Code: {response.status_code}")
-
-				if response.status_code == 200:
-					self.update.emit(f"❌ [TAKEN] {username}")
-					self.consecutive_errors = 0
-					if self.request_delay > 0.2:
-						self.request_delay = max(0.1, self.request_delay * 0.9)
-					return
-				elif response.status_code == 204 or response.status_code == 404:
-					self.update.emit(f"✅ [AVAILABLE] {username}")
-					self.consecutive_errors = 0
-					if self.request_delay > 0.2:
-						self.request_delay = max(0.1, self.request_delay * 0.9)
-					if file_handle:
-						try:
-							with self.file_lock:
-								file_handle.write(f"{username}\n")
-						except Exception as e:
-							if self.debug:
-								self.update.emit(f"[DEBUG] Failed to save to file: {e}")
-					if self.webhook_url:
-						self.send_to_discord(username)
-					return
-				elif response.status_code == 429:
-					self.update.emit(f"⚠️ [RATE LIMIT] {username}: Mojang is rate limiting! Skipping for now.")
-					self.request_delay = min(10, self.request_delay * 1.7)
-					if rate_limited_usernames is not None:
-						rate_limited_usernames.append(username)
-					return
-				else:
-					self.update.emit(f"⚠️ [UNKNOWN] {username}: Status {response.status_code}")
-					self.consecutive_errors += 1
-					retries += 1
-			except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
-				self.consecutive_errors += 1
-				self.update.emit(f"⏱️ [TIMEOUT/CONN ERROR] {username} (retry {retries+1})")
-				sleep_time = min(30, 2 ** self.consecutive_errors)
-				time.sleep(sleep_time)
-				retries += 1
-			except Exception as e:
-				self.consecutive_errors += 1
-				if self.debug:
-					error_msg = traceback.format_exc()
-					self.update.emit(f"⚠️ [ERROR] {username}:\n{error_msg}")
-				else:
-					error_msg = str(e)
-					self.update.emit(f"⚠️ [ERROR] {username}: {error_msg}")
-				retries += 1
-		self.update.emit(f"❌ [FAILED] {username} after {max_retries+1} attempts")
-
-	def send_to_discord(self, username):
-		try:
-			webhook_data = {
-				"content": "",
-				"tts": False,
-				"embeds": [
-					{
-						"id": 487189062,
-						"description": f"`{username}` [is available for **Minecraft**!](https://namemc.com/profile/{username})",
-						"fields": [],
-						"color": 9158523
-					}
-				],
-				"components": [],
-				"actions": {},
-				"flags": 0
-			}
-			response = self.session.post(self.webhook_url, json=webhook_data, timeout=5)
-			if response.status_code == 204:
-				if self.debug:
-					self.update.emit(f"[DEBUG] ✅ Sent {username} to Discord webhook")
-			else:
-				if self.debug:
-					self.update.emit(f"[DEBUG] ⚠️ Webhook failed: Status {response.status_code}")
-		except Exception as e:
-			if self.debug:
-				self.update.emit(f"[DEBUG] ⚠️ Webhook error: {str(e)}")
+class Checker(QtChecker):
+	def __init__(self, *args, **kwargs):
+		super().__init__(MinecraftChecker(*args, **kwargs))
 
 # ------------------- GUI App ------------------- #
 class App(QMainWindow):
@@ -208,6 +21,9 @@ class App(QMainWindow):
 		self.setWindowTitle("Minecraft Username Checker")
 		self.setGeometry(150, 150, 1100, 800)
 		self.thread = None
+		self.sweep = None
+		self.wordlist = None
+		self.source = None   # what the current run reads its names from
 		self.initUI()
 
 	def initUI(self):
@@ -298,6 +114,14 @@ class App(QMainWindow):
 		self.gen_button.clicked.connect(self.generate_usernames)
 		self.gen_button.setStyleSheet("background-color: #4caf50; color: white; padding: 8px; font-weight: bold;")
 		row2.addWidget(self.gen_button)
+		self.sweep_button = QPushButton("🧭 Sweep")
+		self.sweep_button.setToolTip("Check every name this pattern can make, resuming where the last sweep stopped")
+		self.sweep_button.clicked.connect(self.sweep_clicked)
+		self.sweep_button.setStyleSheet("background-color: #4caf50; color: white; padding: 8px; font-weight: bold;")
+		row2.addWidget(self.sweep_button)
+		self.shuffle_checkbox = QCheckBox("Shuffled")
+		self.shuffle_checkbox.setToolTip("Sweep in a random order instead of a to z")
+		row2.addWidget(self.shuffle_checkbox)
 		self.debug_checkbox = QCheckBox("🐛 Debug Mode (Detailed)")
 		self.debug_checkbox.setToolTip("Show detailed responses")
 		row2.addWidget(self.debug_checkbox)
@@ -305,6 +129,20 @@ class App(QMainWindow):
 		self.save_checkbox.setChecked(True)
 		self.save_checkbox.setToolTip("Save available usernames to file")
 		row2.addWidget(self.save_checkbox)
+		self.bulk_checkbox = QCheckBox("📦 Bulk Lookup")
+		self.bulk_checkbox.setChecked(True)
+		self.bulk_checkbox.setToolTip("Ask Mojang about 10 names per request, falling back to single lookups on errors")
+		row2.addWidget(self.bulk_checkbox)
+		row2.addWidget(QLabel("Workers:"))
+		self.workers_input = QLineEdit("5")
+		self.workers_input.setMaximumWidth(50)
+		self.workers_input.setToolTip("Starting number of requests in flight (adapts up to 4x)")
+		row2.addWidget(self.workers_input)
+		row2.addWidget(QLabel("Rate (/s):"))
+		self.rate_input = QLineEdit("5")
+		self.rate_input.setMaximumWidth(50)
+		self.rate_input.setToolTip("Starting requests per second, shared by all workers (adapts to 429s)")
+		row2.addWidget(self.rate_input)
 		row2.addStretch()
 		gen_layout.addLayout(row2)
 		gen_group.setLayout(gen_layout)
@@ -321,14 +159,25 @@ class App(QMainWindow):
 		self.input_text = QTextEdit()
 		self.input_text.setPlaceholderText("Enter usernames here\n(one per line)\n\nExample:\nSteve\nAlex\nHerobrine")
 		input_box.addWidget(self.input_text)
+		stream_row = QHBoxLayout()
+		self.stream_button = QPushButton("📂 Stream from file")
+		self.stream_button.setToolTip("Check a big list straight from a text file instead of pasting it here")
+		self.stream_button.clicked.connect(self.toggle_wordlist)
+		stream_row.addWidget(self.stream_button)
+		self.stream_label = QLabel()
+		stream_row.addWidget(self.stream_label)
+		stream_row.addStretch()
+		input_box.addLayout(stream_row)
 		output_box = QVBoxLayout()
 		output_label = QLabel("📊 Results:")
 		output_label.setStyleSheet("font-weight: bold;")
 		output_box.addWidget(output_label)
-		self.output_text = QTextEdit()
-		self.output_text.setReadOnly(True)
+		self.output_text = LogView()
 		self.output_text.setStyleSheet("background-color: #1a1a1a; color: #00ff00; font-family: Consolas, Monaco, monospace; padding: 10px;")
 		output_box.addWidget(self.output_text)
+		self.hits_only_checkbox = QCheckBox("Only show AVAILABLE")
+		self.hits_only_checkbox.toggled.connect(self.output_text.set_only_hits)
+		output_box.addWidget(self.hits_only_checkbox)
 		io_layout.addLayout(input_box)
 		io_layout.addLayout(output_box)
 		io_group.setLayout(io_layout)
@@ -373,52 +222,17 @@ class App(QMainWindow):
 			count = int(self.count_input.text())
 		except:
 			count = 10
-		generated = []
-		attempts = 0
-		max_attempts = count * 3
-		while len(generated) < count and attempts < max_attempts:
-			attempts += 1
-			username = ""
-			if pattern == "Letters only (abc)":
-				username = "".join(random.choice(string.ascii_lowercase) for _ in range(length))
-			elif pattern == "Letters + Numbers (a1b2)":
-				chars = string.ascii_lowercase + string.digits
-				username = "".join(random.choice(chars) for _ in range(length))
-			elif pattern == "Numbers + Letters (12ab)":
-				num_count = random.randint(1, max(1, length - 2))
-				letter_count = length - num_count
-				username = "".join(random.choice(string.digits) for _ in range(num_count))
-				username += "".join(random.choice(string.ascii_lowercase) for _ in range(letter_count))
-			elif pattern == "Numbers only (1234)":
-				username = "".join(random.choice(string.digits) for _ in range(length))
-			elif pattern == "Letters_Letters (abc_def)":
-				part1_len = length // 2
-				part2_len = length - part1_len
-				part1 = "".join(random.choice(string.ascii_lowercase) for _ in range(part1_len))
-				part2 = "".join(random.choice(string.ascii_lowercase) for _ in range(part2_len))
-				username = f"{part1}_{part2}"
-			elif pattern == "CamelCase (AbcDef)":
-				parts = []
-				remaining = length
-				while remaining > 0:
-					part_len = random.randint(2, min(4, remaining))
-					part = "".join(random.choice(string.ascii_lowercase) for _ in range(part_len))
-					part = part.capitalize()
-					parts.append(part)
-					remaining -= part_len
-				username = "".join(parts)
-			username = prefix + username + suffix
+		def clean(username):
 			# Minecraft username validation: 3-16 chars, letters, numbers, underscores
 			username = ''.join(c for c in username if c.isalnum() or c == '_')
-			if 3 <= len(username) <= 16 and username not in generated:
-				generated.append(username)
+			return username if 3 <= len(username) <= 16 else None
+		sampler = NameSampler("minecraft", pattern, length, prefix, suffix, shared_cache())
+		generated = sampler.take(count, clean)
 		if len(generated) == 0:
 			self.status_label.setText(f"⚠️ No valid usernames generated")
 			self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #fff3cd; border-radius: 3px;")
 			return
-		existing = self.input_text.toPlainText().strip()
-		all_usernames = ("\n".join(generated) if not existing else existing + "\n" + "\n".join(generated))
-		self.input_text.setText(all_usernames)
+		append_lines(self.input_text, generated)
 		self.status_label.setText(f"✅ Generated {len(generated)} usernames")
 		self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #c8e6c9; border-radius: 3px;")
 
@@ -446,6 +260,24 @@ class App(QMainWindow):
 		except Exception as e:
 			QMessageBox.critical(self, "Error", f"❌ Failed to send test message:\n{str(e)}")
 
+	def sweep_clicked(self):
+		"""Check every name the pattern can make instead of a generated batch."""
+		if self.thread is not None and self.thread.isRunning():
+			return
+		try:
+			length = int(self.length_input.text())
+		except:
+			length = 3
+		prefix = self.prefix_input.text().strip()
+		suffix = self.suffix_input.text().strip()
+		pattern = self.pattern_combo.currentText()
+		self.sweep = Sweep("minecraft", pattern, length, prefix, suffix, shared_cache(),
+			shuffled=self.shuffle_checkbox.isChecked(), clean=MinecraftChecker.clean_username)
+		try:
+			self.start_clicked()   # takes the sweep through get_usernames()
+		finally:
+			self.sweep = None
+
 	def start_clicked(self):
 		usernames = self.get_usernames()
 		if not usernames:
@@ -453,13 +285,22 @@ class App(QMainWindow):
 			return
 		debug = self.debug_checkbox.isChecked()
 		save_to_file = self.save_checkbox.isChecked()
+		bulk = self.bulk_checkbox.isChecked()
+		try:
+			workers = max(1, int(self.workers_input.text()))
+		except:
+			workers = 5
+		try:
+			rate = max(0.1, float(self.rate_input.text()))
+		except:
+			rate = 5.0
 		webhook_url = self.webhook_input.text().strip() or None
-		self.progress_bar.setMaximum(len(usernames))
+		self.progress_bar.setMaximum(progress_max(usernames))
 		self.progress_bar.setValue(0)
 		self.output_text.clear()
 		self.start_button.setEnabled(False)
 		self.stop_button.setEnabled(True)
-		status_text = f"🔄 Checking {len(usernames)} usernames"
+		status_text = f"🔄 Checking {describe(usernames)}"
 		if save_to_file:
 			status_text += " (saving to file)"
 		if webhook_url:
@@ -467,8 +308,10 @@ class App(QMainWindow):
 		status_text += "..."
 		self.status_label.setText(status_text)
 		self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #fff9c4; border-radius: 3px;")
-		self.thread = Checker(usernames, webhook_url, debug, save_to_file)
+		self.source = usernames
+		self.thread = Checker(usernames, webhook_url, debug, save_to_file, bulk, workers, rate)
 		self.thread.update.connect(self.update_text)
+		self.thread.results.connect(self.output_text.add_results)
 		self.thread.pupdate.connect(self.update_progress)
 		self.thread.finished.connect(self.checking_finished)
 		self.thread.start()
@@ -488,11 +331,13 @@ class App(QMainWindow):
 
 	def update_text(self, text):
 		self.output_text.append(text)
-		cursor = self.output_text.textCursor()
-		cursor.movePosition(cursor.End)
-		self.output_text.setTextCursor(cursor)
 
 	def update_progress(self, value):
+		if isinstance(self.source, Wordlist):   # count unknown, so go by how far into the file we are
+			step = self.source.progress()
+			self.progress_bar.setValue(step)
+			self.status_label.setText(f"🔄 Progress: {value} checked, {step * 100 // Wordlist.STEPS}% of {self.source.name}")
+			return
 		self.progress_bar.setValue(value)
 		total = self.progress_bar.maximum()
 		percent = 0
@@ -500,13 +345,34 @@ class App(QMainWindow):
 			percent = int((value / total) * 100)
 		self.status_label.setText(f"🔄 Progress: {value}/{total} ({percent}%)")
 
+	def toggle_wordlist(self):
+		if self.wordlist is not None:
+			self.wordlist = None
+			self.stream_button.setText("📂 Stream from file")
+			self.stream_label.clear()
+			self.input_text.setEnabled(True)
+			return
+		path, _ = QFileDialog.getOpenFileName(self, "Stream Usernames", "", "Text Files (*.txt);;All Files (*)")
+		if path:
+			self.stream_file(path)
+
+	def stream_file(self, path):
+		"""Check the names in `path` straight from the file; the input box is ignored until the file is closed."""
+		self.wordlist = Wordlist(path, MinecraftChecker.clean_username)
+		self.stream_button.setText("✖ Close file")
+		self.stream_label.setText(f"Reading usernames from {self.wordlist}")
+		self.input_text.setEnabled(False)
+
 	def get_usernames(self):
+		if self.sweep is not None:
+			return self.sweep   # names are produced as the checker asks for them
+		if self.wordlist is not None:
+			return self.wordlist
 		txt = self.input_text.toPlainText().strip()
 		usernames = []
 		for line in txt.splitlines():
-			u = line.strip()
-			# Minecraft allows letters, numbers, underscores, 3-16 chars
-			if u and all(c.isalnum() or c == '_' for c in u) and 3 <= len(u) <= 16:
+			u = MinecraftChecker.clean_username(line)
+			if u:
 				usernames.append(u)
 		return list(dict.fromkeys(usernames))
 
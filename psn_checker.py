@@ -1,217 +1,17 @@
-import sys, random, string, traceback, time, json, requests
+import sys, requests
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import QFont
+from checker_core.keyspace import NameSampler, Sweep
+from checker_core.qt import QtChecker, append_lines, describe, progress_max, shared_cache
+from checker_core.logview import LogView
+from checker_core.wordlist import Wordlist
+from checker_core.platforms.psn import PSNChecker, PSNAWP_AVAILABLE
 
-# ---------------------------------------------------------------------------
-# Lazy-import PSNAWP so the app can still launch and show the install error
-# ---------------------------------------------------------------------------
-try:
-    from psnawp_api import PSNAWP
-    from psnawp_api.models.user import User
-    PSNAWP_AVAILABLE = True
-except ImportError:
-    PSNAWP_AVAILABLE = False
 
-
-class Checker(QThread):
-    update  = pyqtSignal(str)
-    pupdate = pyqtSignal(int)
-    count   = 0
-
-    def __init__(self, usernames, method="direct", npsso=None, webhook_url=None, debug=False):
-        super().__init__()
-        self.usernames   = usernames
-        self.method      = method  # "direct" or "psnawp"
-        self.npsso       = npsso
-        self.webhook_url = webhook_url
-        self.running     = True
-        self.debug       = debug
-        self.psnawp      = None
-        
-        # Direct API settings
-        self.api_url = "https://accounts.api.playstation.com/api/v1/accounts/onlineIds"
-        self.api_headers = {
-            "Host": "accounts.api.playstation.com",
-            "Connection": "keep-alive",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
-            "Content-Type": "application/json; charset=UTF-8",
-            "Accept": "*/*",
-            "Origin": "https://id.sonyentertainmentnetwork.com",
-            "Referer": "https://id.sonyentertainmentnetwork.com/",
-            "Accept-Language": "en-US,en;q=0.9"
-        }
-
-    # ------------------------------------------------------------------
-    def run(self):
-        if self.method == "psnawp":
-            self.run_psnawp()
-        else:
-            self.run_direct()
-
-    # ------------------------------------------------------------------
-    def run_direct(self):
-        """Direct API method - no auth required"""
-        self.update.emit("[INFO] Using Direct API (no authentication required)")
-        
-        for username in self.usernames:
-            if not self.running:
-                break
-            self.check_user_direct(username)
-            self.count += 1
-            self.pupdate.emit(self.count)
-            time.sleep(1.2)  # Slower rate to avoid 429 errors
-
-    # ------------------------------------------------------------------
-    def check_user_direct(self, username):
-        """Check username using direct Sony API"""
-        if not self.running:
-            return
-        
-        payload = {
-            "onlineId": username,
-            "reserveIfAvailable": False
-        }
-        
-        try:
-            response = requests.post(self.api_url, json=payload, headers=self.api_headers, timeout=10)
-            status = response.status_code
-            
-            if self.debug:
-                self.update.emit(f"[DEBUG] {username} → HTTP {status}")
-            
-            # Available
-            if status in (200, 201):
-                self.update.emit(f"[AVAILABLE] {username}")
-                if self.webhook_url:
-                    self.send_to_discord(username)
-            
-            # Taken or invalid
-            elif status == 400:
-                try:
-                    data = response.json()
-                    header_code = response.headers.get("X-ErrorCode", "")
-                    body_code = data[0].get("code", "") if isinstance(data, list) and data else ""
-                    
-                    if header_code == "accounts:3101" or body_code == "3101":
-                        self.update.emit(f"[TAKEN] {username}")
-                    elif body_code == "1100":
-                        self.update.emit(f"[INVALID PATTERN] {username}")
-                    elif body_code == "3208":
-                        self.update.emit(f"[IMPROPER/RESTRICTED] {username}")
-                    else:
-                        if self.debug:
-                            self.update.emit(f"[ERROR] {username}: {data}")
-                        else:
-                            self.update.emit(f"[ERROR] {username}: Unknown 400 error")
-                except Exception as e:
-                    self.update.emit(f"[ERROR] {username}: Could not parse response")
-            
-            # Rejected by policy
-            elif status == 406:
-                self.update.emit(f"[REJECTED/RESTRICTED] {username}")
-            
-            # Rate limited
-            elif status == 429:
-                self.update.emit(f"[RATE LIMIT] {username} – waiting 10s...")
-                time.sleep(10)
-                self.check_user_direct(username)  # Retry once
-            
-            # Other errors
-            else:
-                self.update.emit(f"[HTTP {status}] {username}")
-                
-        except requests.Timeout:
-            self.update.emit(f"[TIMEOUT] {username}")
-        except requests.RequestException as e:
-            self.update.emit(f"[REQUEST ERROR] {username}: {e}")
-        except Exception as e:
-            if self.debug:
-                self.update.emit(f"[ERROR] {username}:\n{traceback.format_exc()}")
-            else:
-                self.update.emit(f"[ERROR] {username}: {e}")
-
-    # ------------------------------------------------------------------
-    def run_psnawp(self):
-        """PSNAWP method - requires npsso token"""
-        try:
-            self.psnawp = PSNAWP(self.npsso)
-            if self.debug:
-                self.update.emit("[DEBUG] PSNAWP initialised – token exchange successful.")
-        except Exception as e:
-            self.update.emit(f"[AUTH ERROR] Failed to authenticate with PSN.\n"
-                             f"  • Make sure your npsso token is fresh (< 24 h old).\n"
-                             f"  • Detail: {e}")
-            return
-
-        for username in self.usernames:
-            if not self.running:
-                break
-            self.check_user_psnawp(username)
-            self.count += 1
-            self.pupdate.emit(self.count)
-            time.sleep(0.6)
-
-    # ------------------------------------------------------------------
-    def check_user_psnawp(self, username):
-        """Check username using PSNAWP library"""
-        if not self.running:
-            return
-        try:
-            user = self.psnawp.user(online_id=username)
-            if self.debug:
-                self.update.emit(f"[DEBUG] {username} → accountId: {user.account_id}")
-            self.update.emit(f"[TAKEN] {username}")
-
-        except Exception as e:
-            err_text = str(e).lower()
-
-            if any(phrase in err_text for phrase in
-                   ("not found", "no such user", "does not exist",
-                    "invalid online id", "user not found")):
-                self.update.emit(f"[AVAILABLE] {username}")
-                if self.webhook_url:
-                    self.send_to_discord(username)
-
-            elif "rate" in err_text or "429" in err_text or "too many" in err_text:
-                self.update.emit(f"[RATE LIMIT] {username} – waiting 15 s …")
-                time.sleep(15)
-                self.check_user_psnawp(username)
-
-            elif "401" in err_text or "unauthori" in err_text or "token" in err_text:
-                self.update.emit("[AUTH ERROR] Token expired – please get a fresh npsso and restart.")
-                self.running = False
-
-            else:
-                if self.debug:
-                    self.update.emit(f"[ERROR] {username}:\n{traceback.format_exc()}")
-                else:
-                    self.update.emit(f"[ERROR] {username}: {e}")
-
-    # ------------------------------------------------------------------
-    def stop(self):
-        self.running = False
-
-    # ------------------------------------------------------------------
-    def send_to_discord(self, username):
-        try:
-            webhook_data = {
-                "embeds": [{
-                    "title": "🎮 Available PlayStation Username",
-                    "description": f"**{username}** is available!",
-                    "color": 0x00ff00,
-                    "fields": [{"name": "Username", "value": f"`{username}`", "inline": True}],
-                    "footer": {"text": "Claim it fast on PlayStation.com!"},
-                    "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S')
-                }]
-            }
-            response = requests.post(self.webhook_url, json=webhook_data, timeout=5)
-            if self.debug and response.status_code == 204:
-                self.update.emit("[DEBUG] Sent to Discord webhook.")
-        except Exception as e:
-            if self.debug:
-                self.update.emit(f"[DEBUG] Webhook error: {e}")
+class Checker(QtChecker):
+    def __init__(self, *args, **kwargs):
+        super().__init__(PSNChecker(*args, **kwargs))
 
 
 # ======================================================================
@@ -221,6 +21,9 @@ class App(QMainWindow):
         self.setWindowTitle("PlayStation Username Checker")
         self.setGeometry(150, 150, 1100, 900)
         self.thread = None
+        self.sweep = None
+        self.wordlist = None
+        self.source = None   # what the current run reads its names from
         self.initUI()
 
     # ------------------------------------------------------------------
@@ -373,6 +176,14 @@ class App(QMainWindow):
         gen_btn.clicked.connect(self.generate_usernames)
         gen_btn.setStyleSheet("background-color: #0070cc; color: white; padding: 8px; font-weight: bold;")
         row2.addWidget(gen_btn)
+        self.sweep_button = QPushButton("🧭 Sweep")
+        self.sweep_button.setToolTip("Check every name this pattern can make, resuming where the last sweep stopped")
+        self.sweep_button.clicked.connect(self.sweep_clicked)
+        self.sweep_button.setStyleSheet("background-color: #0070cc; color: white; padding: 8px; font-weight: bold;")
+        row2.addWidget(self.sweep_button)
+        self.shuffle_checkbox = QCheckBox("Shuffled")
+        self.shuffle_checkbox.setToolTip("Sweep in a random order instead of a to z")
+        row2.addWidget(self.shuffle_checkbox)
         gen_layout.addLayout(row2)
 
         gen_group.setLayout(gen_layout)
@@ -386,6 +197,15 @@ class App(QMainWindow):
         self.input_text.setPlaceholderText("Enter usernames (one per line)")
         self.input_text.setMaximumHeight(120)
         input_layout.addWidget(self.input_text)
+        stream_row = QHBoxLayout()
+        self.stream_button = QPushButton("📂 Stream from file")
+        self.stream_button.setToolTip("Check a big list straight from a text file instead of pasting it here")
+        self.stream_button.clicked.connect(self.toggle_wordlist)
+        stream_row.addWidget(self.stream_button)
+        self.stream_label = QLabel()
+        stream_row.addWidget(self.stream_label)
+        stream_row.addStretch()
+        input_layout.addLayout(stream_row)
         input_group.setLayout(input_layout)
         main_layout.addWidget(input_group)
 
@@ -393,10 +213,11 @@ class App(QMainWindow):
         output_group  = QGroupBox("Results")
         output_group.setStyleSheet("QGroupBox { font-weight: bold; }")
         output_layout = QVBoxLayout()
-        self.output_text = QTextEdit()
-        self.output_text.setReadOnly(True)
-        self.output_text.setPlaceholderText("Results will appear here")
+        self.output_text = LogView()
         output_layout.addWidget(self.output_text)
+        self.hits_only_checkbox = QCheckBox("Only show AVAILABLE")
+        self.hits_only_checkbox.toggled.connect(self.output_text.set_only_hits)
+        output_layout.addWidget(self.hits_only_checkbox)
         output_group.setLayout(output_layout)
         main_layout.addWidget(output_group)
 
@@ -453,45 +274,13 @@ class App(QMainWindow):
         except ValueError:
             count = 20
 
-        generated = []
-        for _ in range(count):
-            if pattern == "Letters only":
-                username = "".join(random.choice(string.ascii_lowercase) for _ in range(length))
-            elif pattern == "Letters + Numbers":
-                chars    = string.ascii_lowercase + string.digits
-                username = "".join(random.choice(chars) for _ in range(length))
-            elif pattern == "Numbers + Letters":
-                num_count   = random.randint(1, max(1, length - 2))
-                letter_count = length - num_count
-                username = ("".join(random.choice(string.digits)          for _ in range(num_count))
-                          + "".join(random.choice(string.ascii_lowercase) for _ in range(letter_count)))
-            elif pattern == "Numbers only":
-                username = "".join(random.choice(string.digits) for _ in range(length))
-            elif pattern == "Letters_Letters":
-                p1 = length // 2
-                p2 = length - p1
-                username = ("".join(random.choice(string.ascii_lowercase) for _ in range(p1))
-                          + "_"
-                          + "".join(random.choice(string.ascii_lowercase) for _ in range(p2)))
-            elif pattern == "CamelCase":
-                parts, remaining = [], length
-                while remaining > 0:
-                    pl   = random.randint(2, min(4, remaining))
-                    part = "".join(random.choice(string.ascii_lowercase) for _ in range(pl))
-                    parts.append(part.capitalize())
-                    remaining -= pl
-                username = "".join(parts)
-            else:
-                username = "".join(random.choice(string.ascii_lowercase) for _ in range(length))
-
-            username = prefix + username + suffix
+        def clean(username):
             username = ''.join(c for c in username if c.isalnum() or c in '_-')
-            if 3 <= len(username) <= 16:
-                generated.append(username)
+            return username if 3 <= len(username) <= 16 else None
+        sampler = NameSampler("psn", pattern, length, prefix, suffix, shared_cache())
+        generated = sampler.take(count, clean)
 
-        existing = self.input_text.toPlainText().strip()
-        combined = "\n".join(generated) if not existing else existing + "\n" + "\n".join(generated)
-        self.input_text.setText(combined)
+        append_lines(self.input_text, generated)
 
         self.status_label.setText(f"Generated {len(generated)} usernames")
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold;"
@@ -516,6 +305,25 @@ class App(QMainWindow):
             QMessageBox.critical(self, "Error", f"❌ Failed: {e}")
 
     # ------------------------------------------------------------------
+    def sweep_clicked(self):
+        """Check every name the pattern can make instead of a generated batch."""
+        if self.thread is not None and self.thread.isRunning():
+            return
+        try:
+            length = int(self.length_input.text())
+        except ValueError:
+            length = 8
+        length = max(3, min(16, length))
+        prefix  = self.prefix_input.text().strip()
+        suffix  = self.suffix_input.text().strip()
+        pattern = self.pattern_combo.currentText()
+        self.sweep = Sweep("psn", pattern, length, prefix, suffix, shared_cache(),
+                           shuffled=self.shuffle_checkbox.isChecked(), clean=PSNChecker.clean_username)
+        try:
+            self.start_clicked()   # takes the sweep through get_usernames()
+        finally:
+            self.sweep = None
+
     def start_clicked(self):
         usernames = self.get_usernames()
         if not usernames:
@@ -551,19 +359,21 @@ class App(QMainWindow):
         debug        = self.debug_checkbox.isChecked()
         webhook_url  = self.webhook_input.text().strip() or None
 
-        self.progress_bar.setMaximum(len(usernames))
+        self.progress_bar.setMaximum(progress_max(usernames))
         self.progress_bar.setValue(0)
         self.output_text.clear()
         self.start_button.setEnabled(False)
         self.stop_button.setEnabled(True)
 
         method_name = "Direct API" if use_direct else "PSNAWP"
-        self.status_label.setText(f"Checking {len(usernames)} usernames using {method_name}...")
+        self.status_label.setText(f"Checking {describe(usernames)} using {method_name}...")
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold;"
                                         " background-color: #fff9c4; border-radius: 3px;")
 
+        self.source = usernames
         self.thread = Checker(usernames, method, npsso, webhook_url, debug)
         self.thread.update.connect(self.update_text)
+        self.thread.results.connect(self.output_text.add_results)
         self.thread.pupdate.connect(self.update_progress)
         self.thread.finished.connect(self.checking_finished)
         self.thread.start()
@@ -585,26 +395,48 @@ class App(QMainWindow):
 
     def update_text(self, text):
         self.output_text.append(text)
-        cursor = self.output_text.textCursor()
-        cursor.movePosition(cursor.End)
-        self.output_text.setTextCursor(cursor)
 
     def update_progress(self, value):
+        if isinstance(self.source, Wordlist):   # count unknown, so go by how far into the file we are
+            step = self.source.progress()
+            self.progress_bar.setValue(step)
+            self.status_label.setText(f"Progress: {value} checked, {step * 100 // Wordlist.STEPS}% of {self.source.name}")
+            return
         self.progress_bar.setValue(value)
         total   = self.progress_bar.maximum()
         percent = int((value / total) * 100) if total > 0 else 0
         self.status_label.setText(f"Progress: {value}/{total} ({percent}%)")
 
     # ------------------------------------------------------------------
+    def toggle_wordlist(self):
+        if self.wordlist is not None:
+            self.wordlist = None
+            self.stream_button.setText("📂 Stream from file")
+            self.stream_label.clear()
+            self.input_text.setEnabled(True)
+            return
+        path, _ = QFileDialog.getOpenFileName(self, "Stream Usernames", "", "Text Files (*.txt);;All Files (*)")
+        if path:
+            self.stream_file(path)
+
+    def stream_file(self, path):
+        """Check the names in `path` straight from the file; the input box is ignored until the file is closed."""
+        self.wordlist = Wordlist(path, PSNChecker.clean_username)
+        self.stream_button.setText("✖ Close file")
+        self.stream_label.setText(f"Reading usernames from {self.wordlist}")
+        self.input_text.setEnabled(False)
+
     def get_usernames(self):
+        if self.sweep is not None:
+            return self.sweep   # names are produced as the checker asks for them
+        if self.wordlist is not None:
+            return self.wordlist
         txt       = self.input_text.toPlainText().strip()
         usernames = []
         for line in txt.splitlines():
-            u = line.strip()
-            if u and 3 <= len(u) <= 16:
-                clean = ''.join(c for c in u if c.isalnum() or c in '_-')
-                if clean:
-                    usernames.append(clean)
+            u = PSNChecker.clean_username(line)
+            if u:
+                usernames.append(u)
         return usernames
 
 
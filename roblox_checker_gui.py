@@ -1,347 +1,17 @@
-import sys, requests, asyncio, random, string, traceback, json
-from datetime import datetime
+import sys, requests
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import QFont
-
-try:
-    from DrissionPage import Chromium, ChromiumOptions, errors
-    DRISSION_AVAILABLE = True
-except ImportError:
-    DRISSION_AVAILABLE = False
+from checker_core.keyspace import NameSampler, Sweep
+from checker_core.qt import QtChecker, append_lines, describe, progress_max, shared_cache
+from checker_core.logview import LogView
+from checker_core.wordlist import Wordlist
+from checker_core.platforms.roblox import RobloxChecker, DRISSION_AVAILABLE
 
 # ------------------- Checker Thread ------------------- #
-class Checker(QThread):
-    update = pyqtSignal(str)
-    pupdate = pyqtSignal(int)
-    count = 0
-
-    def __init__(self, usernames, webhook_url=None, debug=False, auto_signup=False, signup_password=None):
-        super().__init__()
-        self.usernames = usernames
-        self.webhook_url = webhook_url
-        self.running = True
-        self.debug = debug
-        self.consecutive_errors = 0
-        self.max_errors_before_pause = 3
-        self.auto_signup = auto_signup
-        self.signup_password = signup_password or "RobloxGen2024!"
-        self.created_accounts = []
-
-    def run(self):
-        for i, username in enumerate(self.usernames):
-            if not self.running:
-                break
-            self.check_user(username)
-            self.count += 1
-            self.pupdate.emit(self.count)
-
-    def stop(self):
-        self.running = False
-
-    def check_user(self, username):
-        if not self.running:
-            return
-
-        try:
-            url = "https://users.roblox.com/v1/usernames/users"
-            data = {"usernames": [username]}
-            
-            if self.debug:
-                self.update.emit(f"\n{'='*60}")
-                self.update.emit(f"[DEBUG] Checking: {username}")
-                self.update.emit(f"[DEBUG] API URL: {url}")
-            
-            response = requests.post(url, json=data, timeout=10)
-            
-            if self.debug:
-                self.update.emit(f"[DEBUG] Status Code: {response.status_code}")
-                self.update.emit(f"[DEBUG] Response: {response.text[:200]}")
-            
-            if response.status_code == 200:
-                result = response.json()
-                
-                if result.get("data") and len(result["data"]) > 0:
-                    user_data = result["data"][0]
-                    if user_data.get("id") is not None:
-                        user_id = user_data.get("id")
-                        display_name = user_data.get("displayName", username)
-                        self.update.emit(f"❌ [TAKEN] {username} (ID: {user_id}, Display: {display_name})")
-                        self.consecutive_errors = 0
-                        return
-                
-                # Username is available
-                self.update.emit(f"✅ [AVAILABLE] {username}")
-                self.consecutive_errors = 0
-                
-                # Send to Discord webhook if provided
-                if self.webhook_url:
-                    self.send_to_discord(username)
-                
-                # Auto sign-up if enabled
-                if self.auto_signup and DRISSION_AVAILABLE:
-                    self.update.emit(f"🔄 [AUTO-SIGNUP] Attempting to create account: {username}")
-                    success = self.create_account(username)
-                    if success:
-                        self.update.emit(f"🎉 [SUCCESS] Account created: {username}")
-                    else:
-                        self.update.emit(f"⚠️ [FAILED] Could not create account: {username}")
-                
-            elif response.status_code == 429:
-                self.update.emit(f"⚠️ [RATE LIMIT] {username}: Slow down!")
-                self.consecutive_errors += 1
-                
-            else:
-                self.update.emit(f"⚠️ [ERROR] {username}: Status {response.status_code}")
-                self.consecutive_errors += 1
-                
-        except requests.exceptions.Timeout:
-            self.consecutive_errors += 1
-            self.update.emit(f"⏱️ [TIMEOUT] {username}")
-            
-        except Exception as e:
-            self.consecutive_errors += 1
-            if self.debug:
-                error_msg = traceback.format_exc()
-                self.update.emit(f"⚠️ [ERROR] {username}:\n{error_msg}")
-            else:
-                error_msg = str(e)
-                self.update.emit(f"⚠️ [ERROR] {username}: {error_msg}")
-
-    def create_account(self, username):
-        """Create a Roblox account using DrissionPage"""
-        if not DRISSION_AVAILABLE:
-            self.update.emit(f"[DEBUG] DrissionPage not available")
-            return False
-        
-        chrome = None
-        try:
-            co = ChromiumOptions()
-            co.set_argument("--lang", "en")
-            co.auto_port().mute(True)
-            # Browser must be visible to properly detect redirects
-            
-            if self.debug:
-                self.update.emit(f"[DEBUG] Initializing browser for {username}")
-            
-            chrome = Chromium(addr_or_opts=co)
-            page = chrome.latest_tab
-            
-            if self.debug:
-                self.update.emit(f"[DEBUG] Navigating to signup page")
-            
-            # Navigate to signup page
-            page.get("https://www.roblox.com/CreateAccount")
-            
-            # Accept cookies if present
-            try:
-                page.ele('@class=btn-cta-lg cookie-btn btn-primary-md btn-min-width', timeout=3).click()
-                if self.debug:
-                    self.update.emit(f"[DEBUG] Accepted cookies")
-            except:
-                if self.debug:
-                    self.update.emit(f"[DEBUG] No cookie banner found")
-            
-            # Set birthday (random adult age)
-            from datetime import datetime
-            import locale
-            import time
-            
-            if self.debug:
-                self.update.emit(f"[DEBUG] Setting birthday")
-            
-            bdaymonthelement = page.ele("#MonthDropdown", timeout=10)
-            oldLocale = locale.getlocale(locale.LC_TIME)
-            try:
-                locale.setlocale(locale.LC_TIME, 'C')
-                currentMonth = datetime.now().strftime("%b")
-            finally:
-                try:
-                    locale.setlocale(locale.LC_TIME, oldLocale)
-                except:
-                    pass
-            
-            bdaymonthelement.select.by_value(currentMonth)
-            
-            bdaydayelement = page.ele("#DayDropdown", timeout=10)
-            currentDay = datetime.now().day
-            if currentDay <= 9:
-                bdaydayelement.select.by_value(f"0{currentDay}")
-            else:
-                bdaydayelement.select.by_value(str(currentDay))
-            
-            currentYear = datetime.now().year - 19
-            page.ele("#YearDropdown", timeout=10).select.by_value(str(currentYear))
-            
-            if self.debug:
-                self.update.emit(f"[DEBUG] Entering credentials")
-            
-            # Enter username and password
-            page.ele("#signup-username", timeout=10).input(username)
-            time.sleep(0.5)
-            page.ele("#signup-password", timeout=10).input(self.signup_password)
-            
-            # Wait a moment
-            time.sleep(2)
-            
-            # Accept terms
-            try:
-                checkbox = page.ele('@@id=signup-checkbox@@class=checkbox', timeout=3)
-                checkbox.click()
-                if self.debug:
-                    self.update.emit(f"[DEBUG] Accepted terms checkbox")
-            except:
-                # Try alternative checkbox selector
-                try:
-                    checkbox = page.ele('#signup-checkbox', timeout=2)
-                    checkbox.click()
-                    if self.debug:
-                        self.update.emit(f"[DEBUG] Accepted terms checkbox (alt method)")
-                except:
-                    if self.debug:
-                        self.update.emit(f"[DEBUG] Terms checkbox not required or already checked")
-                    pass
-            
-            time.sleep(1)
-            
-            if self.debug:
-                self.update.emit(f"[DEBUG] Submitting signup form")
-            
-            # Submit signup
-            page.ele("@@id=signup-button@@name=signupSubmit", timeout=10).click()
-            
-            # Wait longer and check for errors
-            time.sleep(8)
-            
-            # Check for error messages
-            try:
-                error_element = page.ele(".text-error", timeout=2)
-                if error_element:
-                    error_text = error_element.text
-                    self.update.emit(f"⚠️ [SIGNUP ERROR] {username}: {error_text}")
-                    if chrome:
-                        chrome.quit()
-                    return False
-            except:
-                pass
-            
-            # Check current URL
-            current_url = page.url
-            if self.debug:
-                self.update.emit(f"[DEBUG] Current URL: {current_url}")
-            
-            # Check if we're redirected to home (success)
-            if "home" in current_url.lower() or "/home" in current_url:
-                if self.debug:
-                    self.update.emit(f"[DEBUG] Successfully created account, getting cookies")
-                
-                # Get cookies
-                cookies = []
-                for cookie in page.cookies():
-                    cookies.append({
-                        "name": cookie["name"],
-                        "value": cookie["value"]
-                    })
-                
-                # Save account
-                account_data = {
-                    "username": username,
-                    "password": self.signup_password,
-                    "cookies": cookies,
-                    "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
-                self.created_accounts.append(account_data)
-                
-                # Save to file
-                self.save_account(account_data)
-                
-                if chrome:
-                    chrome.quit()
-                return True
-            else:
-                # Check if there's a captcha
-                try:
-                    captcha = page.get_frame('xpath://*[@id="arkose-iframe"]')
-                    if captcha:
-                        self.update.emit(f"⚠️ [CAPTCHA] {username}: Captcha detected, cannot auto-complete")
-                except:
-                    pass
-                
-                if self.debug:
-                    self.update.emit(f"[DEBUG] Signup did not redirect to home page")
-                
-                if chrome:
-                    chrome.quit()
-                return False
-                
-        except Exception as e:
-            error_msg = str(e)
-            if self.debug:
-                error_msg = traceback.format_exc()
-            self.update.emit(f"⚠️ [SIGNUP ERROR] {username}: {error_msg}")
-            try:
-                if chrome:
-                    chrome.quit()
-            except:
-                pass
-            return False
-    
-    def save_account(self, account_data):
-        """Save created account to files"""
-        try:
-            # Save to accounts.txt
-            with open("auto_created_accounts.txt", "a", encoding="utf-8") as f:
-                f.write(f"Username: {account_data['username']}, Password: {account_data['password']} (Created: {account_data['created_at']})\n")
-            
-            # Save to JSON with cookies
-            try:
-                with open("auto_created_cookies.json", "r", encoding="utf-8") as f:
-                    existing = json.load(f)
-            except:
-                existing = []
-            
-            existing.append(account_data)
-            
-            with open("auto_created_cookies.json", "w", encoding="utf-8") as f:
-                json.dump(existing, f, indent=4)
-                
-        except Exception as e:
-            if self.debug:
-                self.update.emit(f"[DEBUG] Error saving account: {str(e)}")
-
-    def send_to_discord(self, username):
-        """Send available username to Discord webhook"""
-        try:
-            webhook_data = {
-                "embeds": [{
-                    "title": "🎮 Available Roblox Username Found!",
-                    "description": f"**Username:** `{username}`",
-                    "color": 3447003,
-                    "fields": [
-                        {
-                            "name": "🔗 Direct Link",
-                            "value": f"https://www.roblox.com/search/users?keyword={username}",
-                            "inline": False
-                        }
-                    ],
-                    "footer": {
-                        "text": "Roblox Username Checker"
-                    }
-                }]
-            }
-            
-            response = requests.post(self.webhook_url, json=webhook_data, timeout=5)
-            
-            if response.status_code == 204:
-                if self.debug:
-                    self.update.emit(f"[DEBUG] ✅ Sent {username} to Discord webhook")
-            else:
-                if self.debug:
-                    self.update.emit(f"[DEBUG] ⚠️ Webhook failed: Status {response.status_code}")
-                    
-        except Exception as e:
-            if self.debug:
-                self.update.emit(f"[DEBUG] ⚠️ Webhook error: {str(e)}")
+class Checker(QtChecker):
+    def __init__(self, *args, **kwargs):
+        super().__init__(RobloxChecker(*args, **kwargs))
 
 # ------------------- GUI App ------------------- #
 class App(QMainWindow):
@@ -350,6 +20,9 @@ class App(QMainWindow):
         self.setWindowTitle("Roblox Username Checker with Auto Sign-Up")
         self.setGeometry(150, 150, 1100, 850)
         self.thread = None
+        self.sweep = None
+        self.wordlist = None
+        self.source = None   # what the current run reads its names from
         self.initUI()
 
     def initUI(self):
@@ -490,11 +163,24 @@ class App(QMainWindow):
         self.gen_button.clicked.connect(self.generate_usernames)
         self.gen_button.setStyleSheet("background-color: #3498db; color: white; padding: 8px; font-weight: bold;")
         row2.addWidget(self.gen_button)
+        self.sweep_button = QPushButton("🧭 Sweep")
+        self.sweep_button.setToolTip("Check every name this pattern can make, resuming where the last sweep stopped")
+        self.sweep_button.clicked.connect(self.sweep_clicked)
+        self.sweep_button.setStyleSheet("background-color: #3498db; color: white; padding: 8px; font-weight: bold;")
+        row2.addWidget(self.sweep_button)
+        self.shuffle_checkbox = QCheckBox("Shuffled")
+        self.shuffle_checkbox.setToolTip("Sweep in a random order instead of a to z")
+        row2.addWidget(self.shuffle_checkbox)
         
         self.debug_checkbox = QCheckBox("🛠 Debug Mode")
         self.debug_checkbox.setToolTip("Show detailed API responses")
         row2.addWidget(self.debug_checkbox)
         
+        self.batch_checkbox = QCheckBox("📦 Batch Mode")
+        self.batch_checkbox.setToolTip("Look up 100 names per request instead of one")
+        self.batch_checkbox.setChecked(True)
+        row2.addWidget(self.batch_checkbox)
+        
         row2.addStretch()
         gen_layout.addLayout(row2)
         
@@ -514,16 +200,27 @@ class App(QMainWindow):
         self.input_text = QTextEdit()
         self.input_text.setPlaceholderText("Enter usernames here\n(one per line)\n\nExample:\nCoolGamer123\nProPlayer\nEpicUser")
         input_box.addWidget(self.input_text)
+        stream_row = QHBoxLayout()
+        self.stream_button = QPushButton("📂 Stream from file")
+        self.stream_button.setToolTip("Check a big list straight from a text file instead of pasting it here")
+        self.stream_button.clicked.connect(self.toggle_wordlist)
+        stream_row.addWidget(self.stream_button)
+        self.stream_label = QLabel()
+        stream_row.addWidget(self.stream_label)
+        stream_row.addStretch()
+        input_box.addLayout(stream_row)
         
         output_box = QVBoxLayout()
         output_label = QLabel("📊 Results:")
         output_label.setStyleSheet("font-weight: bold;")
         output_box.addWidget(output_label)
         
-        self.output_text = QTextEdit()
-        self.output_text.setReadOnly(True)
+        self.output_text = LogView()
         self.output_text.setStyleSheet("background-color: #1a1a1a; color: #00ff00; font-family: Consolas, Monaco, monospace; padding: 10px;")
         output_box.addWidget(self.output_text)
+        self.hits_only_checkbox = QCheckBox("Only show AVAILABLE")
+        self.hits_only_checkbox.toggled.connect(self.output_text.set_only_hits)
+        output_box.addWidget(self.hits_only_checkbox)
         
         io_layout.addLayout(input_box)
         io_layout.addLayout(output_box)
@@ -576,51 +273,13 @@ class App(QMainWindow):
         except:
             count = 10
 
-        generated = []
-        
-        for _ in range(count):
-            username = ""
-            
-            if pattern == "Letters only (abc)":
-                username = "".join(random.choice(string.ascii_lowercase) for _ in range(length))
-            
-            elif pattern == "Letters + Numbers (a1b2)":
-                chars = string.ascii_lowercase + string.digits
-                username = "".join(random.choice(chars) for _ in range(length))
-            
-            elif pattern == "Numbers + Letters (12ab)":
-                num_count = random.randint(1, max(1, length - 2))
-                letter_count = length - num_count
-                username = "".join(random.choice(string.digits) for _ in range(num_count))
-                username += "".join(random.choice(string.ascii_lowercase) for _ in range(letter_count))
-            
-            elif pattern == "Letters_Letters (abc_def)":
-                part1_len = length // 2
-                part2_len = length - part1_len
-                part1 = "".join(random.choice(string.ascii_lowercase) for _ in range(part1_len))
-                part2 = "".join(random.choice(string.ascii_lowercase) for _ in range(part2_len))
-                username = f"{part1}_{part2}"
-            
-            elif pattern == "CamelCase (AbcDef)":
-                parts = []
-                remaining = length
-                while remaining > 0:
-                    part_len = random.randint(2, min(4, remaining))
-                    part = "".join(random.choice(string.ascii_lowercase) for _ in range(part_len))
-                    part = part.capitalize()
-                    parts.append(part)
-                    remaining -= part_len
-                username = "".join(parts)
-            
-            username = prefix + username + suffix
+        def clean(username):
             username = ''.join(c for c in username if c.isalnum() or c == '_')
-            
-            if 3 <= len(username) <= 20:
-                generated.append(username)
+            return username if 3 <= len(username) <= 20 else None
+        sampler = NameSampler("roblox", pattern, length, prefix, suffix, shared_cache())
+        generated = sampler.take(count, clean)
 
-        existing = self.input_text.toPlainText().strip()
-        all_users = ("\n".join(generated) if not existing else existing + "\n" + "\n".join(generated))
-        self.input_text.setText(all_users)
+        append_lines(self.input_text, generated)
         
         self.status_label.setText(f"✅ Generated {len(generated)} usernames")
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #c8e6c9; border-radius: 3px;")
@@ -654,6 +313,24 @@ class App(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"❌ Failed to send test message:\n{str(e)}")
 
+    def sweep_clicked(self):
+        """Check every name the pattern can make instead of a generated batch."""
+        if self.thread is not None and self.thread.isRunning():
+            return
+        try:
+            length = int(self.length_input.text())
+        except:
+            length = 5
+        prefix = self.prefix_input.text().strip()
+        suffix = self.suffix_input.text().strip()
+        pattern = self.pattern_combo.currentText()
+        self.sweep = Sweep("roblox", pattern, length, prefix, suffix, shared_cache(),
+                           shuffled=self.shuffle_checkbox.isChecked(), clean=RobloxChecker.clean_username)
+        try:
+            self.start_clicked()   # takes the sweep through get_usernames()
+        finally:
+            self.sweep = None
+
     def start_clicked(self):
         usernames = self.get_usernames()
         if not usernames:
@@ -663,19 +340,22 @@ class App(QMainWindow):
         debug = self.debug_checkbox.isChecked()
         webhook_url = self.webhook_input.text().strip() or None
         auto_signup = self.auto_signup_checkbox.isChecked()
+        batch = self.batch_checkbox.isChecked()
         signup_password = self.signup_password_input.text().strip()
         
         if auto_signup and not DRISSION_AVAILABLE:
             QMessageBox.warning(self, "Library Missing", "DrissionPage is not installed!\nInstall it with: pip install DrissionPage")
             return
         
-        self.progress_bar.setMaximum(len(usernames))
+        self.progress_bar.setMaximum(progress_max(usernames))
         self.progress_bar.setValue(0)
         self.output_text.clear()
         self.start_button.setEnabled(False)
         self.stop_button.setEnabled(True)
         
-        status_text = f"🔄 Checking {len(usernames)} usernames"
+        status_text = f"🔄 Checking {describe(usernames)}"
+        if batch:
+            status_text += " (batched)"
         if auto_signup:
             status_text += " (auto sign-up enabled)"
         if webhook_url:
@@ -685,8 +365,10 @@ class App(QMainWindow):
         self.status_label.setText(status_text)
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #fff9c4; border-radius: 3px;")
 
-        self.thread = Checker(usernames, webhook_url, debug, auto_signup, signup_password)
+        self.source = usernames
+        self.thread = Checker(usernames, webhook_url, debug, auto_signup, signup_password, batch)
         self.thread.update.connect(self.update_text)
+        self.thread.results.connect(self.output_text.add_results)
         self.thread.pupdate.connect(self.update_progress)
         self.thread.finished.connect(self.checking_finished)
         self.thread.start()
@@ -708,7 +390,7 @@ class App(QMainWindow):
                 f"🎉 Successfully created {len(self.thread.created_accounts)} accounts!\n\n"
                 f"Credentials saved to:\n"
                 f"• auto_created_accounts.txt\n"
-                f"• auto_created_cookies.json")
+                f"• auto_created_cookies.jsonl")
         else:
             self.status_label.setText("✅ Checking complete!")
         
@@ -716,22 +398,46 @@ class App(QMainWindow):
 
     def update_text(self, text):
         self.output_text.append(text)
-        cursor = self.output_text.textCursor()
-        cursor.movePosition(cursor.End)
-        self.output_text.setTextCursor(cursor)
 
     def update_progress(self, value):
+        if isinstance(self.source, Wordlist):   # count unknown, so go by how far into the file we are
+            step = self.source.progress()
+            self.progress_bar.setValue(step)
+            self.status_label.setText(f"🔄 Progress: {value} checked, {step * 100 // Wordlist.STEPS}% of {self.source.name}")
+            return
         self.progress_bar.setValue(value)
         total = self.progress_bar.maximum()
         percent = int((value / total) * 100) if total > 0 else 0
         self.status_label.setText(f"🔄 Progress: {value}/{total} ({percent}%)")
 
+    def toggle_wordlist(self):
+        if self.wordlist is not None:
+            self.wordlist = None
+            self.stream_button.setText("📂 Stream from file")
+            self.stream_label.clear()
+            self.input_text.setEnabled(True)
+            return
+        path, _ = QFileDialog.getOpenFileName(self, "Stream Usernames", "", "Text Files (*.txt);;All Files (*)")
+        if path:
+            self.stream_file(path)
+
+    def stream_file(self, path):
+        """Check the names in `path` straight from the file; the input box is ignored until the file is closed."""
+        self.wordlist = Wordlist(path, RobloxChecker.clean_username)
+        self.stream_button.setText("✖ Close file")
+        self.stream_label.setText(f"Reading usernames from {self.wordlist}")
+        self.input_text.setEnabled(False)
+
     def get_usernames(self):
+        if self.sweep is not None:
+            return self.sweep   # names are produced as the checker asks for them
+        if self.wordlist is not None:
+            return self.wordlist
         txt = self.input_text.toPlainText().strip()
         usernames = []
         for line in txt.splitlines():
-            u = line.strip()
-            if u and (u.replace('_', '').isalnum()):
+            u = RobloxChecker.clean_username(line)
+            if u:
                 usernames.append(u)
         return usernames
     
@@ -1,157 +1,17 @@
-import sys, requests, random, string, traceback, json
+import os, sys, requests
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import QFont
+from checker_core.keyspace import NameSampler, Sweep
+from checker_core.qt import QtChecker, append_lines, describe, progress_max, shared_cache
+from checker_core.logview import LogView
+from checker_core.wordlist import Wordlist
+from checker_core.platforms.steam import SteamChecker
 
 # ------------------- Checker Thread ------------------- #
-class SteamChecker(QThread):
-    update = pyqtSignal(str)
-    pupdate = pyqtSignal(int)
-    count = 0
-
-    def __init__(self, steam_ids, webhook_url=None, debug=False):
-        super().__init__()
-        self.steam_ids = steam_ids
-        self.webhook_url = webhook_url
-        self.running = True
-        self.debug = debug
-
-    def run(self):
-        for i, steam_id in enumerate(self.steam_ids):
-            if not self.running:
-                break
-            self.check_steam_id(steam_id)
-            self.count += 1
-            self.pupdate.emit(self.count)
-            QThread.msleep(200)
-
-    def stop(self):
-        self.running = False
-
-    def check_steam_id(self, steam_id):
-        if not self.running:
-            return
-
-        try:
-            steam_id = steam_id.strip()
-            
-            if self.debug:
-                self.update.emit(f"\n{'='*60}")
-                self.update.emit(f"[DEBUG] Checking: {steam_id}")
-            
-            # Handle both custom IDs and SteamID64
-            if steam_id.isdigit() and len(steam_id) == 17:
-                profile_url = f"https://steamcommunity.com/profiles/{steam_id}/?xml=1"
-            else:
-                profile_url = f"https://steamcommunity.com/id/{steam_id}/?xml=1"
-            
-            if self.debug:
-                self.update.emit(f"[DEBUG] XML URL: {profile_url}")
-            
-            try:
-                response = requests.get(profile_url, timeout=10)
-                
-                if self.debug:
-                    self.update.emit(f"[DEBUG] Status Code: {response.status_code}")
-                
-                if response.status_code == 200:
-                    xml_text = response.text
-                    
-                    if "<e>" in xml_text.lower() or "the specified profile could not be found" in xml_text.lower():
-                        self.update.emit(f"[AVAILABLE] {steam_id}")
-                        
-                        # Send to webhook when ID is available
-                        if self.webhook_url:
-                            self.send_to_discord(steam_id)
-                        return
-                    
-                    # Profile exists - extract minimal information
-                    persona_name = self.extract_xml_tag(xml_text, "steamID")
-                    is_online = self.extract_xml_tag(xml_text, "onlineState")
-                    
-                    # Simple one-line output
-                    result = f"[TAKEN] {steam_id} | Name: {persona_name} | Status: {is_online}"
-                    self.update.emit(result)
-                    
-                    return
-                
-                elif response.status_code == 429:
-                    self.update.emit(f"[RATE LIMIT] {steam_id}")
-                    QThread.sleep(2)
-                    
-                elif response.status_code == 403:
-                    self.update.emit(f"[PRIVATE] {steam_id}")
-                    
-                else:
-                    self.update.emit(f"[ERROR] {steam_id}: HTTP {response.status_code}")
-                    
-            except requests.exceptions.Timeout:
-                self.update.emit(f"[TIMEOUT] {steam_id}")
-                
-        except Exception as e:
-            if self.debug:
-                error_msg = traceback.format_exc()
-                self.update.emit(f"[ERROR] {steam_id}:\n{error_msg}")
-            else:
-                error_msg = str(e)
-                self.update.emit(f"[ERROR] {steam_id}: {error_msg}")
-
-    def extract_xml_tag(self, xml_text, tag_name):
-        try:
-            start_tag = f"<{tag_name}>"
-            end_tag = f"</{tag_name}>"
-            
-            start_idx = xml_text.find(start_tag)
-            if start_idx == -1:
-                start_tag = f"<{tag_name}><![CDATA["
-                end_tag = f"]]></{tag_name}>"
-                start_idx = xml_text.find(start_tag)
-            
-            if start_idx != -1:
-                end_idx = xml_text.find(end_tag, start_idx)
-                if end_idx != -1:
-                    content = xml_text[start_idx + len(start_tag):end_idx]
-                    return content.strip()
-            return None
-        except:
-            return None
-
-    def send_to_discord(self, steam_id):
-        try:
-            embed_data = {
-                "title": "Available Steam ID Found!",
-                "color": 65280,
-                "fields": [
-                    {
-                        "name": "Available ID",
-                        "value": f"`{steam_id}`",
-                        "inline": True
-                    },
-                    {
-                        "name": "Direct Link",
-                        "value": f"https://steamcommunity.com/id/{steam_id}",
-                        "inline": False
-                    }
-                ],
-                "footer": {
-                    "text": "Steam ID Checker"
-                }
-            }
-            
-            webhook_data = {"embeds": [embed_data]}
-            
-            response = requests.post(self.webhook_url, json=webhook_data, timeout=5)
-            
-            if response.status_code == 204:
-                if self.debug:
-                    self.update.emit(f"[DEBUG] Sent {steam_id} to Discord webhook")
-            else:
-                if self.debug:
-                    self.update.emit(f"[DEBUG] Webhook failed: Status {response.status_code}")
-                    
-        except Exception as e:
-            if self.debug:
-                self.update.emit(f"[DEBUG] Webhook error: {str(e)}")
+class Checker(QtChecker):
+    def __init__(self, *args, **kwargs):
+        super().__init__(SteamChecker(*args, **kwargs))
 
 # ------------------- GUI App ------------------- #
 class SteamCheckerApp(QMainWindow):
@@ -160,6 +20,9 @@ class SteamCheckerApp(QMainWindow):
         self.setWindowTitle("Steam ID Checker")
         self.setGeometry(150, 150, 1100, 800)
         self.thread = None
+        self.sweep = None
+        self.wordlist = None
+        self.source = None   # what the current run reads its names from
         self.initUI()
 
     def initUI(self):
@@ -184,7 +47,8 @@ class SteamCheckerApp(QMainWindow):
         
         instruction = QLabel(
             "Check Steam profiles using custom IDs (like 'skiesfr') or SteamID64 numbers.\n"
-            "No API key required. Private profiles will show limited information."
+            "No API key required. Private profiles will show limited information.\n"
+            "With a Steam Web API key, SteamID64s are checked 100 per request and custom IDs through ResolveVanityURL."
         )
         instruction.setWordWrap(True)
         instruction.setStyleSheet("background-color: #e7f3ff; padding: 10px; border-radius: 3px; color: #004085;")
@@ -212,6 +76,17 @@ class SteamCheckerApp(QMainWindow):
         webhook_group.setLayout(webhook_layout)
         main_layout.addWidget(webhook_group)
 
+        # Web API Section
+        api_group = QGroupBox("Steam Web API Key (Optional)")
+        api_group.setStyleSheet("QGroupBox { font-weight: bold; }")
+        api_layout = QHBoxLayout()
+        self.api_key_input = QLineEdit()
+        self.api_key_input.setPlaceholderText("Key from steamcommunity.com/dev/apikey")
+        self.api_key_input.setEchoMode(QLineEdit.Password)
+        api_layout.addWidget(self.api_key_input)
+        api_group.setLayout(api_layout)
+        main_layout.addWidget(api_group)
+
         # Generator Section
         gen_group = QGroupBox("Step 1: Generate Random Custom IDs (Optional)")
         gen_group.setStyleSheet("QGroupBox { font-weight: bold; }")
@@ -259,6 +134,14 @@ class SteamCheckerApp(QMainWindow):
         gen_btn.clicked.connect(self.generate_ids)
         gen_btn.setStyleSheet("background-color: #17a2b8; color: white; font-weight: bold; padding: 8px;")
         row2.addWidget(gen_btn)
+        self.sweep_button = QPushButton("🧭 Sweep")
+        self.sweep_button.setToolTip("Check every name this pattern can make, resuming where the last sweep stopped")
+        self.sweep_button.clicked.connect(self.sweep_clicked)
+        self.sweep_button.setStyleSheet("background-color: #17a2b8; color: white; font-weight: bold; padding: 8px;")
+        row2.addWidget(self.sweep_button)
+        self.shuffle_checkbox = QCheckBox("Shuffled")
+        self.shuffle_checkbox.setToolTip("Sweep in a random order instead of a to z")
+        row2.addWidget(self.shuffle_checkbox)
         row2.addStretch()
         gen_layout.addLayout(row2)
         
@@ -274,6 +157,15 @@ class SteamCheckerApp(QMainWindow):
         self.input_text.setPlaceholderText("skiesfr\ngaben\nrobinwalker\n76561197960265728\n...")
         self.input_text.setMaximumHeight(150)
         input_layout.addWidget(self.input_text)
+        stream_row = QHBoxLayout()
+        self.stream_button = QPushButton("📂 Stream from file")
+        self.stream_button.setToolTip("Check a big list straight from a text file instead of pasting it here")
+        self.stream_button.clicked.connect(self.toggle_wordlist)
+        stream_row.addWidget(self.stream_button)
+        self.stream_label = QLabel()
+        stream_row.addWidget(self.stream_label)
+        stream_row.addStretch()
+        input_layout.addLayout(stream_row)
         
         input_buttons = QHBoxLayout()
         
@@ -298,10 +190,12 @@ class SteamCheckerApp(QMainWindow):
         output_group.setStyleSheet("QGroupBox { font-weight: bold; }")
         output_layout = QVBoxLayout()
         
-        self.output_text = QTextEdit()
-        self.output_text.setReadOnly(True)
+        self.output_text = LogView()
         self.output_text.setStyleSheet("font-family: 'Courier New'; background-color: #000000; color: #00ff00;")
         output_layout.addWidget(self.output_text)
+        self.hits_only_checkbox = QCheckBox("Only show AVAILABLE")
+        self.hits_only_checkbox.toggled.connect(self.output_text.set_only_hits)
+        output_layout.addWidget(self.hits_only_checkbox)
         
         output_group.setLayout(output_layout)
         main_layout.addWidget(output_group)
@@ -354,54 +248,12 @@ class SteamCheckerApp(QMainWindow):
         except:
             count = 20
 
-        generated = []
-        
-        for _ in range(count):
-            username = ""
-            
-            if pattern == "Letters only (abc)":
-                username = "".join(random.choice(string.ascii_lowercase) for _ in range(length))
-            
-            elif pattern == "Letters + Numbers (a1b2)":
-                chars = string.ascii_lowercase + string.digits
-                username = "".join(random.choice(chars) for _ in range(length))
-            
-            elif pattern == "Numbers + Letters (12ab)":
-                num_count = random.randint(1, max(1, length - 2))
-                letter_count = length - num_count
-                username = "".join(random.choice(string.digits) for _ in range(num_count))
-                username += "".join(random.choice(string.ascii_lowercase) for _ in range(letter_count))
-            
-            elif pattern == "Numbers only (1234)":
-                username = "".join(random.choice(string.digits) for _ in range(length))
-            
-            elif pattern == "Letters_Letters (abc_def)":
-                part1_len = length // 2
-                part2_len = length - part1_len
-                part1 = "".join(random.choice(string.ascii_lowercase) for _ in range(part1_len))
-                part2 = "".join(random.choice(string.ascii_lowercase) for _ in range(part2_len))
-                username = f"{part1}_{part2}"
-            
-            elif pattern == "CamelCase (AbcDef)":
-                parts = []
-                remaining = length
-                while remaining > 0:
-                    part_len = random.randint(2, min(4, remaining))
-                    part = "".join(random.choice(string.ascii_lowercase) for _ in range(part_len))
-                    part = part.capitalize()
-                    parts.append(part)
-                    remaining -= part_len
-                username = "".join(parts)
-            
-            username = prefix + username + suffix
-            username = ''.join(c for c in username if c.isalnum() or c == '_')
-            
-            if username:
-                generated.append(username)
+        def clean(username):
+            return ''.join(c for c in username if c.isalnum() or c == '_')
+        sampler = NameSampler("steam", pattern, length, prefix, suffix, shared_cache())
+        generated = sampler.take(count, clean)
 
-        existing = self.input_text.toPlainText().strip()
-        all_users = ("\n".join(generated) if not existing else existing + "\n" + "\n".join(generated))
-        self.input_text.setText(all_users)
+        append_lines(self.input_text, generated)
         
         self.status_label.setText(f"Generated {len(generated)} IDs")
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #c8e6c9; border-radius: 3px;")
@@ -409,6 +261,9 @@ class SteamCheckerApp(QMainWindow):
     def load_from_file(self):
         filename, _ = QFileDialog.getOpenFileName(self, "Load Steam IDs", "", "Text Files (*.txt);;All Files (*)")
         if filename:
+            if os.path.getsize(filename) > Wordlist.BOX_LIMIT:
+                self.stream_file(filename)
+                return
             try:
                 with open(filename, 'r') as f:
                     content = f.read()
@@ -463,6 +318,24 @@ class SteamCheckerApp(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to send test message:\n{str(e)}")
 
+    def sweep_clicked(self):
+        """Check every name the pattern can make instead of a generated batch."""
+        if self.thread is not None and self.thread.isRunning():
+            return
+        try:
+            length = int(self.length_input.text())
+        except:
+            length = 6
+        prefix = self.prefix_input.text().strip()
+        suffix = self.suffix_input.text().strip()
+        pattern = self.pattern_combo.currentText()
+        self.sweep = Sweep("steam", pattern, length, prefix, suffix, shared_cache(),
+                           shuffled=self.shuffle_checkbox.isChecked())
+        try:
+            self.start_clicked()   # takes the sweep through get_steam_ids()
+        finally:
+            self.sweep = None
+
     def start_clicked(self):
         steam_ids = self.get_steam_ids()
         if not steam_ids:
@@ -471,18 +344,21 @@ class SteamCheckerApp(QMainWindow):
         
         debug = self.debug_checkbox.isChecked()
         webhook_url = self.webhook_input.text().strip() or None
+        api_key = self.api_key_input.text().strip() or None
         
-        self.progress_bar.setMaximum(len(steam_ids))
+        self.progress_bar.setMaximum(progress_max(steam_ids))
         self.progress_bar.setValue(0)
         self.output_text.clear()
         self.start_button.setEnabled(False)
         self.stop_button.setEnabled(True)
         
-        self.status_label.setText(f"Checking {len(steam_ids)} Steam IDs...")
+        self.status_label.setText(f"Checking {describe(steam_ids, 'Steam IDs')}{' via the Web API' if api_key else ''}...")
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #fff9c4; border-radius: 3px;")
 
-        self.thread = SteamChecker(steam_ids, webhook_url, debug)
+        self.source = steam_ids
+        self.thread = Checker(steam_ids, webhook_url, debug, api_key)
         self.thread.update.connect(self.update_text)
+        self.thread.results.connect(self.output_text.add_results)
         self.thread.pupdate.connect(self.update_progress)
         self.thread.finished.connect(self.checking_finished)
         self.thread.start()
@@ -502,17 +378,41 @@ class SteamCheckerApp(QMainWindow):
 
     def update_text(self, text):
         self.output_text.append(text)
-        cursor = self.output_text.textCursor()
-        cursor.movePosition(cursor.End)
-        self.output_text.setTextCursor(cursor)
 
     def update_progress(self, value):
+        if isinstance(self.source, Wordlist):   # count unknown, so go by how far into the file we are
+            step = self.source.progress()
+            self.progress_bar.setValue(step)
+            self.status_label.setText(f"Progress: {value} checked, {step * 100 // Wordlist.STEPS}% of {self.source.name}")
+            return
         self.progress_bar.setValue(value)
         total = self.progress_bar.maximum()
         percent = int((value / total) * 100) if total > 0 else 0
         self.status_label.setText(f"Progress: {value}/{total} ({percent}%)")
 
+    def toggle_wordlist(self):
+        if self.wordlist is not None:
+            self.wordlist = None
+            self.stream_button.setText("📂 Stream from file")
+            self.stream_label.clear()
+            self.input_text.setEnabled(True)
+            return
+        path, _ = QFileDialog.getOpenFileName(self, "Stream Steam IDs", "", "Text Files (*.txt);;All Files (*)")
+        if path:
+            self.stream_file(path)
+
+    def stream_file(self, path):
+        """Check the names in `path` straight from the file; the input box is ignored until the file is closed."""
+        self.wordlist = Wordlist(path)
+        self.stream_button.setText("✖ Close file")
+        self.stream_label.setText(f"Reading Steam IDs from {self.wordlist}")
+        self.input_text.setEnabled(False)
+
     def get_steam_ids(self):
+        if self.sweep is not None:
+            return self.sweep   # names are produced as the checker asks for them
+        if self.wordlist is not None:
+            return self.wordlist
         txt = self.input_text.toPlainText().strip()
         steam_ids = []
         for line in txt.splitlines():